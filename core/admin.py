@@ -48,6 +48,10 @@ class AccountAdmin(admin.ModelAdmin):
         ("Audit", {"fields": ("is_invalid", "created_at", "updated_at")}),
     )
 
+    def get_queryset(self, request):
+        """Show soft-deleted rows too, so they can be inspected and restored."""
+        return Account.objects.with_deleted()
+
 
 @admin.register(Contact)
 class ContactAdmin(admin.ModelAdmin):
@@ -98,3 +102,7 @@ class ContactAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+    def get_queryset(self, request):
+        """Show soft-deleted rows too, so they can be inspected and restored."""
+        return Contact.objects.with_deleted().with_account()
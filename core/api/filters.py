@@ -0,0 +1,32 @@
+"""Shared filter backends for the API."""
+
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+from core.search import search_index
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    ``?search=`` backed by the full-text index instead of ``icontains`` scans.
+
+    Terms are prefix-matched against the index and every term must match.
+    The index is joined into the list queryset, so ownership scoping and
+    other filters apply before ranking and nothing is truncated. Results
+    are ordered by relevance unless the client passes ``?ordering=``, so
+    this backend must be listed after ``OrderingFilter``. Falls back to
+    ``SearchFilter`` behaviour over ``search_fields`` when the database has
+    no index for the model.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        matched = search_index.filter(queryset, search_terms)
+        if matched is None:
+            return super().filter_queryset(request, queryset, view)
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return matched
+        return matched.order_by("search_rank", "pk")
@@ -0,0 +1,176 @@
+"""
+Streaming contact import.
+
+Uploaded CSV or NDJSON files are read row by row and processed in chunks:
+each chunk is validated field by field, then resolves its accounts and
+checks ``unique_contact_email_per_account`` with one query each before
+being inserted with ``bulk_create``. Only the current chunk and a bounded
+list of row errors are kept in memory.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from django.conf import settings
+from rest_framework import serializers
+
+from core.models import Account, Contact
+from core.services.domain.contact_service import ContactService
+
+from .serializers import ContactImportSerializer
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser as User
+
+IMPORT_FORMAT_CSV = "csv"
+IMPORT_FORMAT_NDJSON = "ndjson"
+IMPORT_FORMATS = (IMPORT_FORMAT_CSV, IMPORT_FORMAT_NDJSON)
+
+# Row number plus either the parsed row or a parse error message
+ImportRow = tuple[int, Any]
+
+
+class RowParseError(str):
+    """Error message for a line that could not be parsed into a row."""
+
+
+def read_csv(stream) -> Iterator[ImportRow]:
+    """Yield ``(row_number, row)`` from a binary CSV stream with a header line."""
+    reader = csv.DictReader(codecs.iterdecode(stream, "utf-8-sig"))
+    for row_number, row in enumerate(reader, start=1):
+        if None in row:
+            yield row_number, RowParseError("Row has more values than the header.")
+            continue
+        # Empty cells mean "not provided" rather than an empty string
+        yield row_number, {key: value for key, value in row.items() if value != ""}
+
+
+def read_ndjson(stream) -> Iterator[ImportRow]:
+    """Yield ``(row_number, row)`` from a binary stream of JSON objects, one per line."""
+    row_number = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield row_number, RowParseError("Invalid JSON.")
+            continue
+        if not isinstance(row, dict):
+            yield row_number, RowParseError("Expected a JSON object.")
+            continue
+        yield row_number, row
+
+
+READERS = {
+    IMPORT_FORMAT_CSV: read_csv,
+    IMPORT_FORMAT_NDJSON: read_ndjson,
+}
+
+
+class ContactImporter:
+    """
+    Validate and insert streamed contact rows chunk by chunk.
+
+    Valid rows are created even when other rows fail; each chunk commits in
+    its own transaction. At most ``settings.IMPORT_MAX_ERRORS`` row errors
+    are reported, with ``error_count`` giving the total.
+    """
+
+    def __init__(self, user: User, chunk_size: Optional[int] = None):
+        self.user = user
+        self.chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        self.serializer = ContactImportSerializer()
+        self.created = 0
+        self.error_count = 0
+        self.errors: list[dict[str, Any]] = []
+
+    def run(self, rows: Iterable[ImportRow]) -> dict[str, Any]:
+        """Import all rows and return the summary."""
+        rows = iter(rows)
+        while chunk := list(islice(rows, self.chunk_size)):
+            self._import_chunk(chunk)
+        return {
+            "created": self.created,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
+
+    def _import_chunk(self, chunk: list[ImportRow]):
+        validated = []
+        for row_number, row in chunk:
+            if isinstance(row, RowParseError):
+                self._add_error(row_number, {"non_field_errors": [str(row)]})
+                continue
+            try:
+                validated.append((row_number, self.serializer.run_validation(row)))
+            except serializers.ValidationError as exc:
+                self._add_error(row_number, exc.detail)
+
+        validated = self._resolve_accounts(validated)
+        validated = self._check_unique_emails(validated)
+        if validated:
+            contacts = ContactService.bulk_create_contacts(
+                [data for _, data in validated], self.user
+            )
+            self.created += len(contacts)
+
+    def _resolve_accounts(self, validated):
+        """Drop rows whose account does not exist, with one query for the chunk."""
+        account_ids = {data["account"] for _, data in validated}
+        existing = set(
+            Account.objects.filter(pk__in=account_ids).values_list("pk", flat=True)
+        )
+        resolved = []
+        for row_number, data in validated:
+            account_id = data.pop("account")
+            if account_id not in existing:
+                self._add_error(
+                    row_number,
+                    {"account": [f'Invalid pk "{account_id}" - object does not exist.']},
+                )
+                continue
+            data["account_id"] = account_id
+            resolved.append((row_number, data))
+        return resolved
+
+    def _check_unique_emails(self, validated):
+        """Drop rows clashing on (account, email), with one query for the chunk."""
+        pairs = {
+            (data["account_id"], data["email"])
+            for _, data in validated
+            if data.get("email")
+        }
+        taken = set()
+        if pairs:
+            taken = set(
+                Contact.objects.with_deleted().filter(
+                    account_id__in={account_id for account_id, _ in pairs},
+                    email__in={email for _, email in pairs},
+                ).values_list("account_id", "email")
+            )
+
+        unique = []
+        for row_number, data in validated:
+            if data.get("email"):
+                pair = (data["account_id"], data["email"])
+                if pair in taken:
+                    self._add_error(
+                        row_number,
+                        {"email": ["A contact with this email already exists for this account."]},
+                    )
+                    continue
+                taken.add(pair)
+            unique.append((row_number, data))
+        return unique
+
+    def _add_error(self, row_number: int, detail):
+        self.error_count += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row_number, "errors": detail})
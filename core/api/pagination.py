@@ -0,0 +1,367 @@
+"""Shared pagination classes for the API."""
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import hashlib
+import json
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_ESTIMATED = "estimated"
+COUNT_NONE = "none"
+COUNT_STRATEGIES = (COUNT_EXACT, COUNT_CACHED, COUNT_ESTIMATED, COUNT_NONE)
+
+
+class CountStrategyPagination(PageNumberPagination):
+    """
+    Page-number pagination with a configurable total-count strategy.
+
+    The strategy is read from the view's ``count_strategy`` attribute and
+    falls back to the class default:
+
+    - ``exact``: ``COUNT(*)`` over the filtered queryset (DRF behaviour).
+    - ``cached``: exact count cached for ``count_cache_timeout`` seconds,
+      keyed by the SQL and parameters of the filtered queryset.
+    - ``estimated``: planner row estimate from ``EXPLAIN`` on PostgreSQL;
+      small estimates and other backends fall back to an exact count.
+    - ``none``: no count at all, only a ``has_next`` flag.
+
+    Non-exact strategies fetch ``page_size + 1`` rows to decide whether a
+    next page exists, so links stay correct even if the count is stale.
+    Every response carries ``count_strategy`` naming the strategy that
+    actually produced the number.
+    """
+
+    count_strategy = COUNT_EXACT
+    count_cache_alias = "default"
+    count_cache_timeout = 60
+    estimate_exact_threshold = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_strategy_used = self.get_count_strategy(view)
+        self.window = None
+        if self.count_strategy_used == COUNT_EXACT:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        number = self._get_window_number(request)
+        offset = (number - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        if number > 1 and not rows:
+            raise NotFound(self.invalid_page_message)
+
+        self.window = (number, len(rows) > page_size)
+        self.total_count = self.get_count(queryset, view)
+        return rows[:page_size]
+
+    def get_count_strategy(self, view):
+        """Return the count strategy configured for the view."""
+        strategy = getattr(view, "count_strategy", None) or self.count_strategy
+        if strategy not in COUNT_STRATEGIES:
+            raise ValueError(f"Unknown count strategy: {strategy!r}")
+        return strategy
+
+    def get_count(self, queryset, view):
+        """Return the total for non-exact strategies (None for ``none``)."""
+        if self.count_strategy_used == COUNT_NONE:
+            return None
+        if self.count_strategy_used == COUNT_CACHED:
+            return self._cached_count(queryset, view)
+
+        estimate = _estimate_count(queryset)
+        if estimate is None or estimate < self.estimate_exact_threshold:
+            self.count_strategy_used = COUNT_EXACT
+            return queryset.count()
+        return estimate
+
+    def get_paginated_response(self, data):
+        if self.window is None:
+            count = self.page.paginator.count
+        else:
+            count = self.total_count
+
+        payload = OrderedDict()
+        if self.count_strategy_used == COUNT_NONE:
+            payload["has_next"] = self.window[1]
+        else:
+            payload["count"] = count
+        payload["count_strategy"] = self.count_strategy_used
+        payload["next"] = self.get_next_link()
+        payload["previous"] = self.get_previous_link()
+        payload["results"] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["required"] = ["count_strategy", "results"]
+        response_schema["properties"].update(
+            {
+                "count_strategy": {"type": "string", "enum": list(COUNT_STRATEGIES)},
+                "has_next": {"type": "boolean"},
+            }
+        )
+        return response_schema
+
+    def get_next_link(self):
+        if self.window is None:
+            return super().get_next_link()
+        number, has_next = self.window
+        if not has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, number + 1)
+
+    def get_previous_link(self):
+        if self.window is None:
+            return super().get_previous_link()
+        number = self.window[0]
+        if number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, number - 1)
+
+    def _get_window_number(self, request):
+        try:
+            return _positive_int(
+                request.query_params.get(self.page_query_param) or 1, strict=True
+            )
+        except ValueError as exc:
+            raise NotFound(self.invalid_page_message) from exc
+
+    def _cached_count(self, queryset, view):
+        alias = getattr(view, "count_cache_alias", self.count_cache_alias)
+        timeout = getattr(view, "count_cache_timeout", self.count_cache_timeout)
+        cache = caches[alias]
+
+        sql, params = queryset.query.sql_with_params()
+        signature = hashlib.sha256(
+            repr((queryset.db, sql, params)).encode("utf-8")
+        ).hexdigest()
+        key = f"mycrm:count:{queryset.model._meta.label_lower}:{signature}"
+
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, timeout)
+        return count
+
+
+def _estimate_count(queryset):
+    """Return the planner row estimate for a queryset, or None if unsupported."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a fixed, unique ordering.
+
+    The cursor stores the ordering values of the boundary row, so every page
+    is fetched with an indexed ``WHERE (created_at, id) < (...)`` predicate
+    instead of ``OFFSET``, and no ``COUNT(*)`` is issued. Page N costs the
+    same as page 1. All ordering fields must share the same direction and the
+    last one must be unique (the primary key tiebreak).
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.descending = self.ordering[0].startswith("-")
+        self.fields = [name.lstrip("-") for name in self.ordering]
+
+        position, reverse = self.decode_cursor(request, queryset.model)
+        descending = self.descending != reverse
+
+        if position is not None:
+            queryset = queryset.filter(self._seek_filter(position, descending))
+
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(*(prefix + name for name in self.fields))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        if reverse:
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        return self.page
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        parameters = [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            }
+        ]
+        if self.page_size_query_param:
+            parameters.append(
+                {
+                    "name": self.page_size_query_param,
+                    "required": False,
+                    "in": "query",
+                    "description": "Number of results to return per page.",
+                    "schema": {"type": "integer"},
+                }
+            )
+        return parameters
+
+    # ===== Cursor Encoding =====
+
+    def decode_cursor(self, request, model):
+        """Return ``(position, reverse)`` from the request cursor."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            values = payload["p"]
+            reverse = bool(payload.get("r", False))
+            if len(values) != len(self.fields):
+                raise ValueError("Cursor does not match ordering")
+            position = [
+                model._meta.get_field(name).to_python(value)
+                for name, value in zip(self.fields, values)
+            ]
+        except (
+            binascii.Error,
+            KeyError,
+            TypeError,
+            UnicodeError,
+            ValueError,
+            ValidationError,
+        ) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        """Return an opaque, URL-safe cursor string for the given position."""
+        payload = {"p": [self._cursor_value(value) for value in position]}
+        if reverse:
+            payload["r"] = 1
+        data = json.dumps(payload, separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode("ascii")).decode("ascii")
+
+    # ===== Helpers =====
+
+    def _link(self, row, reverse):
+        if isinstance(row, dict):
+            position = [row[name] for name in self.fields]
+        else:
+            position = [getattr(row, "pk" if name == "id" else name) for name in self.fields]
+        cursor = self.encode_cursor(position, reverse)
+        url = remove_query_param(self.base_url, "page")
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    @staticmethod
+    def _cursor_value(value):
+        """Encode a position value losslessly (microseconds included)."""
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        if isinstance(value, (int, float, bool)) or value is None:
+            return value
+        return str(value)
+
+    def _seek_filter(self, position, descending):
+        """Build ``(f1, f2, ...) < (v1, v2, ...)`` as an OR of prefix matches."""
+        lookup = "lt" if descending else "gt"
+        condition = Q()
+        for index, name in enumerate(self.fields):
+            clause = Q(**{f"{name}__{lookup}": position[index]})
+            for prior_name, prior_value in zip(self.fields[:index], position[:index]):
+                clause &= Q(**{prior_name: prior_value})
+            condition |= clause
+        return condition
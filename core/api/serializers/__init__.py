@@ -1,7 +1,25 @@
 from .account import AccountSerializer
-from .contact import ContactSerializer
+from .bulk import (
+    BulkCreateResultSerializer,
+    BulkUpdateResultSerializer,
+    BulkUpdateSerializer,
+    ImportResultSerializer,
+    ImportUploadSerializer,
+)
+from .contact import ContactImportSerializer, ContactSerializer
+from .typeahead import AccountTypeaheadSerializer, ContactTypeaheadSerializer
+from .values import ValuesRowSerializer
 
 __all__ = [
     "AccountSerializer",
+    "AccountTypeaheadSerializer",
+    "BulkCreateResultSerializer",
+    "BulkUpdateResultSerializer",
+    "BulkUpdateSerializer",
+    "ContactImportSerializer",
     "ContactSerializer",
+    "ContactTypeaheadSerializer",
+    "ImportResultSerializer",
+    "ImportUploadSerializer",
+    "ValuesRowSerializer",
 ]
@@ -1,9 +1,85 @@
+from collections import Counter
+
+from django.conf import settings
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from core.models import Account, Contact
+
+from .mixins import SparseFieldsetSerializerMixin
+
+
+class AccountListSerializer(serializers.ListSerializer):
+    """
+    List serializer for bulk account payloads.
+
+    Rows are validated individually except for ``account_number`` uniqueness,
+    which is checked for the whole batch with one query (plus duplicates
+    within the batch). Errors are returned per row, aligned with the input.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("allow_empty", False)
+        kwargs.setdefault("max_length", settings.BULK_CREATE_MAX_ROWS)
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            rows = super().to_internal_value(data)
+            row_errors = [{} for _ in rows]
+        except serializers.ValidationError as exc:
+            if not isinstance(exc.detail, list):
+                raise
+            rows, row_errors = None, exc.detail
+
+        numbers = [
+            _account_number(row) for row in (data if rows is None else rows)
+        ]
+        duplicates = self._duplicate_account_numbers(numbers)
+        for index, number in enumerate(numbers):
+            if number in duplicates and not row_errors[index]:
+                row_errors[index] = {"account_number": [duplicates[number]]}
 
-from core.models import Account
+        if any(row_errors):
+            raise serializers.ValidationError(row_errors)
+        return rows
 
+    @staticmethod
+    def _duplicate_account_numbers(numbers):
+        """Map each clashing account number to its error message."""
+        present = [number for number in numbers if number is not None]
+        duplicates = {
+            number: "This account number appears more than once in the batch."
+            for number, count in Counter(present).items()
+            if count > 1
+        }
+        if present:
+            existing = Account.objects.with_deleted().filter(
+                account_number__in=set(present)
+            )
+            for number in existing.values_list("account_number", flat=True):
+                duplicates[number] = "An account with this account number already exists."
+        return duplicates
+
+
+def _account_number(row):
+    number = row.get("account_number") if isinstance(row, dict) else None
+    return number if isinstance(number, str) and number else None
+
+
+class AccountPrimaryContactSerializer(serializers.ModelSerializer):
+    """Compact primary contact embedded in account lists (``?include=``)."""
+
+    full_name = serializers.ReadOnlyField()
 
-class AccountSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Contact
+        fields = ["id", "full_name", "email", "phone", "job_title"]
+        read_only_fields = fields
+
+
+class AccountSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Account model.
     
@@ -11,8 +87,12 @@ class AccountSerializer(serializers.ModelSerializer):
     Custom validators below are examples for cross-field or complex logic.
     """
 
+    contact_count = serializers.IntegerField(read_only=True)
+    primary_contact = serializers.SerializerMethodField()
+
     class Meta:
         model = Account
+        list_serializer_class = AccountListSerializer
         fields = [
             "id",
             "name",
@@ -40,15 +120,41 @@ class AccountSerializer(serializers.ModelSerializer):
             "shipping_country",
             "shipping_postal_code",
             "is_invalid",
+            "version",
+            "contact_count",
+            "primary_contact",
         ]
+        # Backed by AccountService.list_accounts(include=...) annotations
+        optional_fields = ["contact_count", "primary_contact"]
         read_only_fields = [
             "id",
             "created_at",
             "updated_at",
             "created_by",
             "updated_by",
+            "version",
         ]
 
+    def get_fields(self):
+        fields = super().get_fields()
+        if isinstance(self.parent, AccountListSerializer) and "account_number" in fields:
+            # Bulk payloads check the whole batch at once in AccountListSerializer
+            field = fields["account_number"]
+            field.validators = [
+                validator
+                for validator in field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        return fields
+
+    @extend_schema_field(AccountPrimaryContactSerializer(allow_null=True))
+    def get_primary_contact(self, obj):
+        """Return the prefetched primary contact, if the account has one."""
+        contacts = getattr(obj, "primary_contacts", None)
+        if not contacts:
+            return None
+        return AccountPrimaryContactSerializer(contacts[0]).data
+
     def validate_annual_revenue(self, value):
         """Ensure revenue is non-negative."""
         if value is not None and value < 0:
@@ -59,8 +165,10 @@ class AccountSerializer(serializers.ModelSerializer):
 
     def validate_account_number(self, value):
         """Ensure account_number is unique (excluding current instance)."""
-        if value:
-            queryset = Account.objects.filter(account_number=value)
+        # Bulk payloads check the whole batch at once in AccountListSerializer
+        if value and not isinstance(self.parent, AccountListSerializer):
+            # Soft-deleted rows still hold the unique constraint
+            queryset = Account.objects.with_deleted().filter(account_number=value)
             if self.instance:
                 queryset = queryset.exclude(pk=self.instance.pk)
             if queryset.exists():
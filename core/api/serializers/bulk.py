@@ -0,0 +1,72 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class BulkCreateResultSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Summary returned by bulk create endpoints instead of the full rows."""
+
+    count = serializers.IntegerField()
+    ids = serializers.ListField(child=serializers.UUIDField())
+
+
+class BulkUpdateSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Body accepted by bulk update endpoints.
+
+    Rows are selected by ``ids`` or by ``filter`` (the list endpoint's
+    filter fields), never both; ``patch`` holds the field values to apply
+    and is validated by the view against the resource serializer.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.BULK_UPDATE_MAX_IDS,
+    )
+    filter = serializers.DictField(required=False, allow_empty=False)
+    patch = serializers.DictField(allow_empty=False)
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError("Provide either ids or filter.")
+        return attrs
+
+
+class BulkUpdateResultSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Summary returned by bulk update endpoints."""
+
+    count = serializers.IntegerField()
+
+
+class ImportUploadSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Multipart upload accepted by streaming import endpoints."""
+
+    file = serializers.FileField()
+    import_format = serializers.ChoiceField(
+        choices=["csv", "ndjson"],
+        required=False,
+        help_text="Defaults to ndjson for .ndjson/.jsonl files and csv otherwise.",
+    )
+
+    def validate(self, attrs):
+        if "import_format" not in attrs:
+            name = attrs["file"].name.lower()
+            ndjson = name.endswith((".ndjson", ".jsonl"))
+            attrs["import_format"] = "ndjson" if ndjson else "csv"
+        return attrs
+
+
+class ImportRowErrorSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Validation errors for one imported row (1-based, header excluded)."""
+
+    row = serializers.IntegerField()
+    errors = serializers.DictField()
+
+
+class ImportResultSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Summary returned by streaming import endpoints."""
+
+    created = serializers.IntegerField()
+    error_count = serializers.IntegerField()
+    errors = ImportRowErrorSerializer(many=True)
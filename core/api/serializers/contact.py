@@ -2,8 +2,10 @@ from rest_framework import serializers
 
 from core.models import Contact
 
+from .mixins import SparseFieldsetSerializerMixin
 
-class ContactSerializer(serializers.ModelSerializer):
+
+class ContactSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Contact model.
 
@@ -37,6 +39,7 @@ class ContactSerializer(serializers.ModelSerializer):
             "created_by",
             "updated_by",
             "is_invalid",
+            "version",
         ]
         read_only_fields = [
             "id",
@@ -45,7 +48,9 @@ class ContactSerializer(serializers.ModelSerializer):
             "updated_at",
             "created_by",
             "updated_by",
+            "version",
         ]
+        projection_sources = {"full_name": ["first_name", "last_name"]}
 
     def validate(self, attrs):
         """Validate email uniqueness per account."""
@@ -53,7 +58,8 @@ class ContactSerializer(serializers.ModelSerializer):
         account = attrs.get("account")
 
         if email and account:
-            queryset = Contact.objects.filter(account=account, email=email)
+            # Soft-deleted rows still hold the unique constraint
+            queryset = Contact.objects.with_deleted().filter(account=account, email=email)
             if self.instance:
                 queryset = queryset.exclude(pk=self.instance.pk)
             if queryset.exists():
@@ -64,3 +70,24 @@ class ContactSerializer(serializers.ModelSerializer):
                 )
 
         return attrs
+
+
+class ContactImportSerializer(ContactSerializer):
+    """
+    Row serializer for contact imports.
+
+    ``account`` is read as a raw id; the account lookup and the
+    email-per-account uniqueness check run once per chunk in
+    ``core.api.imports.ContactImporter`` instead of once per row.
+    """
+
+    account = serializers.UUIDField()
+
+    class Meta(ContactSerializer.Meta):
+        fields = [
+            name for name in ContactSerializer.Meta.fields if name != "owner_user"
+        ]
+        validators = []
+
+    def validate(self, attrs):
+        return attrs
@@ -0,0 +1,49 @@
+class SparseFieldsetSerializerMixin:
+    """
+    Serializer mixin that drops fields not listed in ``context["requested_fields"]``.
+
+    Serializers may declare ``Meta.projection_sources`` mapping computed
+    fields (e.g. ``full_name``) to the model fields they read, so views can
+    project the queryset with ``only()``. Fields listed in
+    ``Meta.optional_fields`` need extra query work and are dropped unless
+    named in ``context["included_fields"]``; sparse trimming leaves them be.
+    """
+
+    def get_fields(self):
+        # Trimmed here rather than in __init__ so fields are only built once
+        # the serializer is bound (list serializers bind their child late)
+        fields = super().get_fields()
+        optional = set(getattr(self.Meta, "optional_fields", ()))
+        included = set(self.context.get("included_fields") or ())
+        for name in optional - included:
+            fields.pop(name, None)
+
+        requested = self.context.get("requested_fields")
+        if requested is not None:
+            for name in set(fields) - set(requested) - optional:
+                fields.pop(name)
+        return fields
+
+    @classmethod
+    def get_model_projection(cls, field_names):
+        """
+        Return the model fields needed to render ``field_names``.
+
+        Returns None when a field reads something that cannot be projected
+        (a property without a ``projection_sources`` entry), meaning "load all".
+        """
+        serializer = cls()
+        opts = serializer.Meta.model._meta
+        model_fields = {field.name for field in opts.concrete_fields}
+        sources = getattr(serializer.Meta, "projection_sources", {})
+
+        projection = []
+        for name in field_names:
+            if name in sources:
+                projection.extend(sources[name])
+                continue
+            source = serializer.fields[name].source.split(".")[0]
+            if source not in model_fields:
+                return None
+            projection.append(source)
+        return list(dict.fromkeys(projection))
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+
+class AccountTypeaheadSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Compact account match returned by the typeahead endpoint."""
+
+    id = serializers.UUIDField(source="pk")
+    name = serializers.CharField(source="label")
+
+
+class ContactTypeaheadSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Compact contact match returned by the typeahead endpoint."""
+
+    id = serializers.UUIDField(source="pk")
+    full_name = serializers.CharField(source="label")
@@ -1,10 +1,19 @@
 """Pagination configuration for Account API."""
-from rest_framework.pagination import PageNumberPagination
+from core.api.pagination import CountStrategyPagination, KeysetPagination
 
 
-class AccountPagination(PageNumberPagination):
+class AccountPagination(CountStrategyPagination):
     """Pagination class for Account list views."""
 
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+
+
+class AccountCursorPagination(KeysetPagination):
+    """Keyset pagination for Account list views (``?cursor=``)."""
+
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -1,5 +1,5 @@
 """API schema examples for Account endpoints."""
-from drf_spectacular.utils import OpenApiExample
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter
 
 
 CREATE_ACCOUNT_EXAMPLES = [
@@ -39,3 +39,43 @@ UPDATE_ACCOUNT_EXAMPLES = [
         description='Update specific fields'
     ),
 ]
+
+BULK_CREATE_ACCOUNT_EXAMPLES = [
+    OpenApiExample(
+        'bulk',
+        value=[
+            {'name': 'Acme Corporation', 'account_number': 'ACC-001'},
+            {'name': 'Globex', 'account_number': 'ACC-002', 'status': 'active'},
+        ],
+        description='Rows use the same fields as a single create',
+        request_only=True,
+    ),
+]
+
+BULK_UPDATE_ACCOUNT_EXAMPLES = [
+    OpenApiExample(
+        'by filter',
+        value={'filter': {'status': 'prospect'}, 'patch': {'status': 'active'}},
+        description='Update every account matching the list filters',
+        request_only=True,
+    ),
+    OpenApiExample(
+        'by ids',
+        value={
+            'ids': ['3fa85f64-5717-4562-b3fc-2c963f66afa6'],
+            'patch': {'industry': 'Manufacturing'},
+        },
+        request_only=True,
+    ),
+]
+
+LIST_ACCOUNT_PARAMETERS = [
+    OpenApiParameter(
+        'include',
+        str,
+        description=(
+            'Comma-separated extras computed in the list query: '
+            'contact_count, primary_contact'
+        ),
+    ),
+]
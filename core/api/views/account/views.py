@@ -1,41 +1,105 @@
+from django.db.models import Count, Max
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 
-from core.api.serializers import AccountSerializer, ContactSerializer
-from core.models import Account
+from core.api.filters import FullTextSearchFilter
+from core.api.pagination import COUNT_EXACT
+from core.api.serializers import (
+    AccountSerializer,
+    AccountTypeaheadSerializer,
+    BulkCreateResultSerializer,
+    BulkUpdateResultSerializer,
+    BulkUpdateSerializer,
+    ContactSerializer,
+)
+from core.models import Account, Contact
 from core.permissions import IsAccountOwnerOrAdmin
 from core.services.domain.account_service import AccountService
-
-from .pagination import AccountPagination
-from .schemas import CREATE_ACCOUNT_EXAMPLES, UPDATE_ACCOUNT_EXAMPLES
+from core.services.domain.contact_service import ContactService
+
+from ..contact.pagination import ContactCursorPagination, ContactPagination
+from ..contact.views import ContactViewSet
+from ..mixins import (
+    IF_MATCH_PARAMETER,
+    BulkUpdateMixin,
+    ConditionalGetMixin,
+    ConditionalUpdateMixin,
+    CursorPaginationMixin,
+    ExportMixin,
+    IncludeMixin,
+    ListCacheMixin,
+    SparseFieldsetMixin,
+    TypeaheadMixin,
+    ValuesListMixin,
+)
+from .pagination import AccountCursorPagination, AccountPagination
+from .schemas import (
+    BULK_CREATE_ACCOUNT_EXAMPLES,
+    BULK_UPDATE_ACCOUNT_EXAMPLES,
+    CREATE_ACCOUNT_EXAMPLES,
+    LIST_ACCOUNT_PARAMETERS,
+    UPDATE_ACCOUNT_EXAMPLES,
+)
 
 
-class AccountViewSet(viewsets.ModelViewSet):  # pylint: disable=too-many-ancestors
+@extend_schema_view(
+    list=extend_schema(parameters=LIST_ACCOUNT_PARAMETERS),
+    update=extend_schema(parameters=[IF_MATCH_PARAMETER]),
+    partial_update=extend_schema(parameters=[IF_MATCH_PARAMETER]),
+    destroy=extend_schema(parameters=[IF_MATCH_PARAMETER]),
+)
+class AccountViewSet(  # pylint: disable=too-many-ancestors
+    ConditionalUpdateMixin,
+    ConditionalGetMixin,
+    ListCacheMixin,
+    ValuesListMixin,
+    CursorPaginationMixin,
+    SparseFieldsetMixin,
+    IncludeMixin,
+    TypeaheadMixin,
+    ExportMixin,
+    BulkUpdateMixin,
+    viewsets.ModelViewSet,
+):
     """API ViewSet for Account model."""
 
     # Endpoints:
     # POST   /accounts      → Create a new account
+    # POST   /accounts/bulk → Create many accounts in one transaction
+    # PATCH  /accounts/bulk → Apply one field patch to accounts by id or filter
     # GET    /accounts      → List accounts (with filtering/pagination/sorting)
+    # GET    /accounts?include=contact_count,primary_contact → ... with contact data
+    # GET    /accounts/export → Stream all matching accounts as CSV or NDJSON
+    # GET    /accounts/typeahead → Prefix-match account names (top-k, ids only)
     # GET    /accounts/{id} → Retrieve a specific account
-    # PUT    /accounts/{id} → Update an account
+    # GET    /accounts/{id}/contacts → List the account's contacts (as /contacts)
+    # PUT    /accounts/{id} → Update an account (If-Match → 412 when stale)
     # DELETE /accounts/{id} → Soft delete an account
 
     queryset = Account.objects.all()
     serializer_class = AccountSerializer
+    typeahead_serializer_class = AccountTypeaheadSerializer
     permission_classes = [IsAccountOwnerOrAdmin]
     pagination_class = AccountPagination
+    cursor_pagination_class = AccountCursorPagination
+    count_strategy = COUNT_EXACT
+    values_list_render = True
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
     filterset_fields = ["status", "type", "company_size", "owner_user"]
     search_fields = ["name", "industry", "account_number"]
     ordering_fields = ["name", "created_at", "updated_at", "annual_revenue"]
     ordering = ["-created_at"]
+    projection_always_fields = ("id", "created_at", "owner_user")
+    sparse_fieldset_actions = (*SparseFieldsetMixin.sparse_fieldset_actions, "contacts")
+    bulk_update_excluded_fields = ("account_number", "is_invalid")
     allowed_actions = [
         "list",
         "retrieve",
@@ -53,23 +117,108 @@ class AccountViewSet(viewsets.ModelViewSet):  # pylint: disable=too-many-ancesto
         AccountService.soft_delete_account(instance, request.user)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-    @action(detail=True, methods=["get"], url_path="contacts")
+    @extend_schema(
+        request=AccountSerializer(many=True),
+        responses={201: BulkCreateResultSerializer},
+        examples=BULK_CREATE_ACCOUNT_EXAMPLES,
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """Create a batch of accounts; all rows are created or none are."""
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        accounts = AccountService.bulk_create_accounts(
+            serializer.validated_data, request.user
+        )
+        result = BulkCreateResultSerializer(
+            {"count": len(accounts), "ids": [account.pk for account in accounts]}
+        )
+        return Response(result.data, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        request=BulkUpdateSerializer,
+        responses={200: BulkUpdateResultSerializer},
+        examples=BULK_UPDATE_ACCOUNT_EXAMPLES,
+    )
+    @bulk.mapping.patch
+    def bulk_update(self, request, *args, **kwargs):
+        """Apply one field patch to the selected accounts the user may change."""
+        return super().bulk_update(request, *args, **kwargs)
+
+    @extend_schema(responses=ContactSerializer(many=True))
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="contacts",
+        queryset=Contact.objects.all(),
+        serializer_class=ContactSerializer,
+        pagination_class=ContactPagination,
+        cursor_pagination_class=ContactCursorPagination,
+        filterset_fields=ContactViewSet.filterset_fields,
+        search_fields=ContactViewSet.search_fields,
+        ordering_fields=ContactViewSet.ordering_fields,
+        list_cache_models=(Contact, Account),
+    )
     def contacts(self, request, pk=None):
-        """List all contacts for this account."""
-        account = self.get_object()
-        contacts = account.contacts.all()
-        serializer = ContactSerializer(contacts, many=True)
-        return Response(serializer.data)
+        """
+        List the account's contacts with the same options as ``/contacts/``.
+
+        The action swaps in the contact serializer, paginators and filter
+        fields, so filtering, search, ordering, ``?fields=`` projection and
+        the list fast paths all apply; soft-deleted contacts are excluded.
+        """
+        AccountService.get_account(pk, fields=["id"], user=request.user)
+        return self.list(request, pk=pk)
 
     # ===== Query Methods =====
 
     def get_queryset(self):
         """Delegate queryset retrieval to service."""
-        return AccountService.list_accounts()
+        if self.action == "contacts":
+            return ContactService.list_account_contacts(
+                self.kwargs["pk"], fields=self.get_projection(), user=self.request.user
+            )
+        return AccountService.list_accounts(
+            fields=self.get_projection(),
+            include=self.get_included(),
+            user=self.request.user,
+        )
 
     def get_object(self):
-        """Delegate object retrieval to service."""
-        return AccountService.get_account(self.kwargs["pk"])
+        """
+        Delegate object retrieval to service and check object permissions.
+
+        Reads only find rows visible to the user (others are 404); writes
+        look the row up unscoped so non-owners get a 403 from the permission.
+        """
+        user = self.request.user if self.request.method in SAFE_METHODS else None
+        account = AccountService.get_account(
+            self.kwargs["pk"], fields=self.get_projection(), user=user
+        )
+        self.check_object_permissions(self.request, account)
+        return account
+
+    def get_list_state(self, queryset):
+        """Include the accounts' contacts in the ETag when they are embedded."""
+        last_modified, parts = super().get_list_state(queryset)
+        if not self.get_included():
+            return last_modified, parts
+
+        state = Contact.objects.filter(account__in=queryset.values("pk")).aggregate(
+            last_modified=Max("updated_at"), count=Count("pk")
+        )
+        if state["last_modified"] and (
+            last_modified is None or state["last_modified"] > last_modified
+        ):
+            last_modified = state["last_modified"]
+        return last_modified, [*parts, state["count"]]
+
+    def get_list_cache_models(self):
+        """Contact writes invalidate account lists that embed contact data."""
+        models = super().get_list_cache_models()
+        if self.get_included() and Contact not in models:
+            models = (*models, Contact)
+        return models
 
     # ===== Persistence Methods =====
 
@@ -83,6 +232,10 @@ class AccountViewSet(viewsets.ModelViewSet):  # pylint: disable=too-many-ancesto
             serializer.instance, serializer.validated_data, self.request.user
         )
 
+    def perform_bulk_update(self, queryset, data):
+        """Delegate the set-based account update to service."""
+        return AccountService.bulk_update_accounts(queryset, data, self.request.user)
+
 
 # Set docstrings for all action methods
 AccountViewSet.list.__doc__ = (
@@ -1,11 +1,20 @@
 """Pagination configuration for Contact API."""
 
-from rest_framework.pagination import PageNumberPagination
+from core.api.pagination import CountStrategyPagination, KeysetPagination
 
 
-class ContactPagination(PageNumberPagination):
+class ContactPagination(CountStrategyPagination):
     """Pagination class for Contact list views."""
 
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class ContactCursorPagination(KeysetPagination):
+    """Keyset pagination for Contact list views (``?cursor=``)."""
+
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -45,3 +45,23 @@ UPDATE_CONTACT_EXAMPLES = [
         description="Update specific fields",
     ),
 ]
+
+BULK_UPDATE_CONTACT_EXAMPLES = [
+    OpenApiExample(
+        "by filter",
+        value={
+            "filter": {"account": "123e4567-e89b-12d3-a456-426614174000"},
+            "patch": {"opt_in_email": False},
+        },
+        description="Update every contact matching the list filters",
+        request_only=True,
+    ),
+    OpenApiExample(
+        "by ids",
+        value={
+            "ids": ["3fa85f64-5717-4562-b3fc-2c963f66afa6"],
+            "patch": {"seniority": "executive"},
+        },
+        request_only=True,
+    ),
+]
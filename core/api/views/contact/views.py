@@ -1,40 +1,95 @@
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import filters, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 
-from core.api.serializers import ContactSerializer
+from core.api.filters import FullTextSearchFilter
+from core.api.imports import READERS, ContactImporter
+from core.api.pagination import COUNT_EXACT
+from core.api.serializers import (
+    BulkUpdateResultSerializer,
+    BulkUpdateSerializer,
+    ContactSerializer,
+    ContactTypeaheadSerializer,
+    ImportResultSerializer,
+    ImportUploadSerializer,
+)
 from core.models import Contact
 from core.permissions import IsContactOwnerOrAdmin
 from core.services.domain.contact_service import ContactService
 
-from .pagination import ContactPagination
-from .schemas import CREATE_CONTACT_EXAMPLES, UPDATE_CONTACT_EXAMPLES
+from ..mixins import (
+    IF_MATCH_PARAMETER,
+    BulkUpdateMixin,
+    ConditionalGetMixin,
+    ConditionalUpdateMixin,
+    CursorPaginationMixin,
+    ExportMixin,
+    ListCacheMixin,
+    SparseFieldsetMixin,
+    TypeaheadMixin,
+    ValuesListMixin,
+)
+from .pagination import ContactCursorPagination, ContactPagination
+from .schemas import (
+    BULK_UPDATE_CONTACT_EXAMPLES,
+    CREATE_CONTACT_EXAMPLES,
+    UPDATE_CONTACT_EXAMPLES,
+)
 
 
-class ContactViewSet(viewsets.ModelViewSet):  # pylint: disable=too-many-ancestors
+@extend_schema_view(
+    update=extend_schema(parameters=[IF_MATCH_PARAMETER]),
+    partial_update=extend_schema(parameters=[IF_MATCH_PARAMETER]),
+    destroy=extend_schema(parameters=[IF_MATCH_PARAMETER]),
+)
+class ContactViewSet(  # pylint: disable=too-many-ancestors
+    ConditionalUpdateMixin,
+    ConditionalGetMixin,
+    ListCacheMixin,
+    ValuesListMixin,
+    CursorPaginationMixin,
+    SparseFieldsetMixin,
+    TypeaheadMixin,
+    ExportMixin,
+    BulkUpdateMixin,
+    viewsets.ModelViewSet,
+):
     """API ViewSet for Contact model."""
 
     # Endpoints:
     # POST   /contacts      → Create a new contact
+    # POST   /contacts/import → Stream a CSV/NDJSON file of contacts
+    # PATCH  /contacts/bulk → Apply one field patch to contacts by id or filter
     # GET    /contacts      → List contacts (with filtering/pagination/sorting)
+    # GET    /contacts/export → Stream all matching contacts as CSV or NDJSON
+    # GET    /contacts/typeahead → Prefix-match contact names (top-k, ids only)
     # GET    /contacts/{id} → Retrieve a specific contact
-    # PUT    /contacts/{id} → Update a contact
+    # PUT    /contacts/{id} → Update a contact (If-Match → 412 when stale)
     # DELETE /contacts/{id} → Soft delete a contact
 
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
+    typeahead_serializer_class = ContactTypeaheadSerializer
     permission_classes = [IsContactOwnerOrAdmin]
     pagination_class = ContactPagination
+    cursor_pagination_class = ContactCursorPagination
+    count_strategy = COUNT_EXACT
+    values_list_render = True
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
     filterset_fields = ["account", "role", "seniority", "owner_user"]
     search_fields = ["first_name", "last_name", "email", "job_title"]
     ordering_fields = ["first_name", "last_name", "created_at", "updated_at"]
     ordering = ["-created_at"]
+    projection_always_fields = ("id", "created_at", "owner_user")
+    bulk_update_excluded_fields = ("email", "account", "is_invalid")
     allowed_actions = [
         "list",
         "retrieve",
@@ -52,15 +107,62 @@ class ContactViewSet(viewsets.ModelViewSet):  # pylint: disable=too-many-ancesto
         ContactService.soft_delete_contact(instance, request.user)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @extend_schema(
+        request={"multipart/form-data": ImportUploadSerializer},
+        responses={200: ImportResultSerializer},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_contacts(self, request):
+        """Import contacts from a CSV or NDJSON file, reporting row-level errors."""
+        upload = ImportUploadSerializer(data=request.data)
+        upload.is_valid(raise_exception=True)
+        reader = READERS[upload.validated_data["import_format"]]
+        with upload.validated_data["file"].open("rb") as stream:
+            result = ContactImporter(request.user).run(reader(stream))
+        return Response(ImportResultSerializer(result).data)
+
+    @extend_schema(
+        request=BulkUpdateSerializer,
+        responses={200: BulkUpdateResultSerializer},
+        examples=BULK_UPDATE_CONTACT_EXAMPLES,
+    )
+    @action(detail=False, methods=["patch"], url_path="bulk")
+    def bulk_update(self, request, *args, **kwargs):
+        """Apply one field patch to the selected contacts the user may change."""
+        return super().bulk_update(request, *args, **kwargs)
+
     # ===== Query Methods =====
 
     def get_queryset(self):
-        """Delegate queryset retrieval to service."""
-        return ContactService.list_contacts()
+        """
+        Delegate queryset retrieval to service.
+
+        No ``with_account()`` here: the serializer renders ``account`` from
+        ``account_id``, so joining the account would only widen the query.
+        ``?account=`` filters on the same column as ``for_account()``.
+        """
+        return ContactService.list_contacts(
+            fields=self.get_projection(), user=self.request.user
+        )
 
     def get_object(self):
-        """Delegate object retrieval to service."""
-        return ContactService.get_contact(self.kwargs["pk"])
+        """
+        Delegate object retrieval to service and check object permissions.
+
+        Reads only find rows visible to the user (others are 404); writes
+        look the row up unscoped so non-owners get a 403 from the permission.
+        """
+        user = self.request.user if self.request.method in SAFE_METHODS else None
+        contact = ContactService.get_contact(
+            self.kwargs["pk"], fields=self.get_projection(), user=user
+        )
+        self.check_object_permissions(self.request, contact)
+        return contact
 
     # ===== Persistence Methods =====
 
@@ -74,6 +176,10 @@ class ContactViewSet(viewsets.ModelViewSet):  # pylint: disable=too-many-ancesto
             serializer.instance, serializer.validated_data, self.request.user
         )
 
+    def perform_bulk_update(self, queryset, data):
+        """Delegate the set-based contact update to service."""
+        return ContactService.bulk_update_contacts(queryset, data, self.request.user)
+
 
 # Set docstrings for all action methods
 ContactViewSet.list.__doc__ = (
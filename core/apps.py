@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = "core"
+
+    def ready(self):
+        # Connect signal receivers and register system checks
+        from core import checks, receivers  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
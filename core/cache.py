@@ -0,0 +1,45 @@
+"""
+Per-model generation counters for invalidating cached list responses.
+
+Every cache key built for a model's data includes its current generation.
+Writes bump the generation once they commit, so entries cached before the
+write are never read again and simply expire.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def get_cache():
+    """Return the cache backend configured for list responses."""
+    return caches[settings.LIST_CACHE_ALIAS]
+
+
+def _generation_key(model):
+    return f"generation:{model._meta.label_lower}"
+
+
+def get_generation(model) -> int:
+    """Return the current generation for a model, initialising it if missing."""
+    cache = get_cache()
+    key = _generation_key(model)
+    generation = cache.get(key)
+    if generation is None:
+        # Seed from the clock so a counter lost to eviction or a restart never
+        # goes back to a value that older cache entries were keyed with
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(model) -> int:
+    """Advance a model's generation, invalidating its cached lists."""
+    cache = get_cache()
+    key = _generation_key(model)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+        return cache.get(key)
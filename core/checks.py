@@ -0,0 +1,30 @@
+"""System checks for settings that are only safe in some deployments."""
+
+from django.conf import settings
+from django.core import checks
+
+from core.cache import get_cache
+
+# Cache backends whose contents live in (or never leave) a single process
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@checks.register(checks.Tags.caches)
+def check_list_cache_backend(app_configs, **kwargs):
+    """Warn when the list cache is enabled on a cache other workers cannot see."""
+    if not settings.LIST_CACHE_TIMEOUT:
+        return []
+    backend = type(get_cache())
+    if f"{backend.__module__}.{backend.__qualname__}" not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        checks.Warning(
+            "LIST_CACHE_TIMEOUT is set but LIST_CACHE_ALIAS uses a process-local cache.",
+            hint="Generation bumps in one worker do not reach the others, which keep "
+            "serving stale list pages. Point LIST_CACHE_ALIAS at a shared cache.",
+            id="core.W001",
+        )
+    ]
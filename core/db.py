@@ -0,0 +1,15 @@
+"""
+Per-connection database setup.
+
+SQLite keeps most tuning in per-connection pragmas, so they are applied
+each time Django opens a connection (see ``core.receivers``). Only the
+journal mode is stored in the database file itself.
+"""
+
+from typing import Any, Mapping
+
+
+def apply_sqlite_pragmas(cursor, pragmas: Mapping[str, Any]) -> None:
+    """Run ``PRAGMA name = value`` for each entry, in order."""
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
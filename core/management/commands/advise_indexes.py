@@ -0,0 +1,354 @@
+"""
+Suggest composite indexes for the list endpoints' filter/ordering surface.
+
+Enumerates the combinations each registered ViewSet exposes
+(``filterset_fields`` x ``ordering_fields``/default ``ordering``), runs
+``EXPLAIN`` for each against a seeded dataset and reports the list requests
+that would do a full table scan or sort without an index. For each one it
+proposes an index (equality filters first, then the sort column) as a
+``Meta.indexes`` entry and a ``migrations.AddIndex`` operation.
+
+The seed data is written inside a transaction that is rolled back, so the
+database is left unchanged.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import re
+from typing import NamedTuple
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from django.db.models.sql.where import AND
+
+from core.api.urls import router
+from core.models import (
+    Account,
+    AccountStatus,
+    AccountType,
+    CompanySize,
+    Contact,
+    ContactRole,
+    ContactSeniority,
+)
+
+# Patterns flagging a full scan / an unindexed sort, per database vendor.
+PLAN_PATTERNS = {
+    "sqlite": {
+        "full_scan": re.compile(r"\bSCAN (?!.*\bUSING (?:COVERING )?INDEX\b)\S+"),
+        "filesort": re.compile(r"USE TEMP B-TREE FOR (?:ORDER BY|RIGHT PART OF ORDER BY)"),
+    },
+    "postgresql": {
+        "full_scan": re.compile(r"\bSeq Scan on\b"),
+        "filesort": re.compile(r"(?m)^\s*(?:->\s*)?(?:Incremental )?Sort\b"),
+    },
+}
+
+
+class _Rollback(Exception):
+    """Raised to discard the seed data once the analysis is done."""
+
+
+class PlanFinding(NamedTuple):
+    """EXPLAIN result for one list request."""
+
+    resource: str
+    model: type
+    filters: tuple[str, ...]
+    ordering: str
+    full_scan: bool
+    filesort: bool
+    matched_rows: int
+    table_rows: int
+
+    @property
+    def request(self) -> str:
+        params = [f"{name}=<v>" for name in self.filters]
+        params.append(f"ordering={self.ordering}")
+        return f"GET /{self.resource}/?{'&'.join(params)}"
+
+    @property
+    def wasted_rows(self) -> int:
+        """Rows read or sorted beyond what a suitable index would need."""
+        rows = self.table_rows if self.full_scan and self.filters else 0
+        if self.filesort:
+            rows += self.matched_rows
+        return rows
+
+    @property
+    def proposed_fields(self) -> tuple[str, ...]:
+        fields = list(self.filters)
+        if self.filesort or not fields:
+            fields.append(self.ordering.lstrip("-"))
+        return tuple(fields)
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN every filter/ordering combination exposed by the list "
+        "endpoints against seeded data and propose composite indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=5000,
+            help="Accounts to seed (contacts are seeded at 3x). Default: 5000.",
+        )
+        parser.add_argument(
+            "--max-filters",
+            type=int,
+            default=2,
+            help="Largest number of filters combined in one request. Default: 2.",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of index proposals to print. Default: 10.",
+        )
+        parser.add_argument(
+            "--include",
+            default="",
+            help="Comma-separated columns to add as covering INCLUDE columns "
+            "(PostgreSQL only).",
+        )
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        if vendor not in PLAN_PATTERNS:
+            raise CommandError(f"Unsupported database vendor: {vendor}")
+        include = [name for name in options["include"].split(",") if name]
+
+        try:
+            with transaction.atomic():
+                self._seed(options["seed"])
+                self._analyze()
+                findings = list(self._explain_all(options["max_filters"]))
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self._report(
+            findings, include if vendor == "postgresql" else [], options["top"]
+        )
+
+    # ===== Enumeration =====
+
+    def _explain_all(self, max_filters):
+        patterns = PLAN_PATTERNS[connection.vendor]
+        for prefix, viewset, _ in router.registry:
+            model = viewset.queryset.model
+            table_rows = model._default_manager.count()
+            samples = {name: self._sample(model, name) for name in viewset.filterset_fields}
+            for filters in self._filter_combinations(viewset, max_filters):
+                filtered = model._default_manager.filter(
+                    **{name: samples[name] for name in filters}
+                )
+                matched_rows = filtered.count()
+                for ordering in self._orderings(viewset):
+                    plan = filtered.order_by(ordering).explain()
+                    yield PlanFinding(
+                        resource=prefix,
+                        model=model,
+                        filters=filters,
+                        ordering=ordering,
+                        full_scan=bool(patterns["full_scan"].search(plan)),
+                        filesort=bool(patterns["filesort"].search(plan)),
+                        matched_rows=matched_rows,
+                        table_rows=table_rows,
+                    )
+
+    @staticmethod
+    def _filter_combinations(viewset, max_filters):
+        fields = list(viewset.filterset_fields)
+        for size in range(0, min(max_filters, len(fields)) + 1):
+            yield from itertools.combinations(fields, size)
+
+    @staticmethod
+    def _orderings(viewset):
+        orderings = list(viewset.ordering or [])
+        for name in viewset.ordering_fields:
+            orderings.extend([name, f"-{name}"])
+        return list(dict.fromkeys(orderings))
+
+    @staticmethod
+    def _sample(model, name):
+        return (
+            model._base_manager.exclude(**{f"{name}__isnull": True})
+            .values_list(name, flat=True)
+            .first()
+        )
+
+    # ===== Reporting =====
+
+    def _report(self, findings, include, top):
+        problems = [f for f in findings if (f.full_scan and f.filters) or f.filesort]
+        self.stdout.write(
+            f"Explained {len(findings)} list requests; "
+            f"{len(problems)} scan or sort without an index."
+        )
+        for finding in problems:
+            issues = []
+            if finding.full_scan and finding.filters:
+                issues.append("FULL SCAN")
+            if finding.filesort:
+                issues.append("FILESORT")
+            self.stdout.write(
+                f"  {finding.request}: {', '.join(issues)} "
+                f"({finding.wasted_rows} rows)"
+            )
+
+        proposals = self._proposals(problems)[:top]
+        if not proposals:
+            self.stdout.write(self.style.SUCCESS("No new indexes proposed."))
+            return
+
+        self.stdout.write("")
+        self.stdout.write("Proposed indexes, by rows saved on the seeded data:")
+        for model, fields, requests, rows in proposals:
+            index = self._build_index(model, fields, include)
+            self.stdout.write(
+                f"  {model.__name__}: {rows} rows over {requests} requests"
+            )
+            self.stdout.write(f"    Meta.indexes: {self._index_source(index)}")
+            self.stdout.write(
+                f"    migrations.AddIndex(model_name={model._meta.model_name!r}, "
+                f"index={self._index_source(index)})"
+            )
+        self.stdout.write("")
+        self.stdout.write(
+            "Add the chosen entries to Meta.indexes and run makemigrations. "
+            "?search= is served by the full-text index and is not analysed here."
+        )
+
+    def _proposals(self, problems):
+        """
+        Group flagged requests into ``(model, fields, requests, rows)`` proposals.
+
+        A B-tree serves a sort column in both directions, and an index also
+        serves every request matching a prefix of its columns, so shorter
+        proposals are folded into longer ones. Proposals already served by an
+        existing index are dropped. Sorted by rows saved, descending.
+        """
+        counts: dict[tuple[type, tuple[str, ...]], list[int]] = {}
+        for finding in problems:
+            totals = counts.setdefault((finding.model, finding.proposed_fields), [0, 0])
+            totals[0] += 1
+            totals[1] += finding.wasted_rows
+
+        for model, fields in sorted(counts, key=lambda key: len(key[1])):
+            longer = [
+                other
+                for other in counts
+                if other[0] is model
+                and len(other[1]) > len(fields)
+                and other[1][: len(fields)] == fields
+            ]
+            if longer:
+                requests, rows = counts.pop((model, fields))
+                counts[longer[0]][0] += requests
+                counts[longer[0]][1] += rows
+
+        proposals = [
+            (model, fields, requests, rows)
+            for (model, fields), (requests, rows) in counts.items()
+            if not self._covered_by_existing(model, fields)
+        ]
+        return sorted(proposals, key=lambda item: (-item[3], item[0].__name__, item[1]))
+
+    @classmethod
+    def _covered_by_existing(cls, model, fields):
+        """
+        Return True if an existing index already starts with these columns.
+
+        A partial index counts when every list query satisfies its
+        condition, e.g. the ``*_live_idx`` indexes on ``is_invalid=False``.
+        """
+        for index in model._meta.indexes:
+            existing = tuple(name.lstrip("-") for name in index.fields)
+            if existing[: len(fields)] == fields and cls._condition_holds(
+                model, index.condition
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def _condition_holds(model, condition):
+        """Return True if the default manager's filter implies the index condition."""
+        if condition is None:
+            return True
+        applied = model._default_manager.all().query.where
+        required = model._base_manager.filter(condition).query.where
+        return (
+            applied.connector == required.connector == AND
+            and not applied.negated
+            and not required.negated
+            and all(child in applied.children for child in required.children)
+        )
+
+    @staticmethod
+    def _build_index(model, fields, include):
+        index = models.Index(fields=list(fields), include=include or None, name="")
+        index.set_name_with_model(model)
+        return index
+
+    @staticmethod
+    def _index_source(index):
+        parts = [f"fields={list(index.fields)!r}", f"name={index.name!r}"]
+        if index.include:
+            parts.append(f"include={list(index.include)!r}")
+        return f"models.Index({', '.join(parts)})"
+
+    # ===== Seed Data =====
+
+    def _seed(self, count):
+        rng = random.Random(20240101)
+        owners = [
+            get_user_model().objects.create_user(username=f"index-advisor-{index}")
+            for index in range(5)
+        ]
+        accounts = Account.objects.bulk_create(
+            [
+                Account(
+                    name=f"Seed Account {index}",
+                    account_number=f"SEED-{index:08d}",
+                    status=rng.choice(AccountStatus.values),
+                    type=rng.choice(AccountType.values),
+                    company_size=rng.choice(CompanySize.values),
+                    annual_revenue=rng.randint(0, 10_000_000),
+                    owner_user=rng.choice(owners),
+                    is_invalid=rng.random() < 0.1,
+                )
+                for index in range(count)
+            ],
+            batch_size=500,
+        )
+        Contact.objects.bulk_create(
+            [
+                Contact(
+                    first_name=f"Seed {index}",
+                    last_name=f"Contact {index}",
+                    account=rng.choice(accounts),
+                    role=rng.choice(ContactRole.values),
+                    seniority=rng.choice(ContactSeniority.values),
+                    owner_user=rng.choice(owners),
+                    is_invalid=rng.random() < 0.1,
+                )
+                for index in range(count * 3)
+            ],
+            batch_size=500,
+        )
+
+    @staticmethod
+    def _analyze():
+        with connection.cursor() as cursor:
+            if connection.vendor == "sqlite":
+                cursor.execute("ANALYZE")
+            else:
+                for model in (Account, Contact):
+                    cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
@@ -0,0 +1,86 @@
+"""
+Move soft-deleted accounts and contacts to and from the archive tables.
+
+``archive`` is meant to run periodically (cron or a worker): it moves rows
+soft-deleted longer than ``ARCHIVE_RETENTION_DAYS`` out of the hot tables in
+bounded batches. ``restore`` brings archived rows back as live rows, and
+``purge`` permanently drops rows archived longer than ``ARCHIVE_PURGE_DAYS``.
+"""
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from core.services import ArchiveService
+
+
+class Command(BaseCommand):
+    help = "Archive, restore or purge soft-deleted accounts and contacts."
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest="operation", required=True)
+
+        archive = subparsers.add_parser("archive", help="Archive expired soft-deleted rows.")
+        archive.add_argument(
+            "--retention-days",
+            type=int,
+            help="Archive rows soft-deleted longer ago than this. "
+            "Default: ARCHIVE_RETENTION_DAYS.",
+        )
+        archive.add_argument(
+            "--batch-size", type=int, help="Rows per transaction. Default: ARCHIVE_BATCH_SIZE."
+        )
+        archive.add_argument(
+            "--max-batches",
+            type=int,
+            help="Stop after this many batches per model (default: until done).",
+        )
+
+        restore = subparsers.add_parser("restore", help="Restore archived rows as live rows.")
+        restore.add_argument("--accounts", nargs="+", default=[], metavar="ID")
+        restore.add_argument(
+            "--contacts",
+            nargs="+",
+            default=[],
+            metavar="ID",
+            help="Their archived accounts are restored too.",
+        )
+
+        purge = subparsers.add_parser("purge", help="Permanently delete old archived rows.")
+        purge.add_argument(
+            "--purge-days",
+            type=int,
+            help="Delete rows archived longer ago than this. Default: ARCHIVE_PURGE_DAYS.",
+        )
+        purge.add_argument(
+            "--batch-size", type=int, help="Rows per transaction. Default: ARCHIVE_BATCH_SIZE."
+        )
+
+    def handle(self, *args, **options):
+        operation = options["operation"]
+        if operation == "archive":
+            counts = ArchiveService.archive_deleted(
+                retention_days=options["retention_days"],
+                batch_size=options["batch_size"],
+                max_batches=options["max_batches"],
+            )
+            self.stdout.write(
+                f"Archived {counts.accounts} account(s) and {counts.contacts} contact(s)."
+            )
+        elif operation == "restore":
+            try:
+                with transaction.atomic():
+                    accounts = ArchiveService.restore_accounts(options["accounts"])
+                    contacts = ArchiveService.restore_contacts(options["contacts"])
+            except (IntegrityError, ValidationError, ValueError) as exc:
+                raise CommandError(f"Restore failed: {exc}") from exc
+            self.stdout.write(
+                f"Restored {len(accounts)} account(s) and {len(contacts)} contact(s)."
+            )
+        else:
+            counts = ArchiveService.purge_archive(
+                purge_days=options["purge_days"], batch_size=options["batch_size"]
+            )
+            self.stdout.write(
+                f"Purged {counts.accounts} account(s) and {counts.contacts} contact(s)."
+            )
@@ -0,0 +1,108 @@
+"""
+Compare list rendering through the model serializers and ``ValuesRowSerializer``.
+
+Seeds accounts and contacts inside a transaction that is rolled back, then
+times fetching and rendering a page (query, serialization and JSON encoding)
+both ways, and checks that the rendered bytes are identical.
+"""
+
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from core.api.serializers import (
+    AccountSerializer,
+    ContactSerializer,
+    ValuesRowSerializer,
+)
+from core.models import Account, AccountStatus, Contact
+
+
+class _Rollback(Exception):
+    """Raised to discard the seed data once the benchmark is done."""
+
+
+class Command(BaseCommand):
+    help = "Benchmark serializer vs values() rendering for list pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=100, help="Rows per page. Default: 100."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=50, help="Timed runs per path. Default: 50."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._seed(options["rows"])
+                for serializer_class in (AccountSerializer, ContactSerializer):
+                    self._compare(serializer_class, options["rows"], options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _compare(self, serializer_class, rows, repeat):
+        model = serializer_class.Meta.model
+        queryset = model.objects.order_by("-created_at", "-id")[:rows]
+        row_serializer = ValuesRowSerializer.for_serializer(serializer_class())
+        renderer = JSONRenderer()
+
+        def serializer_path():
+            return renderer.render(serializer_class(queryset.all(), many=True).data)
+
+        def values_path():
+            return renderer.render(
+                row_serializer.render(queryset.values(*row_serializer.columns))
+            )
+
+        if serializer_path() != values_path():
+            raise CommandError(f"{model.__name__}: rendered output differs")
+
+        slow = self._time(serializer_path, repeat)
+        fast = self._time(values_path, repeat)
+        self.stdout.write(
+            f"{model.__name__} ({rows} rows): serializer {slow * 1000:.2f}ms, "
+            f"values {fast * 1000:.2f}ms, speedup {slow / fast:.1f}x"
+        )
+
+    @staticmethod
+    def _time(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    @staticmethod
+    def _seed(rows):
+        accounts = Account.objects.bulk_create(
+            [
+                Account(
+                    name=f"Benchmark Account {index}",
+                    account_number=f"BENCH-{index:08d}",
+                    status=AccountStatus.ACTIVE,
+                    annual_revenue=Decimal(index * 1000),
+                    website="https://example.com",
+                    billing_city="Springfield",
+                )
+                for index in range(rows)
+            ]
+        )
+        Contact.objects.bulk_create(
+            [
+                Contact(
+                    first_name=f"Benchmark {index}",
+                    last_name="Contact",
+                    email=f"contact{index}@example.com",
+                    account=accounts[index % len(accounts)],
+                )
+                for index in range(rows)
+            ]
+        )
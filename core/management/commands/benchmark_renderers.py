@@ -0,0 +1,110 @@
+"""
+Round-trip benchmark of the API renderers and parsers.
+
+Seeds accounts inside a transaction that is rolled back, serializes a list
+page and a bulk-create payload, and times render + parse with DRF's stdlib
+``json`` classes against ``ORJSONRenderer``/``ORJSONParser`` and
+``MessagePackRenderer``/``MessagePackParser``. The orjson output is checked
+to be byte-identical to the current output, and every format to round-trip
+to the same data.
+"""
+
+import io
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.api.serializers import AccountSerializer
+from core.models import Account, AccountStatus
+from core.parsers import MessagePackParser, ORJSONParser, msgpack, orjson
+from core.renderers import MessagePackRenderer, ORJSONRenderer
+
+
+class _Rollback(Exception):
+    """Raised to discard the seed data once the benchmark is done."""
+
+
+class Command(BaseCommand):
+    help = "Benchmark JSON vs orjson vs MessagePack render/parse round trips."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=1000, help="Rows per payload. Default: 1000."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Timed runs per format. Default: 20."
+        )
+
+    def handle(self, *args, **options):
+        formats = [("json", JSONRenderer(), JSONParser())]
+        if orjson is not None:
+            formats.append(("orjson", ORJSONRenderer(), ORJSONParser()))
+        if msgpack is not None:
+            formats.append(("msgpack", MessagePackRenderer(), MessagePackParser()))
+
+        try:
+            with transaction.atomic():
+                self._seed(options["rows"])
+                page = AccountSerializer(Account.objects.all(), many=True).data
+                raise _Rollback
+        except _Rollback:
+            pass
+        bulk = [
+            {name: row[name] for name in ("name", "account_number", "annual_revenue")}
+            for row in page
+        ]
+
+        for label, payload in (("list page", page), ("bulk payload", bulk)):
+            self.stdout.write(f"{label} ({len(payload)} rows):")
+            self._compare(formats, payload, options["repeat"])
+
+    def _compare(self, formats, payload, repeat):
+        baseline_bytes = JSONRenderer().render(payload)
+        baseline_data = JSONParser().parse(io.BytesIO(baseline_bytes))
+        baseline_time = None
+
+        for name, renderer, parser in formats:
+            body = renderer.render(payload)
+            if name == "orjson" and body != baseline_bytes:
+                raise CommandError("orjson output differs from JSONRenderer")
+            if parser.parse(io.BytesIO(body)) != baseline_data:
+                raise CommandError(f"{name} does not round-trip")
+
+            render_time = self._time(lambda: renderer.render(payload), repeat)
+            parse_time = self._time(lambda: parser.parse(io.BytesIO(body)), repeat)
+            total = render_time + parse_time
+            baseline_time = baseline_time or total
+            self.stdout.write(
+                f"  {name:<8} render {render_time * 1000:7.2f}ms  "
+                f"parse {parse_time * 1000:7.2f}ms  size {len(body):>9}B  "
+                f"speedup {baseline_time / total:4.1f}x"
+            )
+
+    @staticmethod
+    def _time(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    @staticmethod
+    def _seed(rows):
+        Account.objects.bulk_create(
+            [
+                Account(
+                    name=f"Benchmark Account {index}",
+                    account_number=f"BENCH-{index:08d}",
+                    status=AccountStatus.ACTIVE,
+                    annual_revenue=Decimal(index * 1000),
+                    website="https://example.com",
+                )
+                for index in range(rows)
+            ]
+        )
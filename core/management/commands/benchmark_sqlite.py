@@ -0,0 +1,200 @@
+"""
+Compare SQLite throughput under concurrent processes with and without tuning.
+
+For each profile a fresh database file is seeded with an account-like
+table, then ``--workers`` processes run for ``--seconds``: each operation
+is either a list-page read or a short write transaction (one UPDATE plus
+one INSERT), chosen at random with ``--write-ratio``. The ``default``
+profile is SQLite's own (rollback journal, ``synchronous=FULL``, deferred
+transactions); ``production`` applies ``SQLITE_PRODUCTION_PRAGMAS`` and
+``BEGIN IMMEDIATE`` like the production database profile. Workers use the
+``sqlite3`` module directly, so no Django connection is shared between
+processes.
+"""
+
+import multiprocessing
+import random
+import sqlite3
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.db import apply_sqlite_pragmas
+
+STATUSES = ("prospect", "active", "inactive", "lost")
+
+SCHEMA = """
+CREATE TABLE account (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    owner_user_id INTEGER,
+    description TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX account_status_created_idx ON account (status, created_at DESC, id DESC);
+"""
+
+
+def _row(index):
+    now = time.strftime("%Y-%m-%dT%H:%M:%S")
+    return (
+        str(uuid.uuid4()),
+        f"Benchmark Account {index}",
+        STATUSES[index % len(STATUSES)],
+        index % 50,
+        "x" * 200,
+        now,
+        now,
+    )
+
+
+def _insert(cursor, index):
+    cursor.execute(
+        "INSERT INTO account "
+        "(id, name, status, owner_user_id, description, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        _row(index),
+    )
+
+
+def _worker(path, pragmas, begin, seconds, write_ratio, start_at, seed):
+    """Run the read/write mix until the deadline; return counts and latencies."""
+    connection = sqlite3.connect(path, timeout=5, isolation_level=None)
+    cursor = connection.cursor()
+    apply_sqlite_pragmas(cursor, pragmas)
+    ids = [row[0] for row in cursor.execute("SELECT id FROM account")]
+    rng = random.Random(seed)
+    reads = writes = errors = 0
+    write_latencies = []
+
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = start_at + seconds
+    while time.time() < deadline:
+        started = time.perf_counter()
+        try:
+            if rng.random() < write_ratio:
+                cursor.execute(begin)
+                cursor.execute(
+                    "UPDATE account SET status = ?, updated_at = ?, version = version + 1 "
+                    "WHERE id = ?",
+                    (
+                        rng.choice(STATUSES),
+                        time.strftime("%Y-%m-%dT%H:%M:%S"),
+                        rng.choice(ids),
+                    ),
+                )
+                _insert(cursor, rng.randrange(1_000_000))
+                cursor.execute("COMMIT")
+                writes += 1
+                write_latencies.append(time.perf_counter() - started)
+            else:
+                cursor.execute(
+                    "SELECT * FROM account WHERE status = ? "
+                    "ORDER BY created_at DESC, id DESC LIMIT 50",
+                    (rng.choice(STATUSES),),
+                ).fetchall()
+                reads += 1
+        except sqlite3.OperationalError:
+            # "database is locked" once the busy timeout runs out
+            errors += 1
+            if connection.in_transaction:
+                cursor.execute("ROLLBACK")
+    connection.close()
+    return reads, writes, errors, write_latencies
+
+
+class Command(BaseCommand):
+    help = "Benchmark multi-process SQLite reads/writes, default vs production pragmas."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=4, help="Concurrent processes. Default: 4."
+        )
+        parser.add_argument(
+            "--seconds", type=float, default=5.0, help="Run time per profile. Default: 5."
+        )
+        parser.add_argument(
+            "--write-ratio",
+            type=float,
+            default=0.2,
+            help="Fraction of operations that write. Default: 0.2.",
+        )
+        parser.add_argument(
+            "--rows", type=int, default=20000, help="Rows seeded. Default: 20000."
+        )
+
+    def handle(self, *args, **options):
+        profiles = {
+            "default": ({}, "BEGIN"),
+            "production": (settings.SQLITE_PRODUCTION_PRAGMAS, "BEGIN IMMEDIATE"),
+        }
+        results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            for name, (pragmas, begin) in profiles.items():
+                path = str(Path(directory) / f"{name}.sqlite3")
+                self._seed(path, pragmas, options["rows"])
+                results[name] = self._run(path, pragmas, begin, options)
+                self._report(name, results[name], options["seconds"])
+
+        default, production = results["default"], results["production"]
+        self.stdout.write(
+            "production vs default: "
+            f"reads {self._ratio(production[0], default[0])}, "
+            f"writes {self._ratio(production[1], default[1])}"
+        )
+
+    @staticmethod
+    def _seed(path, pragmas, rows):
+        connection = sqlite3.connect(path, isolation_level=None)
+        apply_sqlite_pragmas(connection.cursor(), pragmas)
+        connection.executescript(SCHEMA)
+        with connection:
+            connection.execute("BEGIN")
+            for index in range(rows):
+                _insert(connection, index)
+        connection.close()
+
+    @staticmethod
+    def _run(path, pragmas, begin, options):
+        start_at = time.time() + 1.0
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(options["workers"]) as pool:
+            outcomes = pool.starmap(
+                _worker,
+                [
+                    (
+                        path,
+                        pragmas,
+                        begin,
+                        options["seconds"],
+                        options["write_ratio"],
+                        start_at,
+                        seed,
+                    )
+                    for seed in range(options["workers"])
+                ],
+            )
+        reads = sum(outcome[0] for outcome in outcomes)
+        writes = sum(outcome[1] for outcome in outcomes)
+        errors = sum(outcome[2] for outcome in outcomes)
+        latencies = sorted(value for outcome in outcomes for value in outcome[3])
+        p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+        return reads, writes, errors, p95
+
+    def _report(self, name, result, seconds):
+        reads, writes, errors, p95 = result
+        self.stdout.write(
+            f"{name}: {reads / seconds:.0f} reads/s, {writes / seconds:.0f} writes/s, "
+            f"p95 write {p95 * 1000:.1f}ms, {errors} lock errors"
+        )
+
+    @staticmethod
+    def _ratio(new, old):
+        return f"{new / old:.1f}x" if old else "n/a"
@@ -0,0 +1,21 @@
+"""Rebuild the full-text search index from the Account and Contact tables."""
+
+from django.core.management.base import BaseCommand
+
+from core.models import Account, Contact
+from core.search import search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for accounts and contacts."
+
+    def handle(self, *args, **options):
+        for model in (Account, Contact):
+            if search_index.rebuild(model):
+                self.stdout.write(f"Rebuilt search index for {model._meta.label}.")
+            else:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"No search index available for {model._meta.label}; skipped."
+                    )
+                )
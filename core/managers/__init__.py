@@ -1,5 +1,6 @@
 """Custom managers for models."""
 
 from core.managers.account_manager import AccountManager
+from core.managers.contact_manager import ContactManager
 
-__all__ = ["AccountManager"]
+__all__ = ["AccountManager", "ContactManager"]
@@ -20,6 +20,14 @@ class AccountQuerySet(models.QuerySet):
         """Return accounts owned by the given user."""
         return self.filter(owner_user=user)
 
+    def visible_to(self, user: User) -> AccountQuerySet:
+        """Return accounts the user may see: all for staff, else only their own."""
+        if not user.is_authenticated:
+            return self.none()
+        if user.is_staff:
+            return self
+        return self.filter(owner_user_id=user.pk)
+
     def filter_by_params(
         self,
         industry: Optional[str] = None,
@@ -46,10 +54,20 @@ class AccountQuerySet(models.QuerySet):
 
 
 class AccountManager(models.Manager):
-    """Custom manager for Account model with filtering and chaining support."""
+    """
+    Custom manager for Account model with filtering and chaining support.
+
+    Soft-deleted accounts (``is_invalid=True``) are left out of every query
+    built from this manager; ``with_deleted()`` is the escape hatch for
+    admin screens and uniqueness checks that must see all rows.
+    """
 
     def get_queryset(self) -> AccountQuerySet:
-        """Return custom QuerySet for method chaining."""
+        """Return live accounts as a custom QuerySet for method chaining."""
+        return self.with_deleted().active()
+
+    def with_deleted(self) -> AccountQuerySet:
+        """Return all accounts, soft-deleted ones included."""
         return AccountQuerySet(self.model, using=self._db)
 
     def active(self) -> AccountQuerySet:
@@ -60,6 +78,10 @@ class AccountManager(models.Manager):
         """Return accounts owned by the given user."""
         return self.get_queryset().by_owner(user)
 
+    def visible_to(self, user: User) -> AccountQuerySet:
+        """Return accounts the user may see: all for staff, else only their own."""
+        return self.get_queryset().visible_to(user)
+
     def filter_by_params(
         self,
         industry: Optional[str] = None,
@@ -0,0 +1,127 @@
+"""Custom manager for Contact model."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from django.db import models
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser as User
+
+
+class ContactQuerySet(models.QuerySet):
+    """Custom QuerySet for Contact model enabling method chaining."""
+
+    def active(self) -> ContactQuerySet:
+        """Return all non-deleted (active) contacts."""
+        return self.filter(is_invalid=False)
+
+    def by_owner(self, user: User) -> ContactQuerySet:
+        """Return contacts owned by the given user."""
+        return self.filter(owner_user=user)
+
+    def visible_to(self, user: User) -> ContactQuerySet:
+        """Return contacts the user may see: all for staff, else only their own."""
+        if not user.is_authenticated:
+            return self.none()
+        if user.is_staff:
+            return self
+        return self.filter(owner_user_id=user.pk)
+
+    def for_account(self, account: Any) -> ContactQuerySet:
+        """
+        Return contacts of an account.
+
+        ``account`` may be an instance, a primary key or an ``OuterRef``;
+        the filter is on ``account_id``, which the account index covers.
+        """
+        return self.filter(account=account)
+
+    def primary(self) -> ContactQuerySet:
+        """Return primary contacts only."""
+        return self.filter(primary_contact=True)
+
+    def with_account(self) -> ContactQuerySet:
+        """Join the account into the same query, for code reading ``contact.account``."""
+        return self.select_related("account")
+
+    def filter_by_params(
+        self,
+        role: Optional[str] = None,
+        seniority: Optional[str] = None,
+        account: Any = None,
+        owner: Optional[User] = None,
+    ) -> ContactQuerySet:
+        """Filter contacts dynamically based on provided parameters."""
+        queryset = self
+
+        if role is not None:
+            queryset = queryset.filter(role=role)
+
+        if seniority is not None:
+            queryset = queryset.filter(seniority=seniority)
+
+        if account is not None:
+            queryset = queryset.for_account(account)
+
+        if owner is not None:
+            queryset = queryset.filter(owner_user=owner)
+
+        return queryset
+
+
+class ContactManager(models.Manager):
+    """
+    Custom manager for Contact model with filtering and chaining support.
+
+    Soft-deleted contacts (``is_invalid=True``) are left out of every query
+    built from this manager; ``with_deleted()`` is the escape hatch for
+    admin screens and uniqueness checks that must see all rows.
+    """
+
+    def get_queryset(self) -> ContactQuerySet:
+        """Return live contacts as a custom QuerySet for method chaining."""
+        return self.with_deleted().active()
+
+    def with_deleted(self) -> ContactQuerySet:
+        """Return all contacts, soft-deleted ones included."""
+        return ContactQuerySet(self.model, using=self._db)
+
+    def active(self) -> ContactQuerySet:
+        """Return all non-deleted (active) contacts."""
+        return self.get_queryset().active()
+
+    def by_owner(self, user: User) -> ContactQuerySet:
+        """Return contacts owned by the given user."""
+        return self.get_queryset().by_owner(user)
+
+    def visible_to(self, user: User) -> ContactQuerySet:
+        """Return contacts the user may see: all for staff, else only their own."""
+        return self.get_queryset().visible_to(user)
+
+    def for_account(self, account: Any) -> ContactQuerySet:
+        """Return contacts of an account (instance, primary key or ``OuterRef``)."""
+        return self.get_queryset().for_account(account)
+
+    def primary(self) -> ContactQuerySet:
+        """Return primary contacts only."""
+        return self.get_queryset().primary()
+
+    def with_account(self) -> ContactQuerySet:
+        """Join the account into the same query, for code reading ``contact.account``."""
+        return self.get_queryset().with_account()
+
+    def filter_by_params(
+        self,
+        role: Optional[str] = None,
+        seniority: Optional[str] = None,
+        account: Any = None,
+        owner: Optional[User] = None,
+    ) -> ContactQuerySet:
+        """Filter contacts dynamically based on provided parameters."""
+        return self.get_queryset().filter_by_params(
+            role=role,
+            seniority=seniority,
+            account=account,
+            owner=owner,
+        )
@@ -3,13 +3,137 @@ HTTP Request Timing Middleware for performance monitoring.
 
 Captures request start time and measures the elapsed time for each request,
 logging the HTTP method, path, status code, and execution time.
+
+When ``settings.REQUEST_QUERY_STATS`` is enabled, every database connection is
+wrapped for the duration of the request to also record the query count, total
+DB time, the slowest statement and duplicated statements (N+1 detection).
+
+``ReadYourWritesMiddleware`` keeps a client that just wrote on the primary
+database for ``REPLICA_STICKY_SECONDS`` when read replicas are configured.
 """
 
+import hashlib
 import logging
+import math
+import re
 import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from core.routers import get_primary_until, reset_primary_until, set_primary_until, use_primary
 
 logger = logging.getLogger(__name__)
 
+PRIMARY_UNTIL_COOKIE = "mycrm_primary_until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+IN_LIST_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint_sql(sql):
+    """
+    Return a short, stable fingerprint for a SQL statement.
+
+    Parameters are already placeholders in the wrapped SQL; ``IN (%s, %s, ...)``
+    lists are collapsed so statements differing only in list length match.
+    """
+    normalized = WHITESPACE_RE.sub(" ", sql).strip()
+    normalized = IN_LIST_RE.sub("(...)", normalized)
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:8]
+
+
+class QueryStats:
+    """
+    Database execute wrapper collecting per-request query statistics.
+
+    Install with ``connection.execute_wrapper(stats)``; every statement run on
+    the connection is timed and fingerprinted.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_sql = None
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.count += 1
+            self.total_time += duration
+            self.fingerprints[fingerprint_sql(sql)] += 1
+            if duration >= self.slowest_time:
+                self.slowest_time = duration
+                self.slowest_sql = sql
+
+    @property
+    def duplicates(self):
+        """Return ``{fingerprint: count}`` for statements run more than once."""
+        return {
+            fingerprint: count
+            for fingerprint, count in self.fingerprints.most_common()
+            if count > 1
+        }
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware pinning a client's reads to the primary after it writes.
+
+    Unsafe requests read from the primary throughout. When a request writes
+    a CRM record the router extends the stickiness deadline, which is sent
+    back in a cookie so the client's following requests (possibly served by
+    another process) also read from the primary until it passes.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        until = self._cookie_deadline(request)
+        token = set_primary_until(until)
+        try:
+            if request.method in SAFE_METHODS:
+                response = self.get_response(request)
+            else:
+                with use_primary():
+                    response = self.get_response(request)
+            written_until = get_primary_until()
+        finally:
+            reset_primary_until(token)
+
+        if written_until > until:
+            response.set_cookie(
+                PRIMARY_UNTIL_COOKIE,
+                f"{written_until:.3f}",
+                max_age=math.ceil(written_until - time.time()),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    @staticmethod
+    def _cookie_deadline(request):
+        try:
+            until = float(request.COOKIES.get(PRIMARY_UNTIL_COOKIE, 0))
+        except ValueError:
+            return 0.0
+        if not math.isfinite(until):
+            return 0.0
+        # Never trust a deadline further out than one window
+        return min(until, time.time() + settings.REPLICA_STICKY_SECONDS)
+
 
 class RequestTimingMiddleware:
     """
@@ -19,6 +143,10 @@ class RequestTimingMiddleware:
     time on each request and calculating the elapsed time when responding.
     Logs are formatted as:
     METHOD PATH - Status: CODE - Time: XXXms
+
+    With ``REQUEST_QUERY_STATS`` enabled the log line is extended with
+    ``- Queries: N - DB: XXms - Slowest: XXms [fingerprint] - Duplicates: N``
+    and the same figures are exposed in ``X-DB-*`` response headers.
     """
 
     def __init__(self, get_response):
@@ -29,6 +157,7 @@ class RequestTimingMiddleware:
             get_response: The next middleware or view in the chain
         """
         self.get_response = get_response
+        self.query_stats_enabled = settings.REQUEST_QUERY_STATS
 
     def __call__(self, request):
         """
@@ -44,21 +173,31 @@ class RequestTimingMiddleware:
         request.start_time = time.time()
 
         # Call the next middleware/view
-        response = self.get_response(request)
+        if self.query_stats_enabled:
+            request.query_stats = QueryStats()
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(request.query_stats))
+                response = self.get_response(request)
+        else:
+            response = self.get_response(request)
 
         # Calculate elapsed time
         try:
             elapsed_time = time.time() - request.start_time
             elapsed_ms = elapsed_time * 1000  # Convert to milliseconds
 
-            # Log timing information using lazy % formatting
-            logger.info(
-                "%s %s - Status: %s - Time: %.0fms",
-                request.method,
-                request.path,
-                response.status_code,
-                elapsed_ms,
-            )
+            if self.query_stats_enabled:
+                self._log_with_query_stats(request, response, elapsed_ms)
+            else:
+                # Log timing information using lazy % formatting
+                logger.info(
+                    "%s %s - Status: %s - Time: %.0fms",
+                    request.method,
+                    request.path,
+                    response.status_code,
+                    elapsed_ms,
+                )
         except AttributeError:
             # Handle case where start_time was not set (shouldn't happen in normal flow)
             logger.warning(
@@ -69,3 +208,45 @@ class RequestTimingMiddleware:
             )
 
         return response
+
+    def _log_with_query_stats(self, request, response, elapsed_ms):
+        """Log the timing line with DB statistics and set the X-DB-* headers."""
+        stats = request.query_stats
+        duplicates = stats.duplicates
+        db_ms = stats.total_time * 1000
+        slowest_ms = stats.slowest_time * 1000
+        slowest_fingerprint = (
+            fingerprint_sql(stats.slowest_sql) if stats.slowest_sql is not None else "-"
+        )
+
+        response["X-DB-Query-Count"] = str(stats.count)
+        response["X-DB-Time-Ms"] = f"{db_ms:.1f}"
+        response["X-DB-Slowest-Ms"] = f"{slowest_ms:.1f}"
+        response["X-DB-Slowest-Fingerprint"] = slowest_fingerprint
+        if duplicates:
+            response["X-DB-Duplicate-Queries"] = ", ".join(
+                f"{fingerprint}={count}" for fingerprint, count in duplicates.items()
+            )
+
+        logger.info(
+            "%s %s - Status: %s - Time: %.0fms - Queries: %s - DB: %.0fms"
+            " - Slowest: %.0fms [%s] - Duplicates: %s",
+            request.method,
+            request.path,
+            response.status_code,
+            elapsed_ms,
+            stats.count,
+            db_ms,
+            slowest_ms,
+            slowest_fingerprint,
+            sum(duplicates.values()),
+        )
+        if duplicates:
+            logger.warning(
+                "%s %s - Repeated queries (possible N+1): %s",
+                request.method,
+                request.path,
+                response["X-DB-Duplicate-Queries"],
+            )
+        if stats.slowest_sql is not None:
+            logger.debug("Slowest SQL [%s]: %s", slowest_fingerprint, stats.slowest_sql)
@@ -0,0 +1,76 @@
+"""Create the full-text search index tables (FTS5 on SQLite, tsvector on PostgreSQL)."""
+
+from django.db import migrations
+
+SEARCH_TABLES = {
+    "core_account_search": (
+        "core_account",
+        (("name", "A"), ("account_number", "B"), ("industry", "C")),
+    ),
+    "core_contact_search": (
+        "core_contact",
+        (("first_name", "A"), ("last_name", "A"), ("email", "B"), ("job_title", "C")),
+    ),
+}
+
+
+def _sqlite_has_fts5(cursor):
+    cursor.execute("PRAGMA compile_options")
+    return any(row[0] == "ENABLE_FTS5" for row in cursor.fetchall())
+
+
+def create_search_tables(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            if not _sqlite_has_fts5(cursor):
+                return
+            for table, (source, fields) in SEARCH_TABLES.items():
+                columns = ", ".join(name for name, _ in fields)
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE {table} USING fts5("
+                    f"object_id, {columns}, tokenize='unicode61 remove_diacritics 2')"
+                )
+                cursor.execute(
+                    f"INSERT INTO {table} (object_id, {columns}) "
+                    f"SELECT id, {columns} FROM {source} "
+                    f"WHERE COALESCE(is_invalid, 0) = 0"
+                )
+        elif connection.vendor == "postgresql":
+            for table, (source, fields) in SEARCH_TABLES.items():
+                vector = " || ".join(
+                    f"setweight(to_tsvector('simple', COALESCE({name}, '')), '{weight}')"
+                    for name, weight in fields
+                )
+                cursor.execute(
+                    f"CREATE TABLE {table} ("
+                    f"object_id uuid PRIMARY KEY, document tsvector NOT NULL)"
+                )
+                cursor.execute(
+                    f"CREATE INDEX {table}_document_gin ON {table} USING GIN (document)"
+                )
+                cursor.execute(
+                    f"INSERT INTO {table} (object_id, document) "
+                    f"SELECT id, {vector} FROM {source} "
+                    f"WHERE COALESCE(is_invalid, false) = false"
+                )
+
+
+def drop_search_tables(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor not in ("sqlite", "postgresql"):
+        return
+    with connection.cursor() as cursor:
+        for table in SEARCH_TABLES:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_contact"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_tables, drop_search_tables),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_null_rows_live(apps, schema_editor):
+    """NULL was treated as live; make it explicit before the column turns NOT NULL."""
+    for model_name in ("Account", "Contact"):
+        model = apps.get_model("core", model_name)
+        model.objects.filter(is_invalid__isnull=True).update(is_invalid=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='account',
+            name='core_accoun_owner_u_1c2d7e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='account',
+            name='core_accoun_status_468bae_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='account',
+            name='core_accoun_is_inva_e11738_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='core_contac_account_f87606_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='core_contac_owner_u_b3a177_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='core_contac_role_665f61_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='core_contac_seniori_e1f1c8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='core_contac_is_inva_559876_idx',
+        ),
+        migrations.RunPython(mark_null_rows_live, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='account',
+            name='is_invalid',
+            field=models.BooleanField(blank=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='is_invalid',
+            field=models.BooleanField(blank=True, default=False),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(condition=models.Q(('is_invalid', False)), fields=['owner_user'], name='account_owner_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(condition=models.Q(('is_invalid', False)), fields=['status'], name='account_status_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(condition=models.Q(('is_invalid', False)), fields=['-created_at', '-id'], name='account_created_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_invalid', False)), fields=['account'], name='contact_account_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_invalid', False)), fields=['owner_user'], name='contact_owner_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_invalid', False)), fields=['role'], name='contact_role_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_invalid', False)), fields=['seniority'], name='contact_seniority_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_invalid', False)), fields=['-created_at', '-id'], name='contact_created_live_idx'),
+        ),
+    ]
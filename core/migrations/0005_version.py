@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_live_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -1,7 +1,11 @@
 from .account import Account, AccountStatus, AccountType, CompanySize
+from .archive import ArchivedAccount, ArchivedContact
 from .contact import Contact, ContactRole, ContactSeniority, PreferredChannel
+from .tracking import StaleVersionError
 
 __all__ = [
     "Account", "AccountStatus", "AccountType", "CompanySize",
+    "ArchivedAccount", "ArchivedContact",
     "Contact", "ContactRole", "ContactSeniority", "PreferredChannel",
+    "StaleVersionError",
 ]
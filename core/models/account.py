@@ -5,6 +5,8 @@ from django.db import models
 
 from core.managers import AccountManager
 
+from .tracking import VersionedMixin
+
 
 class AccountStatus(models.TextChoices):
     """Status choices for Account."""
@@ -29,7 +31,7 @@ class CompanySize(models.TextChoices):
     SIZE_200_PLUS = "200+", "200+"
 
 
-class Account(models.Model):
+class Account(VersionedMixin, models.Model):
     """
     Account entity represents a company or organization.
     
@@ -95,7 +97,9 @@ class Account(models.Model):
         blank=True,
         related_name="accounts_updated",
     )
-    is_invalid = models.BooleanField(default=False, null=True, blank=True)
+    is_invalid = models.BooleanField(default=False, blank=True)
+    # Incremented by every service-layer write; checked by conditional updates
+    version = models.PositiveIntegerField(default=1, editable=False)
 
     # Billing Address
     billing_street = models.CharField(max_length=255, blank=True, null=True)
@@ -116,10 +120,30 @@ class Account(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        # Partial indexes: the default manager only reads live rows, so
+        # soft-deleted ones are kept out of the hot indexes
         indexes = [
-            models.Index(fields=["owner_user"]),
-            models.Index(fields=["status"]),
-            models.Index(fields=["is_invalid"]),
+            models.Index(
+                fields=["owner_user"],
+                condition=models.Q(is_invalid=False),
+                name="account_owner_live_idx",
+            ),
+            models.Index(
+                fields=["status"],
+                condition=models.Q(is_invalid=False),
+                name="account_status_live_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_invalid=False),
+                name="account_created_live_idx",
+            ),
+            # Lets the archival job find expired soft-deleted rows without a scan
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(is_invalid=True),
+                name="account_deleted_idx",
+            ),
         ]
 
     def __str__(self) -> str:
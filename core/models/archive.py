@@ -0,0 +1,40 @@
+"""Cold storage for soft-deleted accounts and contacts."""
+
+from django.db import models
+
+
+class ArchivedRecord(models.Model):
+    """
+    Snapshot of a soft-deleted row moved out of its hot table.
+
+    ``data`` maps each concrete field's ``attname`` to the string form
+    Django serializers use (``Field.value_to_string``), so values round-trip
+    exactly through ``Field.to_python`` on restore. The table has no foreign
+    keys: referenced rows may themselves be archived or purged.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    data = models.JSONField()
+    deleted_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        abstract = True
+        ordering = ["-archived_at"]
+
+
+class ArchivedAccount(ArchivedRecord):
+    """Soft-deleted Account moved out of ``core_account``."""
+
+    def __str__(self) -> str:
+        return str(self.data.get("name", self.pk))
+
+
+class ArchivedContact(ArchivedRecord):
+    """Soft-deleted Contact moved out of ``core_contact``."""
+
+    # Kept as a column so restores and purges can follow it without parsing data
+    account_id = models.UUIDField(db_index=True)
+
+    def __str__(self) -> str:
+        return str(self.data.get("first_name", self.pk))
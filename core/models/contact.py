@@ -3,6 +3,10 @@ import uuid
 from django.conf import settings
 from django.db import models
 
+from core.managers import ContactManager
+
+from .tracking import VersionedMixin
+
 
 class ContactRole(models.TextChoices):
     """Role choices for Contact."""
@@ -28,7 +32,7 @@ class PreferredChannel(models.TextChoices):
     NONE = "none", "None"
 
 
-class Contact(models.Model):
+class Contact(VersionedMixin, models.Model):
     """
     Contact entity represents an individual person working at an Account.
 
@@ -93,16 +97,47 @@ class Contact(models.Model):
         blank=True,
         related_name="contacts_updated",
     )
-    is_invalid = models.BooleanField(default=False, null=True, blank=True)
+    is_invalid = models.BooleanField(default=False, blank=True)
+    # Incremented by every service-layer write; checked by conditional updates
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    # Custom Manager
+    objects = ContactManager()
 
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["account"]),
-            models.Index(fields=["owner_user"]),
-            models.Index(fields=["role"]),
-            models.Index(fields=["seniority"]),
-            models.Index(fields=["is_invalid"]),
+            models.Index(
+                fields=["account"],
+                condition=models.Q(is_invalid=False),
+                name="contact_account_live_idx",
+            ),
+            models.Index(
+                fields=["owner_user"],
+                condition=models.Q(is_invalid=False),
+                name="contact_owner_live_idx",
+            ),
+            models.Index(
+                fields=["role"],
+                condition=models.Q(is_invalid=False),
+                name="contact_role_live_idx",
+            ),
+            models.Index(
+                fields=["seniority"],
+                condition=models.Q(is_invalid=False),
+                name="contact_seniority_live_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_invalid=False),
+                name="contact_created_live_idx",
+            ),
+            # Lets the archival job find expired soft-deleted rows without a scan
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(is_invalid=True),
+                name="contact_deleted_idx",
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
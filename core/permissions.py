@@ -13,6 +13,7 @@ class IsAccountOwnerOrAdmin(permissions.BasePermission):
         """
         Allow access to:
         - List and retrieve operations for all authenticated users
+          (the ViewSets scope their querysets with ``visible_to``)
         - Create operations for all authenticated users
         - Update and delete only for owners/admins
         """
@@ -35,11 +36,12 @@ class IsAccountOwnerOrAdmin(permissions.BasePermission):
             return True
 
         # Safe methods (GET, HEAD, OPTIONS) - allow owner
+        # (ids are compared so the owner row is never loaded)
         if request.method in permissions.SAFE_METHODS:
-            return obj.owner_user == request.user
+            return obj.owner_user_id == request.user.pk
 
         # Modification methods (PUT, PATCH, DELETE) - allow owner only
-        return obj.owner_user == request.user
+        return obj.owner_user_id == request.user.pk
 
 
 class IsContactOwnerOrAdmin(permissions.BasePermission):
@@ -54,6 +56,7 @@ class IsContactOwnerOrAdmin(permissions.BasePermission):
         """
         Allow access to:
         - List and retrieve operations for all authenticated users
+          (the ViewSets scope their querysets with ``visible_to``)
         - Create operations for all authenticated users
         - Update and delete only for owners/admins
         """
@@ -76,8 +79,9 @@ class IsContactOwnerOrAdmin(permissions.BasePermission):
             return True
 
         # Safe methods (GET, HEAD, OPTIONS) - allow owner
+        # (ids are compared so the owner row is never loaded)
         if request.method in permissions.SAFE_METHODS:
-            return obj.owner_user == request.user
+            return obj.owner_user_id == request.user.pk
 
         # Modification methods (PUT, PATCH, DELETE) - allow owner only
-        return obj.owner_user == request.user
+        return obj.owner_user_id == request.user.pk
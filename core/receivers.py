@@ -0,0 +1,68 @@
+"""Receivers wiring domain signals to infrastructure (imported in AppConfig.ready)."""
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.cache import bump_generation
+from core.db import apply_sqlite_pragmas
+from core.models import Account, Contact
+from core.search import get_typeahead_index, search_index
+from core.signals import records_changed
+
+
+def _touches(fields, names):
+    """
+    Return whether a write that changed ``fields`` may affect an index
+    built from ``names``; soft-deleting a row always does.
+    """
+    return fields is None or not set(fields).isdisjoint([*names, "is_invalid"])
+
+
+@receiver(records_changed, dispatch_uid="core.search.update_index")
+def update_search_index(sender, pks, fields=None, **kwargs):
+    """Keep the full-text index in step with service-layer writes."""
+    document = search_index.document_for(sender)
+    if document is not None and _touches(fields, [name for name, _ in document.fields]):
+        search_index.update(sender, pks)
+
+
+@receiver(records_changed, dispatch_uid="core.search.update_typeahead")
+def update_typeahead_index(sender, pks, fields=None, **kwargs):
+    """Refresh in-memory typeahead entries once the write has committed."""
+    index = get_typeahead_index(sender)
+    if index is not None and _touches(fields, [*index.fields, "owner_user"]):
+        transaction.on_commit(
+            lambda: index.update(pks), using=router.db_for_write(sender)
+        )
+
+
+@receiver(records_changed, dispatch_uid="core.cache.bump_generation")
+def invalidate_list_cache(sender, **kwargs):
+    """Bump the model's cache generation once the write has committed."""
+    transaction.on_commit(
+        lambda: bump_generation(sender), using=router.db_for_write(sender)
+    )
+
+
+@receiver(post_save, sender=Account, dispatch_uid="core.cache.account_saved")
+@receiver(post_save, sender=Contact, dispatch_uid="core.cache.contact_saved")
+@receiver(post_delete, sender=Account, dispatch_uid="core.cache.account_deleted")
+@receiver(post_delete, sender=Contact, dispatch_uid="core.cache.contact_deleted")
+def invalidate_list_cache_on_model_write(sender, using, **kwargs):
+    """
+    Bump the generation for writes that bypass the services too (admin
+    edits, direct ORM saves in sync jobs); queryset ``update()`` still
+    relies on ``records_changed``.
+    """
+    transaction.on_commit(lambda: bump_generation(sender), using=using)
+
+
+@receiver(connection_created, dispatch_uid="core.db.sqlite_pragmas")
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """Apply ``SQLITE_PRAGMAS`` to every new SQLite connection."""
+    if connection.vendor == "sqlite" and settings.SQLITE_PRAGMAS:
+        with connection.cursor() as cursor:
+            apply_sqlite_pragmas(cursor, settings.SQLITE_PRAGMAS)
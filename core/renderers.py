@@ -0,0 +1,89 @@
+"""
+Fast renderers for the API.
+
+``ORJSONRenderer`` is a drop-in for DRF's ``JSONRenderer`` built on
+``orjson``, which encodes UUIDs and datetimes natively. ``MessagePackRenderer``
+serves ``application/msgpack`` for service-to-service clients. Both are
+optional: ``mycrm/settings.py`` only enables them when their library is
+installed, and DRF's stdlib-``json`` renderer stays the fallback.
+"""
+
+import decimal
+import uuid
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """Encode types the fast encoders do not know, as DRF's JSONEncoder does."""
+    return _fallback_encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    ``application/json`` via ``orjson``, with the same output as ``JSONRenderer``.
+
+    Compact output only: ``indent=`` requests (e.g. from the browsable API)
+    and ``UNICODE_JSON = False`` fall back to ``JSONRenderer``.
+    """
+
+    options = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render ``data`` into JSON bytes."""
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_default, option=self.options)
+        # Keep JSONRenderer's escaping of U+2028/U+2029 for JavaScript safety
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+def _msgpack_default(obj):
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    return _default(obj)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    ``application/msgpack`` renderer.
+
+    Aware datetimes are packed as the MessagePack timestamp extension;
+    UUIDs and Decimals as strings, matching their JSON representation.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render ``data`` into MessagePack bytes."""
+        if data is None:
+            return b""
+        return msgpack.packb(
+            data, default=_msgpack_default, use_bin_type=True, datetime=True
+        )
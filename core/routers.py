@@ -0,0 +1,87 @@
+"""
+Database router sending CRM reads to read replicas and writes to the primary.
+
+Reads of ``core`` models go to one of ``settings.DATABASE_REPLICAS`` unless
+the primary must be used to read our own writes:
+
+* inside a transaction on the primary (services' ``@transaction.atomic``
+  blocks read what they are about to write);
+* while ``use_primary()`` is active (``ReadYourWritesMiddleware`` wraps
+  every unsafe request in it);
+* for ``REPLICA_STICKY_SECONDS`` after this context last wrote. The
+  middleware carries that deadline across requests in a cookie.
+
+Other apps (auth, sessions) always use the primary, so logins and session
+reads never see replica lag.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, router
+
+ROUTED_APP_LABELS = ("core",)
+
+_primary_until: ContextVar[float] = ContextVar("primary_until", default=0.0)
+_force_primary: ContextVar[bool] = ContextVar("force_primary", default=False)
+
+
+def get_primary_until() -> float:
+    """Return the epoch time until which reads stick to the primary."""
+    return _primary_until.get()
+
+
+def set_primary_until(until: float):
+    """Set the stickiness deadline; returns a token for ``reset_primary_until``."""
+    return _primary_until.set(until)
+
+
+def reset_primary_until(token) -> None:
+    """Restore the stickiness deadline in effect before ``set_primary_until``."""
+    _primary_until.reset(token)
+
+
+def reads_from_replica(model) -> bool:
+    """Return whether reads of ``model`` in this context are sent to a replica."""
+    return router.db_for_read(model) != DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def use_primary():
+    """Route every read in the block to the primary."""
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Route reads of ``core`` models to a replica and all writes to the primary."""
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or model._meta.app_label not in ROUTED_APP_LABELS:
+            return None
+        if (
+            _force_primary.get()
+            or _primary_until.get() > time.time()
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        if settings.DATABASE_REPLICAS and model._meta.app_label in ROUTED_APP_LABELS:
+            _primary_until.set(time.time() + settings.REPLICA_STICKY_SECONDS)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
@@ -0,0 +1,6 @@
+"""Full-text search and typeahead indexes kept in sync by the service layer."""
+
+from .index import SearchIndex, search_index
+from .typeahead import TypeaheadIndex, get_typeahead_index
+
+__all__ = ["SearchIndex", "TypeaheadIndex", "get_typeahead_index", "search_index"]
@@ -0,0 +1,282 @@
+"""Vendor-specific full-text index backends (SQLite FTS5, PostgreSQL tsvector)."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable, Optional
+
+from django.db.models import Expression, F, FloatField
+from django.db.models.expressions import RawSQL
+
+from .documents import BM25_WEIGHTS, SearchDocument
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit.
+BATCH_SIZE = 500
+
+
+def tokenize(terms: Iterable[str]) -> list[str]:
+    """Split raw search terms into safe word tokens (no query operators)."""
+    tokens = []
+    for term in terms:
+        tokens.extend(token.lower() for token in TOKEN_RE.findall(term))
+    return tokens
+
+
+def _batches(values: list[Any]) -> Iterable[list[Any]]:
+    for start in range(0, len(values), BATCH_SIZE):
+        yield values[start : start + BATCH_SIZE]
+
+
+class SearchBackend:
+    """Base class: maintains per-model index tables and answers ranked queries."""
+
+    vendor: Optional[str] = None
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._available_tables: set[str] = set()
+
+    def is_available(self, document: SearchDocument) -> bool:
+        """Return True if the index table for this document exists."""
+        if document.table in self._available_tables:
+            return True
+        if document.table in self.connection.introspection.table_names():
+            self._available_tables.add(document.table)
+            return True
+        return False
+
+    def update(self, document: SearchDocument, model, pks: list[Any]) -> None:
+        """Re-index the given rows; rows that are missing or soft-deleted are dropped."""
+        db_pks = [self._db_pk(model, pk) for pk in pks]
+        with self.connection.cursor() as cursor:
+            for batch in _batches(db_pks):
+                self._delete(cursor, document, batch)
+                self._insert(cursor, document, model, batch)
+
+    def rebuild(self, document: SearchDocument, model) -> None:
+        """Drop and repopulate the whole index for a model."""
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self._quote(document.table)}")
+            self._insert(cursor, document, model, None)
+
+    def search(
+        self, document: SearchDocument, model, terms: Iterable[str], limit: int
+    ) -> list[Any]:
+        """Return primary keys matching all terms (prefix match), best first."""
+        tokens = tokenize(terms)
+        if not tokens:
+            return []
+        where, where_params, rank, rank_params = self._match(document, tokens)
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT object_id FROM {self._quote(document.table)} "
+                f"WHERE {where} ORDER BY {rank} LIMIT %s",
+                [*where_params, *rank_params, limit],
+            )
+            return [model._meta.pk.to_python(row[0]) for row in cursor.fetchall()]
+
+    def filter(self, document: SearchDocument, queryset, terms: Iterable[str]):
+        """
+        Restrict ``queryset`` to rows matching all terms and annotate ``search_rank``.
+
+        The match is a ``pk IN (SELECT object_id ...)`` subquery and the rank
+        a correlated subquery on the row's key, so scoping and filters
+        already applied bound the result (no capped pk list) and the
+        queryset can still be nested in other queries. Lower
+        ``search_rank`` is more relevant.
+        """
+        tokens = tokenize(terms)
+        if not tokens:
+            return queryset.none()
+        where, where_params, _, _ = self._match(document, tokens)
+        matches = RawSQL(
+            f"SELECT object_id FROM {self._quote(document.table)} WHERE {where}",
+            where_params,
+        )
+        return queryset.filter(pk__in=matches).annotate(
+            search_rank=SearchRank(self, document, tokens)
+        )
+
+    # ===== Vendor Hooks =====
+
+    def _delete(self, cursor, document, db_pks):
+        raise NotImplementedError
+
+    def _insert(self, cursor, document, model, db_pks):
+        raise NotImplementedError
+
+    def _match(self, document, tokens):
+        """Return ``(where, where_params, rank, rank_params)`` on the index table."""
+        raise NotImplementedError
+
+    def _rank_of(self, document, tokens, object_id_sql):
+        """Return ``(sql, params)`` selecting the rank of the row ``object_id_sql``."""
+        raise NotImplementedError
+
+    # ===== Helpers =====
+
+    def _quote(self, name: str) -> str:
+        return self.connection.ops.quote_name(name)
+
+    def _db_pk(self, model, pk):
+        return model._meta.pk.get_db_prep_value(pk, self.connection)
+
+    def _source(self, model, db_pks):
+        """Return ``(FROM/WHERE sql, params)`` selecting live source rows."""
+        opts = model._meta
+        where = f"COALESCE({self._quote(opts.get_field('is_invalid').column)}, %s) = %s"
+        params: list[Any] = [False, False]
+        if db_pks is not None:
+            placeholders = ", ".join(["%s"] * len(db_pks))
+            where += f" AND {self._quote(opts.pk.column)} IN ({placeholders})"
+            params.extend(db_pks)
+        return f"FROM {self._quote(opts.db_table)} WHERE {where}", params
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    SQLite FTS5 backend.
+
+    Each index table is an FTS5 virtual table whose first column holds the
+    row's primary key. Deletes locate entries with a ``MATCH`` on that column
+    so they use the FTS index instead of scanning the table.
+    """
+
+    vendor = "sqlite"
+
+    def _delete(self, cursor, document, db_pks):
+        table = self._quote(document.table)
+        ids = " OR ".join(f'"{pk}"' for pk in db_pks)
+        cursor.execute(
+            f"DELETE FROM {table} WHERE rowid IN "
+            f"(SELECT rowid FROM {table} WHERE {table} MATCH %s)",
+            [f"object_id : ({ids})"],
+        )
+
+    def _insert(self, cursor, document, model, db_pks):
+        opts = model._meta
+        columns = [name for name, _ in document.fields]
+        source_sql, params = self._source(model, db_pks)
+        select = ", ".join(
+            [self._quote(opts.pk.column)]
+            + [self._quote(opts.get_field(name).column) for name in columns]
+        )
+        cursor.execute(
+            f"INSERT INTO {self._quote(document.table)} "
+            f"(object_id, {', '.join(columns)}) SELECT {select} {source_sql}",
+            params,
+        )
+
+    def _match(self, document, tokens):
+        table = self._quote(document.table)
+        columns = " ".join(name for name, _ in document.fields)
+        expression = " AND ".join(f'"{token}"*' for token in tokens)
+        weights = ", ".join(
+            ["0"] + [str(BM25_WEIGHTS[weight]) for _, weight in document.fields]
+        )
+        # bm25() is negative; lower is more relevant
+        return (
+            f"{table} MATCH %s",
+            [f"{{{columns}}} : ({expression})"],
+            f"bm25({table}, {weights})",
+            [],
+        )
+
+    def _rank_of(self, document, tokens, object_id_sql):
+        table = self._quote(document.table)
+        _, (match,), rank, _ = self._match(document, tokens)
+        # Adding the row's key to the MATCH lets FTS5 intersect posting lists
+        # instead of evaluating the whole match for every row
+        return (
+            f"SELECT {rank} FROM {table} "
+            f"WHERE {table} MATCH (%s || {object_id_sql} || '\"')",
+            [f'{match} AND object_id : "'],
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    PostgreSQL backend.
+
+    Each index table stores one weighted ``tsvector`` per row (``simple``
+    configuration, so names and e-mails are not stemmed) behind a GIN index.
+    """
+
+    vendor = "postgresql"
+
+    def _delete(self, cursor, document, db_pks):
+        placeholders = ", ".join(["%s"] * len(db_pks))
+        cursor.execute(
+            f"DELETE FROM {self._quote(document.table)} "
+            f"WHERE object_id IN ({placeholders})",
+            db_pks,
+        )
+
+    def _insert(self, cursor, document, model, db_pks):
+        opts = model._meta
+        vector = " || ".join(
+            f"setweight(to_tsvector('simple', "
+            f"COALESCE({self._quote(opts.get_field(name).column)}, '')), '{weight}')"
+            for name, weight in document.fields
+        )
+        source_sql, params = self._source(model, db_pks)
+        cursor.execute(
+            f"INSERT INTO {self._quote(document.table)} (object_id, document) "
+            f"SELECT {self._quote(opts.pk.column)}, {vector} {source_sql}",
+            params,
+        )
+
+    def _match(self, document, tokens):
+        table = self._quote(document.table)
+        query = " & ".join(f"{token}:*" for token in tokens)
+        return (
+            f"{table}.document @@ to_tsquery('simple', %s)",
+            [query],
+            f"-ts_rank({table}.document, to_tsquery('simple', %s))",
+            [query],
+        )
+
+    def _rank_of(self, document, tokens, object_id_sql):
+        _, _, rank, rank_params = self._match(document, tokens)
+        table = self._quote(document.table)
+        return (
+            f"SELECT {rank} FROM {table} WHERE {table}.object_id = {object_id_sql}",
+            rank_params,
+        )
+
+
+class SearchRank(Expression):
+    """
+    Relevance of each row for a search, as a correlated subquery on the index.
+
+    The row's key is a source expression (not raw SQL), so the ORM
+    relabels it when the queryset is nested in another query.
+    """
+
+    output_field = FloatField()
+
+    def __init__(self, backend: SearchBackend, document: SearchDocument, tokens, pk=None):
+        super().__init__()
+        self.backend = backend
+        self.document = document
+        self.tokens = tokens
+        self.pk = pk if pk is not None else F("pk")
+
+    def get_source_expressions(self):
+        return [self.pk]
+
+    def set_source_expressions(self, exprs):
+        (self.pk,) = exprs
+
+    def as_sql(self, compiler, connection):
+        pk_sql, pk_params = compiler.compile(self.pk)
+        sql, params = self.backend._rank_of(self.document, self.tokens, pk_sql)
+        # The key appears after the rank parameters in both vendors' SQL
+        return f"({sql})", [*params, *pk_params]
+
+
+BACKENDS = {
+    backend.vendor: backend for backend in (SQLiteSearchBackend, PostgresSearchBackend)
+}
@@ -0,0 +1,42 @@
+"""Declarations of which model fields are full-text indexed, and how."""
+
+from typing import NamedTuple
+
+
+class SearchDocument(NamedTuple):
+    """
+    Full-text index definition for one model.
+
+    ``fields`` pairs each indexed column with a weight class (``A`` highest
+    to ``D`` lowest), used for ``setweight`` on PostgreSQL and as ``bm25``
+    column weights on SQLite. ``table`` is the index table that the
+    ``0003_search_index`` migration creates for the model.
+    """
+
+    model_label: str
+    table: str
+    fields: tuple[tuple[str, str], ...]
+
+
+BM25_WEIGHTS = {"A": 10.0, "B": 5.0, "C": 2.0, "D": 1.0}
+
+ACCOUNT_DOCUMENT = SearchDocument(
+    model_label="core.account",
+    table="core_account_search",
+    fields=(("name", "A"), ("account_number", "B"), ("industry", "C")),
+)
+
+CONTACT_DOCUMENT = SearchDocument(
+    model_label="core.contact",
+    table="core_contact_search",
+    fields=(
+        ("first_name", "A"),
+        ("last_name", "A"),
+        ("email", "B"),
+        ("job_title", "C"),
+    ),
+)
+
+SEARCH_DOCUMENTS = {
+    document.model_label: document for document in (ACCOUNT_DOCUMENT, CONTACT_DOCUMENT)
+}
@@ -0,0 +1,85 @@
+"""Entry point used by services and API filters to reach the search index."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.db import connections, router
+
+from .backends import BACKENDS, SearchBackend
+from .documents import SEARCH_DOCUMENTS, SearchDocument
+
+
+class SearchIndex:
+    """Dispatch index maintenance and queries to the backend of each database."""
+
+    def __init__(self):
+        self._backends: dict[str, Optional[SearchBackend]] = {}
+
+    def get_backend(self, using: str) -> Optional[SearchBackend]:
+        """Return the backend for a database alias, or None if unsupported."""
+        if using not in self._backends:
+            connection = connections[using]
+            backend_class = BACKENDS.get(connection.vendor)
+            self._backends[using] = backend_class(connection) if backend_class else None
+        return self._backends[using]
+
+    def document_for(self, model) -> Optional[SearchDocument]:
+        """Return the index definition for a model, if it is indexed."""
+        return SEARCH_DOCUMENTS.get(model._meta.label_lower)
+
+    def update(self, model, pks: Iterable[Any]) -> None:
+        """Re-index rows after a write; no-op when the index is unavailable."""
+        pks = list(pks)
+        document, backend = self._resolve(model, router.db_for_write(model))
+        if document is None or not pks:
+            return
+        backend.update(document, model, pks)
+
+    def rebuild(self, model) -> bool:
+        """Rebuild the index for a model; return False if unavailable."""
+        document, backend = self._resolve(model, router.db_for_write(model))
+        if document is None:
+            return False
+        backend.rebuild(document, model)
+        return True
+
+    def search(
+        self, model, terms: Iterable[str], using: str, limit: Optional[int] = None
+    ) -> Optional[list[Any]]:
+        """
+        Return ranked primary keys for the terms.
+
+        Returns None if the model has no usable index on this database, so
+        callers can fall back to ``icontains`` matching.
+        """
+        document, backend = self._resolve(model, using)
+        if document is None:
+            return None
+        if limit is None:
+            limit = settings.SEARCH_MAX_RESULTS
+        return backend.search(document, model, terms, limit)
+
+    def filter(self, queryset, terms: Iterable[str]):
+        """
+        Return ``queryset`` narrowed to rows matching the terms, with a
+        ``search_rank`` annotation (lower is better).
+
+        Returns None if the model has no usable index on the queryset's
+        database, so callers can fall back to ``icontains`` matching.
+        """
+        document, backend = self._resolve(queryset.model, queryset.db)
+        if document is None:
+            return None
+        return backend.filter(document, queryset, terms)
+
+    def _resolve(self, model, using):
+        document = self.document_for(model)
+        backend = self.get_backend(using)
+        if document is None or backend is None or not backend.is_available(document):
+            return None, None
+        return document, backend
+
+
+search_index = SearchIndex()
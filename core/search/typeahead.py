@@ -0,0 +1,238 @@
+"""In-process prefix index serving name typeahead without touching the database."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+from django.apps import apps
+from django.conf import settings
+
+
+class TypeaheadEntry(NamedTuple):
+    """One indexed row: its id, display label and owner (for visibility)."""
+
+    pk: Any
+    label: str
+    owner_id: Optional[int]
+
+
+class PrefixIndex:
+    """
+    Sorted array of ``(key, pk)`` pairs answering prefix queries with ``bisect``.
+
+    Every word start of a label is a key, so ``"corp"`` finds
+    ``"Acme Corporation"``. Lookups are ``O(log n + k)``.
+    """
+
+    def __init__(self):
+        self._keys: list[tuple[str, str]] = []
+        self._pks: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._pks)
+
+    def add(self, pk: Any, label: str) -> None:
+        """Index a label under every word start."""
+        token = str(pk)
+        self._pks[token] = pk
+        for key in _word_keys(label):
+            bisect.insort(self._keys, (key, token))
+
+    def add_many(self, items: Iterable[tuple[Any, str]]) -> None:
+        """Index many ``(pk, label)`` pairs with a single sort."""
+        keys = []
+        for pk, label in items:
+            token = str(pk)
+            self._pks[token] = pk
+            keys.extend((key, token) for key in _word_keys(label))
+        self._keys.extend(keys)
+        self._keys.sort()
+
+    def remove(self, pk: Any, label: str) -> None:
+        """Remove a label previously added for pk."""
+        token = str(pk)
+        self._pks.pop(token, None)
+        for key in _word_keys(label):
+            position = bisect.bisect_left(self._keys, (key, token))
+            if position < len(self._keys) and self._keys[position] == (key, token):
+                del self._keys[position]
+
+    def search(self, prefix: str, limit: int) -> list[Any]:
+        """Return up to ``limit`` distinct pks whose label has a word starting with prefix."""
+        prefix = _normalize(prefix)
+        results: list[Any] = []
+        seen: set[str] = set()
+        position = bisect.bisect_left(self._keys, (prefix, ""))
+        while position < len(self._keys) and len(results) < limit:
+            key, token = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            if token not in seen:
+                seen.add(token)
+                results.append(self._pks[token])
+            position += 1
+        return results
+
+
+class TypeaheadIndex:
+    """
+    Typeahead index for one model, with a global and a per-owner prefix index.
+
+    Built from the database on first use (and again after
+    ``TYPEAHEAD_REFRESH_SECONDS`` so other workers' writes become visible),
+    then updated incrementally from service-layer writes. Refreshes are
+    single-flight: one request rebuilds while the others keep serving the
+    previous index (or wait for it on the very first build).
+    """
+
+    def __init__(self, model_label: str, fields: tuple[str, ...], label: Callable):
+        self.model_label = model_label
+        self.fields = fields
+        self.label = label
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._reset()
+
+    def search(
+        self, prefix: str, limit: int, owner_id: Optional[int] = None
+    ) -> list[TypeaheadEntry]:
+        """
+        Return the top ``limit`` entries matching prefix.
+
+        Pass ``owner_id`` to restrict matches to rows owned by that user.
+        """
+        if not prefix.strip():
+            return []
+        self._ensure_fresh()
+        with self._lock:
+            if owner_id is None:
+                index = self._all
+            else:
+                index = self._by_owner.get(owner_id)
+                if index is None:
+                    return []
+            return [self._entries[str(pk)] for pk in index.search(prefix, limit)]
+
+    def update(self, pks: Iterable[Any]) -> None:
+        """Re-read the given rows and upsert or drop them."""
+        pks = list(pks)
+        if self._loaded_at is None or not pks:
+            return
+        rows = {str(row[0]): row for row in self._rows(pk__in=pks)}
+        with self._lock:
+            for pk in pks:
+                self._discard(pk)
+                row = rows.get(str(pk))
+                if row is not None:
+                    self._add(self._entry(row))
+
+    def rebuild(self) -> None:
+        """Reload the whole index from the database."""
+        entries = [self._entry(row) for row in self._rows()]
+        by_owner_entries = defaultdict(list)
+        for entry in entries:
+            by_owner_entries[entry.owner_id].append((entry.pk, entry.label))
+        all_index = PrefixIndex()
+        all_index.add_many((entry.pk, entry.label) for entry in entries)
+        by_owner = {}
+        for owner_id, items in by_owner_entries.items():
+            by_owner[owner_id] = PrefixIndex()
+            by_owner[owner_id].add_many(items)
+
+        with self._lock:
+            self._entries = {str(entry.pk): entry for entry in entries}
+            self._all = all_index
+            self._by_owner = by_owner
+            self._loaded_at = time.monotonic()
+
+    def clear(self) -> None:
+        """Drop all entries; the next search rebuilds from the database."""
+        with self._lock:
+            self._reset()
+            self._loaded_at = None
+
+    # ===== Helpers =====
+
+    def _is_stale(self) -> bool:
+        refresh = settings.TYPEAHEAD_REFRESH_SECONDS
+        loaded_at = self._loaded_at
+        return loaded_at is None or bool(refresh and time.monotonic() - loaded_at > refresh)
+
+    def _ensure_fresh(self):
+        if not self._is_stale():
+            return
+        # Only wait for another request's rebuild when there is nothing to serve yet
+        if not self._refresh_lock.acquire(blocking=self._loaded_at is None):
+            return
+        try:
+            if self._is_stale():
+                self.rebuild()
+        finally:
+            self._refresh_lock.release()
+
+    def _rows(self, **filters):
+        model = apps.get_model(self.model_label)
+        queryset = model._base_manager.exclude(is_invalid=True).filter(**filters)
+        return queryset.values_list("pk", "owner_user_id", *self.fields).iterator(
+            chunk_size=2000
+        )
+
+    def _entry(self, row) -> TypeaheadEntry:
+        return TypeaheadEntry(pk=row[0], owner_id=row[1], label=self.label(*row[2:]))
+
+    def _reset(self):
+        self._entries: dict[str, TypeaheadEntry] = {}
+        self._all = PrefixIndex()
+        self._by_owner: dict[Optional[int], PrefixIndex] = {}
+
+    def _add(self, entry: TypeaheadEntry):
+        self._entries[str(entry.pk)] = entry
+        self._all.add(entry.pk, entry.label)
+        self._by_owner.setdefault(entry.owner_id, PrefixIndex()).add(
+            entry.pk, entry.label
+        )
+
+    def _discard(self, pk):
+        entry = self._entries.pop(str(pk), None)
+        if entry is None:
+            return
+        self._all.remove(entry.pk, entry.label)
+        owner_index = self._by_owner.get(entry.owner_id)
+        if owner_index is not None:
+            owner_index.remove(entry.pk, entry.label)
+            if not owner_index:
+                del self._by_owner[entry.owner_id]
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.casefold().split())
+
+
+def _word_keys(label: str) -> list[str]:
+    """Return the label suffixes starting at each word, e.g. ``acme corp``, ``corp``."""
+    words = _normalize(label).split(" ")
+    return [" ".join(words[index:]) for index in range(len(words)) if words[index]]
+
+
+def _full_name(first_name: str, last_name: Optional[str]) -> str:
+    if last_name:
+        return f"{first_name} {last_name}"
+    return first_name
+
+
+TYPEAHEAD_INDEXES = {
+    "core.account": TypeaheadIndex("core.account", ("name",), lambda name: name),
+    "core.contact": TypeaheadIndex(
+        "core.contact", ("first_name", "last_name"), _full_name
+    ),
+}
+
+
+def get_typeahead_index(model) -> Optional[TypeaheadIndex]:
+    """Return the typeahead index for a model class, if it has one."""
+    return TYPEAHEAD_INDEXES.get(model._meta.label_lower)
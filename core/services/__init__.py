@@ -1,4 +1,4 @@
 """Business logic and infrastructure services."""
-from .domain import AccountService, ContactService
+from .domain import AccountService, ArchiveCounts, ArchiveService, ContactService
 
-__all__ = ["AccountService", "ContactService"]
+__all__ = ["AccountService", "ArchiveCounts", "ArchiveService", "ContactService"]
@@ -1,5 +1,6 @@
 """Domain/Business services that orchestrate database operations."""
 from .account_service import AccountService
+from .archive_service import ArchiveCounts, ArchiveService
 from .contact_service import ContactService
 
-__all__ = ["AccountService", "ContactService"]
+__all__ = ["AccountService", "ArchiveCounts", "ArchiveService", "ContactService"]
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
-from core.models import Account
+from core.models import Account, Contact
+from core.signals import (
+    RECORDS_CREATED,
+    RECORDS_DELETED,
+    RECORDS_UPDATED,
+    records_changed,
+)
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser as User
@@ -17,14 +27,69 @@ class AccountService:
     """Service layer for Account business logic."""
 
     @staticmethod
-    def list_accounts() -> Any:
-        """Retrieve all accounts."""
-        return Account.objects.all()
+    def list_accounts(
+        fields: Optional[list[str]] = None,
+        include: Iterable[str] = (),
+        user: Optional[User] = None,
+    ) -> Any:
+        """
+        Retrieve all accounts, loading only ``fields`` when given.
+
+        When ``user`` is given, only accounts visible to them are returned
+        (see ``AccountQuerySet.visible_to``), and included contact data is
+        limited to contacts visible to them; the scope is part of the SQL.
+
+        ``include`` adds related data inside the same query set:
+        ``contact_count`` annotates the number of live contacts with a
+        correlated subquery, and ``primary_contact`` prefetches live primary
+        contacts (newest first) into ``primary_contacts`` with one query per
+        page of accounts.
+        """
+        queryset = Account.objects.all()
+        contacts = Contact.objects.all()
+        if user is not None:
+            queryset = queryset.visible_to(user)
+            contacts = contacts.visible_to(user)
+        if fields:
+            queryset = queryset.only(*fields)
+        if "contact_count" in include:
+            contact_counts = (
+                contacts.for_account(OuterRef("pk"))
+                .order_by()
+                .values("account")
+                .annotate(count=Count("pk"))
+                .values("count")
+            )
+            queryset = queryset.annotate(
+                contact_count=Coalesce(
+                    Subquery(contact_counts, output_field=IntegerField()), 0
+                )
+            )
+        if "primary_contact" in include:
+            primary_contacts = (
+                contacts.primary()
+                .only("id", "account", "first_name", "last_name", "email", "phone", "job_title")
+                .order_by("-updated_at")
+            )
+            queryset = queryset.prefetch_related(
+                Prefetch("contacts", queryset=primary_contacts, to_attr="primary_contacts")
+            )
+        return queryset
 
     @staticmethod
-    def get_account(account_id: str) -> Account:
-        """Retrieve a single account by ID."""
-        return get_object_or_404(Account, id=account_id)
+    def get_account(
+        account_id: str,
+        fields: Optional[list[str]] = None,
+        user: Optional[User] = None,
+    ) -> Account:
+        """
+        Retrieve a single account by ID, loading only ``fields`` when given.
+
+        Accounts not visible to ``user`` (when given) raise ``Http404``.
+        """
+        return get_object_or_404(
+            AccountService.list_accounts(fields, user=user), id=account_id
+        )
 
     @staticmethod
     @transaction.atomic
@@ -35,29 +100,120 @@ class AccountService:
             created_by=user,
             **data,
         )
+        records_changed.send(sender=Account, pks=[account.pk], action=RECORDS_CREATED)
         return account
 
+    @staticmethod
+    @transaction.atomic
+    def bulk_create_accounts(
+        rows: list[dict[str, Any]], user: User, batch_size: Optional[int] = None
+    ) -> list[Account]:
+        """
+        Create many validated accounts in one transaction.
+
+        Rows are inserted with ``bulk_create`` in chunks of ``batch_size``
+        (default ``settings.BULK_CREATE_BATCH_SIZE``).
+        """
+        accounts = Account.objects.bulk_create(
+            [Account(owner_user=user, created_by=user, **data) for data in rows],
+            batch_size=batch_size or settings.BULK_CREATE_BATCH_SIZE,
+        )
+        records_changed.send(
+            sender=Account,
+            pks=[account.pk for account in accounts],
+            action=RECORDS_CREATED,
+        )
+        return accounts
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_update_accounts(
+        queryset: Any,
+        data: dict[str, Any],
+        user: User,
+        batch_size: Optional[int] = None,
+        max_rows: Optional[int] = None,
+    ) -> int:
+        """
+        Apply one validated field patch to the accounts in ``queryset``.
+
+        The queryset is narrowed to accounts visible to ``user``, so ownership
+        is part of every UPDATE's WHERE clause. Matching keys are read once
+        and written with one set-based ``UPDATE`` per ``batch_size`` rows
+        (default ``settings.BULK_UPDATE_BATCH_SIZE``), which also sets
+        ``updated_by``, ``updated_at`` and ``version``; no per-row ``save()``
+        runs.
+        Raises ``ValueError`` without writing when more than ``max_rows``
+        (default ``settings.BULK_UPDATE_MAX_IDS``) accounts match.
+        Returns the number of accounts updated.
+        """
+        queryset = queryset.visible_to(user).order_by()
+        max_rows = max_rows or settings.BULK_UPDATE_MAX_IDS
+        pks = list(queryset.values_list("pk", flat=True)[: max_rows + 1])
+        if len(pks) > max_rows:
+            raise ValueError(f"More than {max_rows} accounts match; narrow the selection.")
+        batch_size = batch_size or settings.BULK_UPDATE_BATCH_SIZE
+        values = {
+            **data,
+            "updated_by": user,
+            "updated_at": timezone.now(),
+            "version": F("version") + 1,
+        }
+
+        updated = 0
+        for start in range(0, len(pks), batch_size):
+            batch = pks[start:start + batch_size]
+            updated += queryset.filter(pk__in=batch).update(**values)
+        if pks:
+            records_changed.send(
+                sender=Account, pks=pks, action=RECORDS_UPDATED, fields=list(data)
+            )
+        return updated
+
     @staticmethod
     @transaction.atomic
     def update_account(account: Account, data: dict[str, Any], user: User) -> Account:
-        """Update an account with business logic enforcement."""
+        """
+        Update an account with business logic enforcement.
+
+        Only the columns whose values changed are written, together with
+        the audit fields; when nothing changed the row is not written and
+        ``updated_at`` keeps its value. The changed field names are left in
+        ``account.changed_fields`` for the caller and sent as ``fields`` with
+        ``records_changed``.
+
+        The write is conditional on the account's loaded ``version`` (see
+        ``VersionedMixin``): if another writer got there first, nothing is
+        written and ``StaleVersionError`` is raised.
+        """
         # Remove immutable fields
-        for field in ["id", "created_at", "created_by"]:
+        for field in ["id", "created_at", "created_by", "version"]:
             data.pop(field, None)
 
-        # Set audit field and update
-        data["updated_by"] = user
-        for field, value in data.items():
-            setattr(account, field, value)
+        changed = list(account.apply_changes(data))
+        if not changed:
+            return account
 
-        account.save()
+        # Set audit field and update
+        account.updated_by = user
+        account.updated_at = timezone.now()
+        account.save_versioned([*changed, "updated_by", "updated_at"])
+        records_changed.send(
+            sender=Account, pks=[account.pk], action=RECORDS_UPDATED, fields=changed
+        )
         return account
 
     @staticmethod
     @transaction.atomic
     def soft_delete_account(account: Account, user: User) -> Account:
-        """Soft-delete an account by setting is_invalid=True."""
+        """
+        Soft-delete an account by setting is_invalid=True.
+
+        Like updates, the write is conditional on the loaded ``version``.
+        """
         account.is_invalid = True
         account.updated_by = user
-        account.save()
+        account.updated_at = timezone.now()
+        account.save_versioned(["is_invalid", "updated_by", "updated_at"])
+        records_changed.send(sender=Account, pks=[account.pk], action=RECORDS_DELETED)
         return account
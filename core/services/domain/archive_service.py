@@ -0,0 +1,253 @@
+"""Business logic service for archiving soft-deleted accounts and contacts."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any, Iterable, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef, ProtectedError
+from django.utils import timezone
+
+from core.models import Account, ArchivedAccount, ArchivedContact, Contact
+from core.signals import RECORDS_CREATED, RECORDS_UPDATED, records_changed
+
+
+class ArchiveCounts(NamedTuple):
+    """Number of accounts and contacts handled by an archive operation."""
+
+    accounts: int
+    contacts: int
+
+
+class ArchiveService:
+    """
+    Move soft-deleted rows between the hot tables and the archive tables.
+
+    ``Contact.account`` is ``PROTECT``, so every path keeps the hot tables
+    consistent: contacts are archived before accounts and an account is
+    only archived once no contact row references it; restoring a contact
+    restores (or revives) its account first; and archived accounts are
+    only purged once no archived contact refers to them.
+    """
+
+    @staticmethod
+    def archive_deleted(
+        retention_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> ArchiveCounts:
+        """
+        Archive rows soft-deleted more than ``retention_days`` ago.
+
+        Each batch of at most ``batch_size`` rows is copied and deleted in
+        its own transaction, so locks stay short and an interrupted run
+        loses nothing. An account given a contact after it was selected is
+        skipped and stays in the hot table. ``max_batches`` bounds the work
+        per model and run.
+        Defaults come from ``ARCHIVE_RETENTION_DAYS``/``ARCHIVE_BATCH_SIZE``.
+        """
+        if retention_days is None:
+            retention_days = settings.ARCHIVE_RETENTION_DAYS
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+
+        expired_contacts = Contact.objects.with_deleted().filter(
+            is_invalid=True, updated_at__lt=cutoff
+        )
+        contacts = _archive_batches(
+            expired_contacts,
+            ArchivedContact,
+            lambda contact: {"account_id": contact.account_id},
+            batch_size,
+            max_batches,
+        )
+        expired_accounts = Account.objects.with_deleted().filter(
+            ~Exists(Contact.objects.with_deleted().filter(account=OuterRef("pk"))),
+            is_invalid=True,
+            updated_at__lt=cutoff,
+        )
+        accounts = _archive_batches(
+            expired_accounts, ArchivedAccount, lambda account: {}, batch_size, max_batches
+        )
+        return ArchiveCounts(accounts=accounts, contacts=contacts)
+
+    @staticmethod
+    @transaction.atomic
+    def restore_accounts(account_ids: Iterable[Any]) -> list[Account]:
+        """
+        Move archived accounts back into the hot table as live rows.
+
+        Their archived contacts stay archived. Raises ``IntegrityError``
+        if another account has taken the account number meanwhile.
+        """
+        archived = list(ArchivedAccount.objects.filter(pk__in=list(account_ids)))
+        return _restore(Account, archived)
+
+    @staticmethod
+    @transaction.atomic
+    def restore_contacts(contact_ids: Iterable[Any]) -> list[Contact]:
+        """
+        Move archived contacts back into the hot table as live rows.
+
+        Archived accounts they belong to are restored first, and accounts
+        that are soft-deleted but not yet archived are revived, so the
+        contacts never come back under a hidden account. Raises
+        ``ValueError`` when an account was purged, and ``IntegrityError``
+        if the email has been reused on the account meanwhile.
+        """
+        archived = list(ArchivedContact.objects.filter(pk__in=list(contact_ids)))
+        account_ids = {record.account_id for record in archived}
+        _revive_accounts(account_ids)
+        account_ids -= set(
+            Account.objects.with_deleted()
+            .filter(pk__in=account_ids)
+            .values_list("pk", flat=True)
+        )
+        restored = ArchiveService.restore_accounts(account_ids)
+        missing = account_ids - {account.pk for account in restored}
+        if missing:
+            raise ValueError(
+                f"Accounts no longer exist: {', '.join(sorted(map(str, missing)))}."
+            )
+        return _restore(Contact, archived)
+
+    @staticmethod
+    def purge_archive(
+        purge_days: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> ArchiveCounts:
+        """
+        Permanently delete rows archived more than ``purge_days`` ago.
+
+        Accounts still referenced by an archived contact are kept so the
+        contact can be restored. Defaults come from ``ARCHIVE_PURGE_DAYS``
+        and ``ARCHIVE_BATCH_SIZE``.
+        """
+        if purge_days is None:
+            purge_days = settings.ARCHIVE_PURGE_DAYS
+        cutoff = timezone.now() - timedelta(days=purge_days)
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+
+        contacts = _delete_batches(
+            ArchivedContact.objects.filter(archived_at__lt=cutoff), batch_size
+        )
+        accounts = _delete_batches(
+            ArchivedAccount.objects.filter(
+                ~Exists(ArchivedContact.objects.filter(account_id=OuterRef("pk"))),
+                archived_at__lt=cutoff,
+            ),
+            batch_size,
+        )
+        return ArchiveCounts(accounts=accounts, contacts=contacts)
+
+
+def _snapshot(instance: models.Model) -> dict[str, Optional[str]]:
+    return {
+        field.attname: (
+            None
+            if field.value_from_object(instance) is None
+            else field.value_to_string(instance)
+        )
+        for field in instance._meta.concrete_fields
+    }
+
+
+def _archive_batches(queryset, archive_model, extra, batch_size, max_batches) -> int:
+    """Copy rows to ``archive_model`` and delete them, one transaction per batch."""
+    total = 0
+    batches = 0
+    skipped = set()
+    while max_batches is None or batches < max_batches:
+        try:
+            with transaction.atomic():
+                rows = list(
+                    queryset.exclude(pk__in=list(skipped)).order_by("updated_at")[:batch_size]
+                )
+                if not rows:
+                    break
+                _archive_rows(archive_model, extra, rows)
+            total += len(rows)
+        except ProtectedError:
+            # A contact was added to one of the accounts since the batch was
+            # selected, which rolled the batch back; archive the rows one by
+            # one and leave the referenced ones for a later run
+            for row in rows:
+                try:
+                    with transaction.atomic():
+                        _archive_rows(archive_model, extra, [row])
+                    total += 1
+                except ProtectedError:
+                    skipped.add(row.pk)
+        batches += 1
+    return total
+
+
+def _archive_rows(archive_model, extra, rows) -> None:
+    archive_model.objects.bulk_create(
+        [
+            archive_model(
+                id=row.pk,
+                data=_snapshot(row),
+                deleted_at=row.updated_at,
+                **extra(row),
+            )
+            for row in rows
+        ]
+    )
+    type(rows[0])._base_manager.filter(pk__in=[row.pk for row in rows]).delete()
+
+
+def _revive_accounts(account_ids) -> None:
+    """Bring soft-deleted (not archived) accounts back as live rows."""
+    hidden = Account.objects.with_deleted().filter(pk__in=account_ids, is_invalid=True)
+    pks = list(hidden.values_list("pk", flat=True))
+    if not pks:
+        return
+    hidden.update(is_invalid=False, updated_at=timezone.now(), version=F("version") + 1)
+    records_changed.send(
+        sender=Account, pks=pks, action=RECORDS_UPDATED, fields=["is_invalid"]
+    )
+
+
+def _restore(model, archived) -> list:
+    """Re-insert archived rows as live rows and drop them from the archive."""
+    now = timezone.now()
+    fields = model._meta.concrete_fields
+    restored = []
+    for record in archived:
+        instance = model(
+            **{
+                field.attname: field.to_python(record.data[field.attname])
+                for field in fields
+                if field.attname in record.data
+            }
+        )
+        instance.is_invalid = False
+        instance.updated_at = now
+        instance.version += 1
+        # raw keeps created_at instead of letting auto_now_add overwrite it
+        instance.save_base(raw=True, force_insert=True)
+        restored.append(instance)
+
+    if archived:
+        type(archived[0]).objects.filter(pk__in=[record.pk for record in archived]).delete()
+        records_changed.send(
+            sender=model,
+            pks=[instance.pk for instance in restored],
+            action=RECORDS_CREATED,
+        )
+    return restored
+
+
+def _delete_batches(queryset, batch_size) -> int:
+    """Delete the rows of ``queryset`` in transactions of ``batch_size`` rows."""
+    total = 0
+    while True:
+        with transaction.atomic():
+            pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            queryset.model.objects.filter(pk__in=pks).delete()
+        total += len(pks)
+    return total
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
+from django.conf import settings
 from django.db import transaction
+from django.db.models import F
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
 from core.models import Contact
+from core.signals import (
+    RECORDS_CREATED,
+    RECORDS_DELETED,
+    RECORDS_UPDATED,
+    records_changed,
+)
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser as User
@@ -17,14 +26,45 @@ class ContactService:
     """Service layer for Contact business logic."""
 
     @staticmethod
-    def list_contacts() -> Any:
-        """Retrieve all contacts."""
-        return Contact.objects.all()
+    def list_contacts(
+        fields: Optional[list[str]] = None, user: Optional[User] = None
+    ) -> Any:
+        """
+        Retrieve all contacts, loading only ``fields`` when given.
+
+        When ``user`` is given, only contacts visible to them are returned
+        (see ``ContactQuerySet.visible_to``); the scope is part of the SQL.
+        """
+        queryset = Contact.objects.all()
+        if user is not None:
+            queryset = queryset.visible_to(user)
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset
+
+    @staticmethod
+    def list_account_contacts(
+        account_id: str,
+        fields: Optional[list[str]] = None,
+        user: Optional[User] = None,
+    ) -> Any:
+        """Retrieve an account's live contacts, loading only ``fields`` when given."""
+        return ContactService.list_contacts(fields, user=user).for_account(account_id)
 
     @staticmethod
-    def get_contact(contact_id: str) -> Contact:
-        """Retrieve a single contact by ID."""
-        return get_object_or_404(Contact, id=contact_id)
+    def get_contact(
+        contact_id: str,
+        fields: Optional[list[str]] = None,
+        user: Optional[User] = None,
+    ) -> Contact:
+        """
+        Retrieve a single contact by ID, loading only ``fields`` when given.
+
+        Contacts not visible to ``user`` (when given) raise ``Http404``.
+        """
+        return get_object_or_404(
+            ContactService.list_contacts(fields, user=user), id=contact_id
+        )
 
     @staticmethod
     @transaction.atomic
@@ -35,29 +75,120 @@ class ContactService:
             created_by=user,
             **data,
         )
+        records_changed.send(sender=Contact, pks=[contact.pk], action=RECORDS_CREATED)
         return contact
 
+    @staticmethod
+    @transaction.atomic
+    def bulk_create_contacts(
+        rows: list[dict[str, Any]], user: User, batch_size: Optional[int] = None
+    ) -> list[Contact]:
+        """
+        Create many validated contacts in one transaction.
+
+        Rows are inserted with ``bulk_create`` in chunks of ``batch_size``
+        (default ``settings.BULK_CREATE_BATCH_SIZE``).
+        """
+        contacts = Contact.objects.bulk_create(
+            [Contact(owner_user=user, created_by=user, **data) for data in rows],
+            batch_size=batch_size or settings.BULK_CREATE_BATCH_SIZE,
+        )
+        records_changed.send(
+            sender=Contact,
+            pks=[contact.pk for contact in contacts],
+            action=RECORDS_CREATED,
+        )
+        return contacts
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_update_contacts(
+        queryset: Any,
+        data: dict[str, Any],
+        user: User,
+        batch_size: Optional[int] = None,
+        max_rows: Optional[int] = None,
+    ) -> int:
+        """
+        Apply one validated field patch to the contacts in ``queryset``.
+
+        The queryset is narrowed to contacts visible to ``user``, so ownership
+        is part of every UPDATE's WHERE clause. Matching keys are read once
+        and written with one set-based ``UPDATE`` per ``batch_size`` rows
+        (default ``settings.BULK_UPDATE_BATCH_SIZE``), which also sets
+        ``updated_by``, ``updated_at`` and ``version``; no per-row ``save()``
+        runs.
+        Raises ``ValueError`` without writing when more than ``max_rows``
+        (default ``settings.BULK_UPDATE_MAX_IDS``) contacts match.
+        Returns the number of contacts updated.
+        """
+        queryset = queryset.visible_to(user).order_by()
+        max_rows = max_rows or settings.BULK_UPDATE_MAX_IDS
+        pks = list(queryset.values_list("pk", flat=True)[: max_rows + 1])
+        if len(pks) > max_rows:
+            raise ValueError(f"More than {max_rows} contacts match; narrow the selection.")
+        batch_size = batch_size or settings.BULK_UPDATE_BATCH_SIZE
+        values = {
+            **data,
+            "updated_by": user,
+            "updated_at": timezone.now(),
+            "version": F("version") + 1,
+        }
+
+        updated = 0
+        for start in range(0, len(pks), batch_size):
+            batch = pks[start:start + batch_size]
+            updated += queryset.filter(pk__in=batch).update(**values)
+        if pks:
+            records_changed.send(
+                sender=Contact, pks=pks, action=RECORDS_UPDATED, fields=list(data)
+            )
+        return updated
+
     @staticmethod
     @transaction.atomic
     def update_contact(contact: Contact, data: dict[str, Any], user: User) -> Contact:
-        """Update a contact with business logic enforcement."""
+        """
+        Update a contact with business logic enforcement.
+
+        Only the columns whose values changed are written, together with
+        the audit fields; when nothing changed the row is not written and
+        ``updated_at`` keeps its value. The changed field names are left in
+        ``contact.changed_fields`` for the caller and sent as ``fields`` with
+        ``records_changed``.
+
+        The write is conditional on the contact's loaded ``version`` (see
+        ``VersionedMixin``): if another writer got there first, nothing is
+        written and ``StaleVersionError`` is raised.
+        """
         # Remove immutable fields
-        for field in ["id", "created_at", "created_by"]:
+        for field in ["id", "created_at", "created_by", "version"]:
             data.pop(field, None)
 
-        # Set audit field and update
-        data["updated_by"] = user
-        for field, value in data.items():
-            setattr(contact, field, value)
+        changed = list(contact.apply_changes(data))
+        if not changed:
+            return contact
 
-        contact.save()
+        # Set audit field and update
+        contact.updated_by = user
+        contact.updated_at = timezone.now()
+        contact.save_versioned([*changed, "updated_by", "updated_at"])
+        records_changed.send(
+            sender=Contact, pks=[contact.pk], action=RECORDS_UPDATED, fields=changed
+        )
         return contact
 
     @staticmethod
     @transaction.atomic
     def soft_delete_contact(contact: Contact, user: User) -> Contact:
-        """Soft-delete a contact by setting is_invalid=True."""
+        """
+        Soft-delete a contact by setting is_invalid=True.
+
+        Like updates, the write is conditional on the loaded ``version``.
+        """
         contact.is_invalid = True
         contact.updated_by = user
-        contact.save()
+        contact.updated_at = timezone.now()
+        contact.save_versioned(["is_invalid", "updated_by", "updated_at"])
+        records_changed.send(sender=Contact, pks=[contact.pk], action=RECORDS_DELETED)
         return contact
@@ -0,0 +1,17 @@
+"""Domain signals emitted by the service layer."""
+
+from django.dispatch import Signal
+
+# Sent by services after Account/Contact rows are written.
+#
+# Arguments:
+#   sender: the model class (Account or Contact)
+#   pks:    list of primary keys that were written
+#   action: one of RECORDS_CREATED, RECORDS_UPDATED, RECORDS_DELETED
+#   fields: for updates, names of the fields that changed (omitted or None
+#           when unknown, which receivers treat as "any field")
+records_changed = Signal()
+
+RECORDS_CREATED = "create"
+RECORDS_UPDATED = "update"
+RECORDS_DELETED = "delete"
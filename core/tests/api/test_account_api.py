@@ -9,6 +9,7 @@ from rest_framework.test import APIClient
 from rest_framework import status
 
 from core.models import Account, AccountStatus, AccountType
+from core.services import AccountService
 
 UserModel = get_user_model()
 
@@ -137,17 +138,11 @@ class TestAccountListCreate:
 
     def test_list_accounts_with_search(self):
         """Test GET /accounts with search query."""
-        Account.objects.create(
-            name='Acme Corporation',
-            industry='Technology',
-            owner_user=self.user,
-            created_by=self.user,
+        AccountService.create_account(
+            {'name': 'Acme Corporation', 'industry': 'Technology'}, self.user
         )
-        Account.objects.create(
-            name='Beta Company',
-            industry='Finance',
-            owner_user=self.user,
-            created_by=self.user,
+        AccountService.create_account(
+            {'name': 'Beta Company', 'industry': 'Finance'}, self.user
         )
         response = self.client.get(
             '/accounts/',
@@ -214,8 +209,8 @@ class TestAccountRetrieve:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['name'] == 'My Account'
 
-    def test_user_can_retrieve_other_users_account(self):
-        """Test user can retrieve other user's account (safe methods allowed)."""
+    def test_user_cannot_retrieve_other_users_account(self):
+        """Test other users' accounts are not visible to non-admins (404)."""
         owner = UserModel.objects.create_user(
             username='owner',
             password='testpass123',
@@ -237,7 +232,7 @@ class TestAccountRetrieve:
         client.force_authenticate(user=other_user)
 
         response = client.get(f'/accounts/{account.id}/', format='json')
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.django_db
@@ -404,6 +399,26 @@ class TestAccountDelete:
         account.refresh_from_db()
         assert account.is_invalid is True
 
+    def test_deleted_account_is_hidden_but_keeps_its_account_number(self):
+        """Test soft-deleted accounts leave the API but still reserve their number."""
+        account = Account.objects.create(
+            name='Old Account',
+            account_number='ACC-DEL',
+            owner_user=self.user,
+        )
+        self.client.delete(f'/accounts/{account.id}/', format='json')
+
+        assert self.client.get(f'/accounts/{account.id}/').status_code == 404
+        assert self.client.get('/accounts/').data['count'] == 0
+
+        payload = {'name': 'New Account', 'account_number': 'ACC-DEL'}
+        single = self.client.post('/accounts/', payload, format='json')
+        bulk = self.client.post('/accounts/bulk/', [payload], format='json')
+        assert single.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'account_number' in single.data
+        assert bulk.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'account_number' in bulk.data[0]
+
     def test_non_admin_cannot_delete_account(self):
         """Test non-admin user cannot delete account (returns 403)."""
         # Create a non-admin user
@@ -426,6 +441,82 @@ class TestAccountDelete:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+@pytest.mark.django_db
+class TestAccountBulkCreate:
+    """Tests for POST /accounts/bulk endpoint."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+
+    def setup_method(self):
+        """Set up test client and test user."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_bulk',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_bulk_create_returns_201_with_ids(self):
+        """Test a valid batch is created and summarised."""
+        payload = [
+            {'name': 'Acme Corp', 'account_number': 'ACC-001'},
+            {'name': 'Globex', 'status': AccountStatus.ACTIVE},
+        ]
+
+        response = self.client.post('/accounts/bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['count'] == 2
+        created = Account.objects.filter(pk__in=response.data['ids'])
+        assert sorted(created.values_list('name', flat=True)) == ['Acme Corp', 'Globex']
+        assert all(account.owner_user == self.user for account in created)
+
+    def test_bulk_create_checks_uniqueness_with_one_query(
+        self, django_assert_max_num_queries
+    ):
+        """Test account numbers are checked for the batch at once."""
+        payload = [
+            {'name': f'Account {index}', 'account_number': f'ACC-{index:03d}'}
+            for index in range(50)
+        ]
+
+        with django_assert_max_num_queries(8):
+            response = self.client.post('/accounts/bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Account.objects.count() == 50
+
+    def test_bulk_create_returns_per_row_errors(self):
+        """Test invalid rows are reported by position and nothing is created."""
+        Account.objects.create(name='Existing', account_number='ACC-001')
+        payload = [
+            {'name': 'Valid'},
+            {'name': 'Taken', 'account_number': 'ACC-001'},
+            {'name': 'Twin', 'account_number': 'ACC-002'},
+            {'name': 'Twin again', 'account_number': 'ACC-002'},
+            {'annual_revenue': '-1'},
+        ]
+
+        response = self.client.post('/accounts/bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert 'already exists' in str(response.data[1]['account_number'][0])
+        assert 'more than once' in str(response.data[2]['account_number'][0])
+        assert 'more than once' in str(response.data[3]['account_number'][0])
+        assert set(response.data[4]) == {'name', 'annual_revenue'}
+        assert Account.objects.count() == 1
+
+    def test_bulk_create_rejects_empty_and_non_list_payloads(self):
+        """Test the payload must be a non-empty list."""
+        empty = self.client.post('/accounts/bulk/', [], format='json')
+        single = self.client.post('/accounts/bulk/', {'name': 'Acme'}, format='json')
+
+        assert empty.status_code == status.HTTP_400_BAD_REQUEST
+        assert single.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.django_db
 class TestAccountAuth:  # pylint: disable=too-few-public-methods
     """Tests for Account API authentication and authorization."""
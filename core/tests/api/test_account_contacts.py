@@ -0,0 +1,89 @@
+"""API tests for GET /accounts/{id}/contacts/."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact, ContactRole
+from core.services import ContactService
+
+UserModel = get_user_model()
+
+
+@pytest.mark.django_db
+class TestAccountContactsAction:
+    """Tests for the nested contacts list of an account."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+    account: Optional[Account]
+
+    def setup_method(self):
+        """Set up a staff client, an account with contacts and another account."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_account_contacts', is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(name='Acme', owner_user=self.user)
+        other = Account.objects.create(name='Globex', owner_user=self.user)
+        for index in range(3):
+            Contact.objects.create(
+                first_name=f'Contact {index}',
+                last_name='Doe',
+                role=ContactRole.DECISION_MAKER if index else ContactRole.INFLUENCER,
+                account=self.account,
+            )
+        Contact.objects.create(first_name='Deleted', account=self.account, is_invalid=True)
+        Contact.objects.create(first_name='Other', account=other)
+
+    def _get(self, params=None):
+        return self.client.get(f'/accounts/{self.account.id}/contacts/', params or {})
+
+    def test_lists_live_contacts_of_the_account_paginated(self):
+        """Test soft-deleted and other accounts' contacts are excluded."""
+        response = self._get({'page_size': 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        assert len(response.data['results']) == 2
+        assert response.data['next'] is not None
+
+    def test_filters_and_ordering_match_contacts_endpoint(self):
+        """Test ContactViewSet filterset and ordering fields apply."""
+        response = self._get(
+            {'role': ContactRole.DECISION_MAKER, 'ordering': 'first_name'}
+        )
+
+        names = [row['first_name'] for row in response.data['results']]
+        assert names == ['Contact 1', 'Contact 2']
+
+    def test_search(self):
+        """Test ?search= matches contact fields through the search index."""
+        ContactService.create_contact(
+            {'first_name': 'Jane', 'last_name': 'Smith', 'account': self.account},
+            self.user,
+        )
+        response = self._get({'search': 'smith'})
+        assert [row['first_name'] for row in response.data['results']] == ['Jane']
+
+    def test_sparse_fieldsets(self):
+        """Test ?fields= trims the contact representation."""
+        response = self._get({'fields': 'first_name'})
+        assert response.data['results'][0] == {'first_name': 'Contact 2'}
+
+    def test_cursor_pagination(self):
+        """Test ?cursor= selects keyset pagination without a count."""
+        response = self._get({'cursor': '', 'page_size': 2})
+
+        assert 'count' not in response.data
+        assert len(response.data['results']) == 2
+
+    def test_unknown_account_returns_404(self):
+        """Test a missing account is not reported as an empty list."""
+        response = self.client.get(
+            '/accounts/00000000-0000-0000-0000-000000000000/contacts/'
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,161 @@
+"""API tests for GET /accounts/?include=contact_count,primary_contact."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact
+from core.search import search_index
+from core.services import ContactService
+
+UserModel = get_user_model()
+
+
+@pytest.mark.django_db
+class TestAccountListIncludes:
+    """Tests for opt-in contact annotations on the account list."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+    account: Optional[Account]
+
+    def setup_method(self):
+        """Set up a staff client, one account with contacts and one without."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_includes', is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+        Account.objects.create(name='Empty', owner_user=self.user)
+        self.account = Account.objects.create(name='Acme', owner_user=self.user)
+        Contact.objects.create(
+            first_name='Jane',
+            last_name='Doe',
+            email='jane@acme.com',
+            primary_contact=True,
+            account=self.account,
+        )
+        Contact.objects.create(first_name='John', account=self.account)
+        Contact.objects.create(first_name='Gone', account=self.account, is_invalid=True)
+
+    def _rows(self, params):
+        response = self.client.get('/accounts/', params)
+        assert response.status_code == status.HTTP_200_OK
+        return {row['name']: row for row in response.data['results']}
+
+    def test_fields_are_omitted_by_default(self):
+        """Test the default representation is unchanged."""
+        row = self._rows({})['Acme']
+        assert 'contact_count' not in row
+        assert 'primary_contact' not in row
+
+    def test_contact_count_counts_live_contacts(self):
+        """Test soft-deleted contacts are not counted."""
+        rows = self._rows({'include': 'contact_count'})
+
+        assert rows['Acme']['contact_count'] == 2
+        assert rows['Empty']['contact_count'] == 0
+        assert 'primary_contact' not in rows['Acme']
+
+    def test_primary_contact_is_embedded(self):
+        """Test the primary contact is rendered compactly, or null."""
+        rows = self._rows({'include': 'primary_contact'})
+
+        primary = rows['Acme']['primary_contact']
+        assert primary['full_name'] == 'Jane Doe'
+        assert primary['email'] == 'jane@acme.com'
+        assert rows['Empty']['primary_contact'] is None
+
+    def test_includes_only_contacts_visible_to_non_staff(self):
+        """Test another owner's contacts on the user's account are not exposed."""
+        owner = UserModel.objects.create_user(username='testuser_includes_owner')
+        other = UserModel.objects.create_user(username='testuser_includes_other')
+        account = Account.objects.create(name='Mine', owner_user=owner)
+        Contact.objects.create(
+            first_name='Secret',
+            email='secret@mine.com',
+            primary_contact=True,
+            account=account,
+            owner_user=other,
+        )
+        Contact.objects.create(first_name='Own', account=account, owner_user=owner)
+        self.client.force_authenticate(user=owner)
+
+        rows = self._rows({'include': 'contact_count,primary_contact'})
+
+        assert list(rows) == ['Mine']
+        assert rows['Mine']['contact_count'] == 1
+        assert rows['Mine']['primary_contact'] is None
+
+    def test_includes_combine_with_sparse_fieldsets(self):
+        """Test ?fields= trims base fields but keeps included ones."""
+        rows = self._rows({'include': 'contact_count', 'fields': 'name'})
+        assert rows['Acme'] == {'name': 'Acme', 'contact_count': 2}
+
+    def test_query_count_does_not_grow_with_rows(self, django_capture_on_commit_callbacks):
+        """Test annotations are computed in the list query, not per row."""
+        params = {'include': 'contact_count,primary_contact'}
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get('/accounts/', params)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            for index in range(5):
+                account = Account.objects.create(name=f'Extra {index}', owner_user=self.user)
+                Contact.objects.create(first_name='P', primary_contact=True, account=account)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/accounts/', params)
+
+        assert len(response.data['results']) == 7
+        assert len(queries) == len(baseline)
+
+    def test_unknown_include_is_rejected(self):
+        """Test unknown names return 400."""
+        response = self.client.get('/accounts/', {'include': 'contact_count,deals'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'include' in response.data
+
+    def test_etag_changes_when_embedded_contacts_change(
+        self, django_capture_on_commit_callbacks
+    ):
+        """Test contact writes invalidate the ETag of an including list."""
+        params = {'include': 'contact_count'}
+        etag = self.client.get('/accounts/', params)['ETag']
+        with django_capture_on_commit_callbacks(execute=True):
+            ContactService.create_contact(
+                {'first_name': 'New', 'account': self.account}, self.user
+            )
+
+        response = self.client.get('/accounts/', params, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self._rows(params)['Acme']['contact_count'] == 3
+
+    def test_includes_combine_with_search_and_filters(self):
+        """Test ?include= on a searched, filtered list renders and answers 304."""
+        Account.objects.create(name='Acme Labs', owner_user=self.user)
+        search_index.rebuild(Account)
+        params = {
+            'search': 'acme',
+            'status': self.account.status,
+            'ordering': 'name',
+            'include': 'contact_count,primary_contact',
+        }
+
+        response = self.client.get('/accounts/', params)
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = {row['name']: row for row in response.data['results']}
+        assert {name: row['contact_count'] for name, row in rows.items()} == {
+            'Acme': 2,
+            'Acme Labs': 0,
+        }
+        assert rows['Acme']['primary_contact']['full_name'] == 'Jane Doe'
+        assert rows['Acme Labs']['primary_contact'] is None
+
+        repeat = self.client.get('/accounts/', params, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert repeat.status_code == status.HTTP_304_NOT_MODIFIED
@@ -0,0 +1,165 @@
+"""API tests for PATCH /accounts/bulk/ and /contacts/bulk/."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account, AccountStatus, Contact
+
+UserModel = get_user_model()
+
+
+def _updates(queries, table):
+    return [q for q in queries if q['sql'].startswith(f'UPDATE "{table}"')]
+
+
+@pytest.mark.django_db
+class TestBulkUpdate:
+    """Tests for set-based bulk updates scoped to the requesting user."""
+
+    client: Optional[APIClient]
+    owner: Optional[object]
+    other: Optional[object]
+    mine: Optional[list]
+    theirs: Optional[Account]
+
+    def setup_method(self):
+        """Set up three prospects for a non-admin owner and one for another user."""
+        self.owner = UserModel.objects.create_user(username='owner_bulk_update')
+        self.other = UserModel.objects.create_user(username='other_bulk_update')
+        self.mine = [
+            Account.objects.create(
+                name=f'Mine {index}',
+                status=AccountStatus.PROSPECT,
+                owner_user=self.owner,
+            )
+            for index in range(3)
+        ]
+        self.theirs = Account.objects.create(
+            name='Theirs', status=AccountStatus.PROSPECT, owner_user=self.other
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def test_filter_updates_own_matching_rows(self, settings):
+        """Test a filter patch updates the user's rows in chunked UPDATEs."""
+        settings.BULK_UPDATE_BATCH_SIZE = 2
+        payload = {'filter': {'status': 'prospect'}, 'patch': {'status': 'active'}}
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch('/accounts/bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'count': 3}
+        assert len(_updates(queries, 'core_account')) == 2
+        for account in self.mine:
+            account.refresh_from_db()
+            assert account.status == AccountStatus.ACTIVE
+            assert account.updated_by == self.owner
+            assert account.updated_at > account.created_at
+        self.theirs.refresh_from_db()
+        assert self.theirs.status == AccountStatus.PROSPECT
+
+    def test_ids_of_other_users_rows_are_skipped(self):
+        """Test ownership is enforced even for explicitly listed ids."""
+        payload = {
+            'ids': [str(self.mine[0].id), str(self.theirs.id)],
+            'patch': {'industry': 'Manufacturing'},
+        }
+
+        response = self.client.patch('/accounts/bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'count': 1}
+        assert Account.objects.get(pk=self.mine[0].pk).industry == 'Manufacturing'
+        assert Account.objects.get(pk=self.theirs.pk).industry != 'Manufacturing'
+
+    def test_soft_deleted_rows_are_not_updated(self):
+        """Test the live-only manager keeps soft-deleted rows out of the UPDATE."""
+        Account.objects.filter(pk=self.mine[0].pk).update(is_invalid=True)
+        payload = {'ids': [str(self.mine[0].id)], 'patch': {'status': 'active'}}
+
+        response = self.client.patch('/accounts/bulk/', payload, format='json')
+
+        assert response.data == {'count': 0}
+
+    def test_patch_is_validated_once(self):
+        """Test invalid values and fields excluded from bulk updates return 400."""
+        for patch in (
+            {'status': 'bogus'},
+            {'account_number': 'ACC-1'},
+            {'created_by': self.other.pk},
+            {'unknown': 1},
+        ):
+            response = self.client.patch(
+                '/accounts/bulk/', {'ids': [str(self.mine[0].id)], 'patch': patch},
+                format='json',
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert list(response.data['patch']) == list(patch)
+
+    def test_selection_must_be_ids_or_a_known_filter(self):
+        """Test bodies without exactly one valid selector are rejected."""
+        patch = {'status': 'active'}
+        for payload in (
+            {'patch': patch},
+            {'ids': [str(self.mine[0].id)], 'filter': {'status': 'prospect'}, 'patch': patch},
+            {'filter': {'name': 'Mine 0'}, 'patch': patch},
+            {'filter': {'status': 'bogus'}, 'patch': patch},
+        ):
+            response = self.client.patch('/accounts/bulk/', payload, format='json')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        assert not Account.objects.filter(status=AccountStatus.ACTIVE).exists()
+
+    def test_filter_without_effective_value_is_rejected(self):
+        """Test filters django-filter would ignore do not select every row."""
+        for value in ('', None, []):
+            payload = {'filter': {'status': value}, 'patch': {'status': 'active'}}
+            response = self.client.patch('/accounts/bulk/', payload, format='json')
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert 'filter' in response.data
+        assert not Account.objects.filter(status=AccountStatus.ACTIVE).exists()
+
+    def test_filter_matching_too_many_rows_is_rejected(self, settings):
+        """Test BULK_UPDATE_MAX_IDS also bounds filter selections."""
+        settings.BULK_UPDATE_MAX_IDS = 2
+        payload = {'filter': {'status': 'prospect'}, 'patch': {'status': 'active'}}
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch('/accounts/bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'More than 2 accounts' in response.data['non_field_errors'][0]
+        assert not _updates(queries, 'core_account')
+
+    def test_contacts_bulk_update(self):
+        """Test /contacts/bulk/ filters by account and updates only own contacts."""
+        account = self.mine[0]
+        mine = Contact.objects.create(
+            first_name='Mine', account=account, owner_user=self.owner
+        )
+        theirs = Contact.objects.create(
+            first_name='Theirs', account=account, owner_user=self.other
+        )
+        payload = {'filter': {'account': str(account.id)}, 'patch': {'opt_in_email': False}}
+
+        response = self.client.patch('/contacts/bulk/', payload, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'count': 1}
+        assert Contact.objects.get(pk=mine.pk).opt_in_email is False
+        assert Contact.objects.get(pk=theirs.pk).opt_in_email is True
+
+    def test_contacts_email_cannot_be_bulk_updated(self):
+        """Test unique contact fields are rejected in bulk patches."""
+        payload = {'filter': {'role': 'user'}, 'patch': {'email': 'same@example.com'}}
+
+        response = self.client.patch('/contacts/bulk/', payload, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'email' in response.data['patch']
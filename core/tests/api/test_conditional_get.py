@@ -0,0 +1,110 @@
+"""API tests for ETag / Last-Modified conditional GET."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account
+from core.services import AccountService
+
+UserModel = get_user_model()
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """Tests for If-None-Match / If-Modified-Since on accounts."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+    account: Optional[Account]
+
+    def setup_method(self):
+        """Set up test client, user and one account."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_etag',
+            password='testpass123',
+            is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(name='Acme', owner_user=self.user)
+
+    def test_retrieve_returns_validators(self):
+        """Test retrieve responses carry a strong ETag and Last-Modified."""
+        response = self.client.get(f'/accounts/{self.account.id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'].startswith('"')
+        assert 'Last-Modified' in response
+
+    def test_retrieve_matching_etag_returns_304_with_one_query(self):
+        """Test an unchanged row short-circuits before loading the object."""
+        etag = self.client.get(f'/accounts/{self.account.id}/')['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                f'/accounts/{self.account.id}/', HTTP_IF_NONE_MATCH=etag
+            )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not response.content
+        assert len(queries) == 1
+
+    def test_retrieve_etag_changes_after_update(self):
+        """Test an update invalidates the previous ETag."""
+        etag = self.client.get(f'/accounts/{self.account.id}/')['ETag']
+        AccountService.update_account(self.account, {'name': 'Acme 2'}, self.user)
+
+        response = self.client.get(
+            f'/accounts/{self.account.id}/', HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['name'] == 'Acme 2'
+        assert response['ETag'] != etag
+
+    def test_etag_depends_on_requested_fields(self):
+        """Test sparse fieldsets get their own ETag."""
+        full = self.client.get(f'/accounts/{self.account.id}/')
+        sparse = self.client.get(f'/accounts/{self.account.id}/', {'fields': 'name'})
+        assert full['ETag'] != sparse['ETag']
+
+    def test_list_matching_etag_returns_304(self):
+        """Test an unchanged list page returns 304."""
+        etag = self.client.get('/accounts/')['ETag']
+
+        response = self.client.get('/accounts/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_changes_when_rows_are_added(self, django_capture_on_commit_callbacks):
+        """Test creating a row changes the list ETag."""
+        etag = self.client.get('/accounts/')['ETag']
+        with django_capture_on_commit_callbacks(execute=True):
+            Account.objects.create(name='Globex', owner_user=self.user)
+
+        response = self.client.get('/accounts/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 2
+
+    def test_if_modified_since_returns_304(self):
+        """Test Last-Modified can be used as the validator."""
+        last_modified = self.client.get(f'/accounts/{self.account.id}/')['Last-Modified']
+
+        response = self.client.get(
+            f'/accounts/{self.account.id}/', HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_missing_row_still_returns_404(self):
+        """Test unknown ids are unaffected."""
+        response = self.client.get(
+            '/accounts/00000000-0000-0000-0000-000000000000/', HTTP_IF_NONE_MATCH='"x"'
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
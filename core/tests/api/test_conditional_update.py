@@ -0,0 +1,126 @@
+"""API tests for If-Match / 412 optimistic concurrency on writes."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact
+from core.services import AccountService
+
+UserModel = get_user_model()
+
+
+@pytest.mark.django_db
+class TestConditionalUpdate:
+    """Tests for If-Match preconditions on account and contact writes."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+    account: Optional[Account]
+
+    def setup_method(self):
+        """Set up an owner client and one account."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(username='testuser_if_match')
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(name='Acme', owner_user=self.user)
+
+    def _url(self):
+        return f'/accounts/{self.account.id}/'
+
+    def test_detail_etag_starts_with_version(self):
+        """Test the retrieve ETag exposes the version the body reports."""
+        response = self.client.get(self._url())
+
+        assert response.data['version'] == 1
+        assert response['ETag'].startswith('"1-')
+
+    def test_matching_etag_updates_and_bumps_version(self):
+        """Test a current If-Match lets the write through."""
+        etag = self.client.get(self._url())['ETag']
+
+        response = self.client.patch(
+            self._url(), {'name': 'Acme 2'}, format='json', HTTP_IF_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['version'] == 2
+        assert self.client.get(self._url())['ETag'].startswith('"2-')
+
+    def test_stale_etag_returns_412_and_writes_nothing(self):
+        """Test a write based on an old representation is refused."""
+        etag = self.client.get(self._url())['ETag']
+        AccountService.update_account(self.account, {'name': 'Theirs'}, self.user)
+
+        for method in (self.client.patch, self.client.put, self.client.delete):
+            response = method(
+                self._url(), {'name': 'Mine'}, format='json', HTTP_IF_MATCH=etag
+            )
+            assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        self.account.refresh_from_db()
+        assert (self.account.name, self.account.is_invalid) == ('Theirs', False)
+
+    def test_plain_save_between_get_and_put_returns_412(self):
+        """Test admin/ORM saves outside the services also invalidate If-Match."""
+        etag = self.client.get(self._url())['ETag']
+        account = Account.objects.get(pk=self.account.pk)
+        account.name = 'Admin edit'
+        account.save()
+
+        response = self.client.put(
+            self._url(), {'name': 'Mine'}, format='json', HTTP_IF_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        account.refresh_from_db()
+        assert (account.name, account.version) == ('Admin edit', 2)
+
+    def test_bare_version_and_wildcard_tags(self):
+        """Test '"<version>"' and '*' are accepted, weak tags never match."""
+        response = self.client.patch(
+            self._url(), {'name': 'A'}, format='json', HTTP_IF_MATCH='W/"1"'
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        response = self.client.patch(
+            self._url(), {'name': 'B'}, format='json', HTTP_IF_MATCH='"7", "1"'
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = self.client.patch(
+            self._url(), {'name': 'C'}, format='json', HTTP_IF_MATCH='*'
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['version'] == 3
+
+    def test_concurrent_write_after_load_returns_412(self, monkeypatch):
+        """Test a writer committing between load and UPDATE loses with 412."""
+        original = AccountService.update_account
+
+        def racing_update(account, data, user):
+            Account.objects.filter(pk=account.pk).update(version=account.version + 1)
+            return original(account, data, user)
+
+        monkeypatch.setattr(AccountService, 'update_account', racing_update)
+        response = self.client.patch(self._url(), {'name': 'Mine'}, format='json')
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert Account.objects.get(pk=self.account.pk).name == 'Acme'
+
+    def test_contact_updates_honour_if_match(self):
+        """Test contacts use the same precondition."""
+        contact = Contact.objects.create(
+            first_name='Jane', account=self.account, owner_user=self.user
+        )
+        url = f'/contacts/{contact.id}/'
+        etag = self.client.get(url)['ETag']
+
+        first = self.client.patch(url, {'job_title': 'CTO'}, format='json', HTTP_IF_MATCH=etag)
+        second = self.client.patch(url, {'job_title': 'CEO'}, format='json', HTTP_IF_MATCH=etag)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert Contact.objects.get(pk=contact.pk).job_title == 'CTO'
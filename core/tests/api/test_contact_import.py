@@ -0,0 +1,149 @@
+"""API tests for POST /contacts/import."""
+import json
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact
+
+UserModel = get_user_model()
+
+
+def _csv_file(lines, name='contacts.csv'):
+    return SimpleUploadedFile(name, '\n'.join(lines).encode('utf-8'), 'text/csv')
+
+
+@pytest.mark.django_db
+class TestContactImport:
+    """Tests for streaming CSV/NDJSON contact imports."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+    account: Optional[Account]
+
+    def setup_method(self):
+        """Set up test client, user and an account with one contact."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_import',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(name='Acme', owner_user=self.user)
+        Contact.objects.create(
+            first_name='Existing', email='taken@acme.com', account=self.account
+        )
+
+    def _import(self, upload, **data):
+        return self.client.post(
+            '/contacts/import/', {'file': upload, **data}, format='multipart'
+        )
+
+    def test_csv_import_creates_contacts(self):
+        """Test valid CSV rows are created and owned by the importer."""
+        upload = _csv_file([
+            'first_name,last_name,email,account',
+            f'Jane,Doe,jane@acme.com,{self.account.id}',
+            f'John,,,{self.account.id}',
+        ])
+
+        response = self._import(upload)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'created': 2, 'error_count': 0, 'errors': []}
+        john = Contact.objects.get(first_name='John')
+        assert john.last_name is None
+        assert john.email is None
+        assert john.owner_user == self.user
+
+    def test_csv_import_reports_row_errors_and_keeps_valid_rows(self):
+        """Test invalid rows are reported by row number."""
+        upload = _csv_file([
+            'first_name,email,account',
+            f'Valid,valid@acme.com,{self.account.id}',
+            f'Taken,taken@acme.com,{self.account.id}',
+            'Orphan,,00000000-0000-0000-0000-000000000000',
+            f',nameless@acme.com,{self.account.id}',
+            f'Twin,twin@acme.com,{self.account.id}',
+            f'Twin again,twin@acme.com,{self.account.id}',
+        ])
+
+        response = self._import(upload)
+
+        assert response.data['created'] == 2
+        assert response.data['error_count'] == 4
+        errors = {error['row']: error['errors'] for error in response.data['errors']}
+        assert set(errors) == {2, 3, 4, 6}
+        assert 'email' in errors[2]
+        assert 'account' in errors[3]
+        assert 'first_name' in errors[4]
+        assert 'email' in errors[6]
+
+    def test_ndjson_import_reports_unparseable_lines(self):
+        """Test NDJSON is detected from the file name and bad lines are skipped."""
+        lines = [
+            json.dumps({'first_name': 'Jane', 'account': str(self.account.id)}),
+            '{not json',
+            json.dumps(['a', 'list']),
+        ]
+        upload = SimpleUploadedFile(
+            'contacts.ndjson', '\n'.join(lines).encode('utf-8'), 'application/x-ndjson'
+        )
+
+        response = self._import(upload)
+
+        assert response.data['created'] == 1
+        assert [error['row'] for error in response.data['errors']] == [2, 3]
+
+    def test_queries_scale_with_chunks_not_rows(self, settings):
+        """Test accounts and uniqueness are checked once per chunk."""
+        settings.IMPORT_CHUNK_SIZE = 20
+        rows = [
+            f'Contact {index},c{index}@acme.com,{self.account.id}'
+            for index in range(60)
+        ]
+        upload = _csv_file(['first_name,email,account', *rows])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._import(upload)
+
+        assert response.data['created'] == 60
+        assert len(queries) < 60
+
+    def test_duplicates_across_chunks_are_rejected(self, settings):
+        """Test rows committed by an earlier chunk count as existing."""
+        settings.IMPORT_CHUNK_SIZE = 1
+        upload = _csv_file([
+            'first_name,email,account',
+            f'First,same@acme.com,{self.account.id}',
+            f'Second,same@acme.com,{self.account.id}',
+        ])
+
+        response = self._import(upload)
+
+        assert response.data['created'] == 1
+        assert response.data['errors'][0]['row'] == 2
+
+    def test_soft_deleted_contacts_still_hold_their_email(self):
+        """Test the uniqueness check sees soft-deleted rows, like the constraint."""
+        Contact.objects.filter(email='taken@acme.com').update(is_invalid=True)
+        upload = _csv_file([
+            'first_name,email,account',
+            f'Again,taken@acme.com,{self.account.id}',
+        ])
+
+        response = self._import(upload)
+
+        assert response.data['created'] == 0
+        assert 'email' in response.data['errors'][0]['errors']
+
+    def test_missing_file_returns_400(self):
+        """Test the file field is required."""
+        response = self.client.post('/contacts/import/', {}, format='multipart')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
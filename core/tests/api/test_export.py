@@ -0,0 +1,80 @@
+"""API tests for GET /accounts/export and /contacts/export."""
+import csv
+import io
+import json
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account, AccountStatus, Contact
+
+UserModel = get_user_model()
+
+
+def _content(response):
+    return b''.join(response.streaming_content).decode('utf-8')
+
+
+@pytest.mark.django_db
+class TestExport:
+    """Tests for the streaming export endpoints."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+
+    def setup_method(self):
+        """Set up test client, user and three accounts."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_export',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        for index in range(3):
+            Account.objects.create(
+                name=f'Account {index}',
+                status=AccountStatus.ACTIVE if index else AccountStatus.PROSPECT,
+                owner_user=self.user,
+            )
+
+    def test_csv_export_streams_all_rows(self, settings):
+        """Test CSV export includes a header and every row across chunks."""
+        settings.EXPORT_CHUNK_SIZE = 2
+        response = self.client.get('/accounts/export/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'].startswith('text/csv')
+        assert 'accounts.csv' in response['Content-Disposition']
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        assert [row['name'] for row in rows] == ['Account 2', 'Account 1', 'Account 0']
+        assert rows[0]['account_number'] == ''
+
+    def test_export_applies_list_filters_and_fields(self):
+        """Test export takes the same filter and ?fields= parameters as list."""
+        response = self.client.get(
+            '/accounts/export/', {'status': AccountStatus.ACTIVE, 'fields': 'id,name'}
+        )
+
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        assert sorted(row['name'] for row in rows) == ['Account 1', 'Account 2']
+        assert set(rows[0]) == {'id', 'name'}
+
+    def test_ndjson_contact_export(self):
+        """Test NDJSON export writes one JSON object per line."""
+        account = Account.objects.first()
+        Contact.objects.create(first_name='Jane', account=account, owner_user=self.user)
+
+        response = self.client.get('/contacts/export/', {'export_format': 'ndjson'})
+
+        assert response['Content-Type'] == 'application/x-ndjson'
+        lines = _content(response).splitlines()
+        assert [json.loads(line)['full_name'] for line in lines] == ['Jane']
+
+    def test_unknown_export_format_returns_400(self):
+        """Test unsupported formats are rejected."""
+        response = self.client.get('/accounts/export/', {'export_format': 'xml'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
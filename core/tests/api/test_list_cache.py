@@ -0,0 +1,164 @@
+"""API tests for the per-user list response cache."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.checks import check_list_cache_backend
+from core.models import Account, Contact
+from core.services import AccountService, ContactService
+
+UserModel = get_user_model()
+
+
+def _account_selects(queries):
+    return [q for q in queries if q['sql'].startswith('SELECT "core_account"')]
+
+
+@pytest.mark.django_db
+class TestListCache:
+    """Tests for cached /accounts/ and /contacts/ list responses."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+
+    @pytest.fixture(autouse=True)
+    def enable_list_cache(self, settings):
+        """Turn the list cache on and start from an empty cache."""
+        settings.LIST_CACHE_TIMEOUT = 60
+        cache.clear()
+
+    def setup_method(self):
+        """Set up test client, user and two accounts."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_cache',
+            password='testpass123',
+            is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+        for index in range(2):
+            AccountService.create_account({'name': f'Account {index}'}, self.user)
+
+    def test_repeated_list_is_served_from_cache(self):
+        """Test the second identical request skips the page query."""
+        first = self.client.get('/accounts/', {'status': 'prospect', 'page_size': 10})
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(
+                '/accounts/', {'page_size': 10, 'status': 'prospect'}
+            )
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+        assert not _account_selects(queries)
+
+    def test_service_writes_invalidate_cached_lists(self, django_capture_on_commit_callbacks):
+        """Test create, update and soft delete are visible immediately."""
+        assert self.client.get('/accounts/').data['count'] == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            account = AccountService.create_account({'name': 'New'}, self.user)
+        assert self.client.get('/accounts/').data['count'] == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AccountService.update_account(account, {'name': 'Renamed'}, self.user)
+        names = [row['name'] for row in self.client.get('/accounts/').data['results']]
+        assert 'Renamed' in names
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AccountService.soft_delete_account(account, self.user)
+        assert self.client.get('/accounts/').data['count'] == 2
+
+    def test_generation_is_bumped_only_after_commit(self, django_capture_on_commit_callbacks):
+        """Test the bump waits for the transaction to commit."""
+        self.client.get('/accounts/')
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            AccountService.create_account({'name': 'Pending'}, self.user)
+        assert self.client.get('/accounts/').data['count'] == 2
+
+        for callback in callbacks:
+            callback()
+        assert self.client.get('/accounts/').data['count'] == 3
+
+    def test_direct_orm_writes_invalidate_cached_lists(
+        self, django_capture_on_commit_callbacks
+    ):
+        """Test saves and deletes outside the services (admin, sync jobs) invalidate too."""
+        assert self.client.get('/accounts/').data['count'] == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            account = Account.objects.create(name='Synced', owner_user=self.user)
+        assert self.client.get('/accounts/').data['count'] == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            account.delete()
+        assert self.client.get('/accounts/').data['count'] == 2
+
+    def test_cache_is_per_user(self):
+        """Test users never share cached pages."""
+        self.client.get('/accounts/')
+        other = UserModel.objects.create_user(
+            username='other_cache', password='x', is_staff=True
+        )
+        client = APIClient()
+        client.force_authenticate(user=other)
+
+        with CaptureQueriesContext(connection) as queries:
+            client.get('/accounts/')
+
+        assert _account_selects(queries)
+
+    def test_contact_writes_do_not_invalidate_account_lists(
+        self, django_capture_on_commit_callbacks
+    ):
+        """Test invalidation is scoped to the written model."""
+        self.client.get('/accounts/')
+        with django_capture_on_commit_callbacks(execute=True):
+            ContactService.create_contact(
+                {'first_name': 'Jane', 'account': Account.objects.first()}, self.user
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/accounts/')
+
+        assert not _account_selects(queries)
+        assert Contact.objects.count() == 1
+
+    def test_contact_writes_invalidate_lists_embedding_contacts(
+        self, django_capture_on_commit_callbacks
+    ):
+        """Test ?include= lists also depend on the Contact generation."""
+        params = {'include': 'contact_count', 'ordering': 'name'}
+        account = Account.objects.order_by('name').first()
+        assert self.client.get('/accounts/', params).data['results'][0]['contact_count'] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ContactService.create_contact(
+                {'first_name': 'Jane', 'account': account}, self.user
+            )
+
+        rows = self.client.get('/accounts/', params).data['results']
+        assert rows[0]['contact_count'] == 1
+
+
+class TestListCacheCheck:
+    """Tests for the core.W001 system check."""
+
+    def test_warns_when_enabled_on_process_local_cache(self, settings):
+        """Test enabling the list cache on LocMemCache is flagged."""
+        settings.LIST_CACHE_TIMEOUT = 60
+
+        assert [warning.id for warning in check_list_cache_backend(None)] == ['core.W001']
+
+    def test_silent_when_disabled(self, settings):
+        """Test the default (disabled) configuration passes."""
+        settings.LIST_CACHE_TIMEOUT = 0
+
+        assert not check_list_cache_backend(None)
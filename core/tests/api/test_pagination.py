@@ -0,0 +1,191 @@
+"""API tests for list pagination and count strategies."""
+from datetime import timedelta
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.api.pagination import (
+    COUNT_CACHED,
+    COUNT_ESTIMATED,
+    COUNT_EXACT,
+    COUNT_NONE,
+)
+from core.api.views.account import AccountViewSet
+from core.models import Account, AccountStatus, Contact
+
+UserModel = get_user_model()
+
+
+def _cursor_params(link):
+    """Extract query params from a pagination link as a flat dict."""
+    return {key: values[0] for key, values in parse_qs(urlparse(link).query).items()}
+
+
+@pytest.mark.django_db
+class TestAccountCursorPagination:
+    """Tests for GET /accounts/?cursor= keyset pagination."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+
+    def setup_method(self):
+        """Set up test client, user and five accounts."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_cursor',
+            password='testpass123',
+            is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+        for index in range(5):
+            Account.objects.create(
+                name=f'Account {index}',
+                status=AccountStatus.ACTIVE if index % 2 else AccountStatus.PROSPECT,
+                owner_user=self.user,
+            )
+
+    def _walk(self, params):
+        """Follow next links from the first page and collect all names."""
+        names = []
+        response = self.client.get('/accounts/', params, format='json')
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            assert 'count' not in response.data
+            names.extend(row['name'] for row in response.data['results'])
+            if not response.data['next']:
+                return names
+            response = self.client.get(
+                '/accounts/', _cursor_params(response.data['next']), format='json'
+            )
+
+    def test_cursor_pages_cover_all_rows_in_created_order(self):
+        """Test walking next links returns every row once, newest first."""
+        names = self._walk({'cursor': '', 'page_size': 2})
+        assert names == [f'Account {index}' for index in range(4, -1, -1)]
+
+    def test_cursor_breaks_created_at_ties_by_id(self):
+        """Test rows sharing created_at are neither skipped nor repeated."""
+        Account.objects.update(created_at=timezone.now() - timedelta(days=1))
+        names = self._walk({'cursor': '', 'page_size': 2})
+        assert sorted(names) == [f'Account {index}' for index in range(5)]
+        assert len(names) == 5
+
+    def test_cursor_pagination_respects_filters(self):
+        """Test filterset fields still apply in cursor mode."""
+        names = self._walk(
+            {'cursor': '', 'page_size': 1, 'status': AccountStatus.ACTIVE}
+        )
+        assert names == ['Account 3', 'Account 1']
+
+    def test_previous_link_returns_preceding_page(self):
+        """Test the previous link walks back to the earlier page."""
+        first = self.client.get('/accounts/', {'cursor': '', 'page_size': 2})
+        second = self.client.get('/accounts/', _cursor_params(first.data['next']))
+        assert first.data['previous'] is None
+
+        back = self.client.get('/accounts/', _cursor_params(second.data['previous']))
+        assert back.status_code == status.HTTP_200_OK
+        assert back.data['results'] == first.data['results']
+        assert back.data['previous'] is None
+
+    def test_invalid_cursor_returns_404(self):
+        """Test a malformed cursor is rejected."""
+        response = self.client.get('/accounts/', {'cursor': 'not-a-cursor'})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_page_number_pagination_remains_default(self):
+        """Test requests without a cursor keep page-number responses."""
+        response = self.client.get('/accounts/', {'page_size': 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 5
+
+    def test_account_contacts_action_supports_cursor(self):
+        """Test GET /accounts/{id}/contacts/?cursor= paginates contacts."""
+        account = Account.objects.first()
+        for index in range(3):
+            Contact.objects.create(first_name=f'Contact {index}', account=account)
+
+        response = self.client.get(
+            f'/accounts/{account.id}/contacts/', {'cursor': '', 'page_size': 2}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 2
+        assert response.data['next'] is not None
+
+
+@pytest.mark.django_db
+class TestAccountCountStrategies:
+    """Tests for the configurable total-count strategies on /accounts/."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+
+    def setup_method(self):
+        """Set up test client, user and three accounts."""
+        cache.clear()
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_count',
+            password='testpass123',
+            is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+        for index in range(3):
+            Account.objects.create(name=f'Account {index}', owner_user=self.user)
+
+    def test_exact_strategy_is_default(self):
+        """Test the default response reports an exact count."""
+        response = self.client.get('/accounts/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        assert response.data['count_strategy'] == COUNT_EXACT
+
+    def test_none_strategy_omits_count(self, monkeypatch):
+        """Test the none strategy returns has_next instead of count."""
+        monkeypatch.setattr(AccountViewSet, 'count_strategy', COUNT_NONE)
+
+        first = self.client.get('/accounts/', {'page_size': 2})
+        assert 'count' not in first.data
+        assert first.data['count_strategy'] == COUNT_NONE
+        assert first.data['has_next'] is True
+        assert len(first.data['results']) == 2
+
+        second = self.client.get('/accounts/', {'page_size': 2, 'page': 2})
+        assert second.data['has_next'] is False
+        assert second.data['next'] is None
+        assert len(second.data['results']) == 1
+
+    def test_none_strategy_rejects_page_past_end(self, monkeypatch):
+        """Test an empty page beyond the data returns 404."""
+        monkeypatch.setattr(AccountViewSet, 'count_strategy', COUNT_NONE)
+        response = self.client.get('/accounts/', {'page_size': 2, 'page': 5})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_cached_strategy_reuses_count_per_filter_signature(self, monkeypatch):
+        """Test cached counts are reused until the TTL expires."""
+        monkeypatch.setattr(AccountViewSet, 'count_strategy', COUNT_CACHED)
+
+        assert self.client.get('/accounts/').data['count'] == 3
+        Account.objects.create(
+            name='Account 3', status=AccountStatus.ACTIVE, owner_user=self.user
+        )
+
+        response = self.client.get('/accounts/')
+        assert response.data['count_strategy'] == COUNT_CACHED
+        assert response.data['count'] == 3
+
+        filtered = self.client.get('/accounts/', {'status': AccountStatus.ACTIVE})
+        assert filtered.data['count'] == 1
+
+    def test_estimated_strategy_falls_back_to_exact_on_sqlite(self, monkeypatch):
+        """Test backends without planner estimates report an exact count."""
+        monkeypatch.setattr(AccountViewSet, 'count_strategy', COUNT_ESTIMATED)
+        response = self.client.get('/accounts/')
+        assert response.data['count'] == 3
+        assert response.data['count_strategy'] == COUNT_EXACT
@@ -0,0 +1,77 @@
+"""API tests for read-your-writes routing with a read replica."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.middleware import PRIMARY_UNTIL_COOKIE
+from core.models import Account
+
+UserModel = get_user_model()
+
+
+@pytest.mark.django_db(databases=['default', 'replica'], transaction=True)
+class TestReadReplica:
+    """
+    Tests with the test replica standing in for a lagging replica: it is a
+    separate SQLite database that never receives the primary's writes.
+    Transactional so requests do not run inside the test's atomic block,
+    which would pin every read to the primary.
+    """
+
+    writer: Optional[APIClient]
+    reader: Optional[APIClient]
+    user: Optional[object]
+
+    @pytest.fixture(autouse=True)
+    def _replicas(self, settings):
+        settings.DATABASE_REPLICAS = ['replica']
+        settings.REPLICA_STICKY_SECONDS = 5
+
+    def setup_method(self):
+        """Set up two clients for the same user."""
+        self.user = UserModel.objects.create_user(username='testuser_replica')
+        self.writer = APIClient()
+        self.writer.force_authenticate(user=self.user)
+        self.reader = APIClient()
+        self.reader.force_authenticate(user=self.user)
+
+    def _create(self):
+        response = self.writer.post('/accounts/', {'name': 'Acme'}, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+        return response, Account.objects.using('default').get(name='Acme')
+
+    def test_writer_reads_its_own_write(self):
+        """Test the client that wrote reads from the primary afterwards."""
+        response, account = self._create()
+
+        assert PRIMARY_UNTIL_COOKIE in response.cookies
+        detail = self.writer.get(f'/accounts/{account.pk}/')
+        assert detail.status_code == status.HTTP_200_OK
+        assert detail.data['name'] == 'Acme'
+
+    def test_other_clients_read_from_replica(self):
+        """Test a client without the cookie reads from the replica."""
+        _, account = self._create()
+
+        detail = self.reader.get(f'/accounts/{account.pk}/')
+        assert detail.status_code == status.HTTP_404_NOT_FOUND
+        assert Account.objects.using('replica').count() == 0
+
+    def test_reads_do_not_set_cookie(self):
+        """Test requests that did not write leave stickiness alone."""
+        response = self.reader.get('/accounts/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert PRIMARY_UNTIL_COOKIE not in response.cookies
+
+    def test_replica_pages_are_not_cached(self, settings):
+        """Test a lagging replica's page does not outlive the replica lag in the cache."""
+        self._create()
+        assert self.reader.get('/accounts/').data['count'] == 0
+
+        # The replica catches up: reads now see what the primary has
+        settings.DATABASE_REPLICAS = []
+        assert self.reader.get('/accounts/').data['count'] == 1
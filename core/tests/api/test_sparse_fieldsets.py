@@ -0,0 +1,94 @@
+"""API tests for ?fields= / ?exclude= sparse fieldsets."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact
+
+UserModel = get_user_model()
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """Tests for field selection on account and contact endpoints."""
+
+    client: Optional[APIClient]
+    user: Optional[object]
+
+    def setup_method(self):
+        """Set up test client, user and one account with a contact."""
+        self.client = APIClient()
+        self.user = UserModel.objects.create_user(
+            username='testuser_fields',
+            password='testpass123',
+            is_staff=True
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            name='Acme',
+            description='Long text that grids never render',
+            owner_user=self.user,
+        )
+        self.contact = Contact.objects.create(
+            first_name='Jane', last_name='Doe', account=self.account
+        )
+
+    def test_fields_limits_list_output(self):
+        """Test ?fields= returns only the requested fields."""
+        response = self.client.get('/accounts/', {'fields': 'id,name,status'})
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data['results'][0]) == {'id', 'name', 'status'}
+
+    def test_fields_projects_columns_in_sql(self):
+        """Test unrequested columns are not selected from the database."""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/accounts/', {'fields': 'id,name'})
+
+        select = [
+            q['sql'] for q in queries
+            if 'FROM "core_account"' in q['sql'] and 'COUNT' not in q['sql']
+        ][0]
+        assert '"core_account"."name"' in select
+        assert '"core_account"."description"' not in select
+        assert '"core_account"."billing_street"' not in select
+
+    def test_exclude_removes_fields(self):
+        """Test ?exclude= drops the listed fields."""
+        response = self.client.get(
+            f'/accounts/{self.account.id}/', {'exclude': 'description,website'}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert 'description' not in response.data
+        assert 'website' not in response.data
+        assert response.data['name'] == 'Acme'
+
+    def test_unknown_field_returns_400(self):
+        """Test unknown field names are rejected."""
+        response = self.client.get('/accounts/', {'fields': 'name,bogus'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'bogus' in str(response.data['fields'])
+
+    def test_contact_computed_field_loads_its_sources(self):
+        """Test full_name renders when only it is requested."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/contacts/', {'fields': 'full_name,account'})
+
+        assert response.data['results'] == [
+            {'full_name': 'Jane Doe', 'account': self.account.id}
+        ]
+        contact_selects = [q for q in queries if 'FROM "core_contact"' in q['sql']]
+        # ETag state, COUNT + page, no deferred-field loads
+        assert len(contact_selects) == 3
+
+    def test_fields_ignored_on_writes(self):
+        """Test write responses are not trimmed."""
+        response = self.client.patch(
+            f'/accounts/{self.account.id}/?fields=id', {'name': 'Acme 2'}, format='json'
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['name'] == 'Acme 2'
@@ -0,0 +1,101 @@
+"""Tests for the values()-based list render path."""
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.api.serializers import (
+    AccountSerializer,
+    ContactSerializer,
+    ValuesRowSerializer,
+)
+from core.api.views.account import AccountViewSet
+from core.api.views.contact import ContactViewSet
+from core.models import Account, AccountStatus, CompanySize, Contact
+
+UserModel = get_user_model()
+
+
+def _render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+class TestValuesRowSerializer:
+    """Tests for byte-identical output against the model serializers."""
+
+    user: Optional[object]
+
+    def setup_method(self):
+        """Create an account with every kind of column filled and one sparse."""
+        self.user = UserModel.objects.create_user(username='testuser_values')
+        full = Account.objects.create(
+            name='Acme',
+            account_number='ACC-001',
+            status=AccountStatus.ACTIVE,
+            company_size=CompanySize.SIZE_200_PLUS,
+            annual_revenue=Decimal('1234.5'),
+            website='https://acme.com',
+            owner_user=self.user,
+            created_by=self.user,
+        )
+        Account.objects.create(name='Sparse')
+        Contact.objects.create(first_name='Jane', last_name='Doe', account=full)
+        Contact.objects.create(first_name='John', account=full, owner_user=self.user)
+
+    @pytest.mark.parametrize('serializer_class', [AccountSerializer, ContactSerializer])
+    def test_output_matches_serializer(self, serializer_class):
+        """Test values() rows render to the same bytes as model instances."""
+        queryset = serializer_class.Meta.model.objects.order_by('created_at')
+        serializer = serializer_class()
+        row_serializer = ValuesRowSerializer.for_serializer(serializer)
+
+        expected = serializer_class(queryset, many=True).data
+        actual = row_serializer.render(queryset.values(*row_serializer.columns))
+
+        assert _render(actual) == _render(expected)
+
+    def test_trimmed_serializer_reads_only_requested_columns(self):
+        """Test ?fields= trimming carries over, computed fields included."""
+        context = {'requested_fields': ['full_name', 'account']}
+        row_serializer = ValuesRowSerializer.for_serializer(
+            ContactSerializer(context=context)
+        )
+
+        assert row_serializer.columns == ['first_name', 'last_name', 'account_id']
+        rows = row_serializer.render(
+            Contact.objects.order_by('created_at').values(*row_serializer.columns)
+        )
+        assert [row['full_name'] for row in rows] == ['Jane Doe', 'John']
+
+
+@pytest.mark.django_db
+class TestValuesListEndpoints:
+    """Tests for list endpoints with and without the fast path."""
+
+    client: Optional[APIClient]
+
+    def setup_method(self):
+        """Set up a staff client with an account and contact."""
+        self.client = APIClient()
+        user = UserModel.objects.create_user(username='testuser_fast', is_staff=True)
+        self.client.force_authenticate(user=user)
+        account = Account.objects.create(
+            name='Acme', annual_revenue=Decimal('10'), owner_user=user
+        )
+        Contact.objects.create(first_name='Jane', account=account)
+
+    @pytest.mark.parametrize(
+        'path, viewset',
+        [('/accounts/', AccountViewSet), ('/contacts/', ContactViewSet)],
+    )
+    def test_fast_path_response_is_identical(self, monkeypatch, path, viewset):
+        """Test the response body does not change when the fast path is on."""
+        fast = self.client.get(path, {'cursor': ''}).content
+        monkeypatch.setattr(viewset, 'values_list_render', False)
+        slow = self.client.get(path, {'cursor': ''}).content
+
+        assert fast == slow
@@ -0,0 +1,83 @@
+"""API tests for owner-scoped visibility of accounts and contacts."""
+from typing import Optional
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact
+
+UserModel = get_user_model()
+
+
+def _user_selects(queries):
+    return [q for q in queries if 'FROM "auth_user"' in q['sql']]
+
+
+@pytest.mark.django_db
+class TestOwnerVisibility:
+    """Tests for list and detail scoping by owner_user_id."""
+
+    client: Optional[APIClient]
+    owner: Optional[object]
+    account: Optional[Account]
+    contact: Optional[Contact]
+
+    def setup_method(self):
+        """Set up a non-admin owner with one account/contact, and another user's rows."""
+        self.owner = UserModel.objects.create_user(username='owner_visibility')
+        other = UserModel.objects.create_user(username='other_visibility')
+        self.account = Account.objects.create(name='Mine', owner_user=self.owner)
+        self.contact = Contact.objects.create(
+            first_name='Mine', account=self.account, owner_user=self.owner
+        )
+        theirs = Account.objects.create(name='Theirs', owner_user=other)
+        Contact.objects.create(first_name='Theirs', account=theirs, owner_user=other)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    @pytest.mark.parametrize('path', ['/accounts/', '/contacts/'])
+    def test_lists_only_contain_own_rows(self, path):
+        """Test non-admins page through their own rows only."""
+        response = self.client.get(path)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 1
+        assert response.data['results'][0]['id'] == str(
+            self.account.id if path == '/accounts/' else self.contact.id
+        )
+
+    def test_staff_lists_all_rows(self):
+        """Test admins are not scoped."""
+        staff = UserModel.objects.create_user(username='staff_visibility', is_staff=True)
+        self.client.force_authenticate(user=staff)
+        assert self.client.get('/accounts/').data['count'] == 2
+
+    def test_other_users_contact_is_not_found(self):
+        """Test detail lookups are scoped too."""
+        theirs = Contact.objects.get(first_name='Theirs')
+        response = self.client.get(f'/contacts/{theirs.id}/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_other_users_contact_cannot_be_deleted(self):
+        """Test writes to rows owned by someone else are forbidden."""
+        theirs = Contact.objects.get(first_name='Theirs')
+        response = self.client.delete(f'/contacts/{theirs.id}/')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @pytest.mark.parametrize('resource', ['accounts', 'contacts'])
+    def test_owner_checks_do_not_query_the_user_table(self, resource):
+        """Test retrieve and update compare owner ids without loading users."""
+        pk = self.account.id if resource == 'accounts' else self.contact.id
+        with CaptureQueriesContext(connection) as queries:
+            retrieved = self.client.get(f'/{resource}/{pk}/', {'fields': 'id'})
+            updated = self.client.patch(
+                f'/{resource}/{pk}/', {'first_name': 'Renamed', 'name': 'Renamed'}
+            )
+
+        assert retrieved.status_code == status.HTTP_200_OK
+        assert updated.status_code == status.HTTP_200_OK
+        assert not _user_selects(queries)
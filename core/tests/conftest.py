@@ -1,6 +1,7 @@
 """Shared pytest fixtures for core app tests."""
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 from core.models import Account, AccountStatus, AccountType
 
@@ -37,3 +38,10 @@ def account(db, test_user):  # pylint: disable=unused-argument,redefined-outer-n
         type=AccountType.CUSTOMER,
         owner_user=test_user,
     )
+
+
+@pytest.fixture(autouse=True)
+def list_cache(settings):
+    """Run every test against an enabled, empty list response cache."""
+    settings.LIST_CACHE_TIMEOUT = 60
+    cache.clear()
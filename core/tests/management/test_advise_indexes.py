@@ -0,0 +1,50 @@
+"""Tests for the advise_indexes management command."""
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from core.management.commands.advise_indexes import Command
+from core.models import Account, Contact
+
+
+@pytest.mark.django_db
+class TestAdviseIndexesCommand:
+    """Tests for ``manage.py advise_indexes``."""
+
+    def _run(self, *args):
+        stdout = StringIO()
+        call_command("advise_indexes", "--seed", "200", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_reports_unindexed_sorts_and_proposes_indexes(self):
+        """Test flagged requests and proposed indexes are printed."""
+        output = self._run("--max-filters", "1")
+
+        assert "GET /accounts/?ordering=name: FILESORT" in output
+        assert "GET /contacts/?role=<v>&ordering=first_name" in output
+        assert "models.Index(fields=['type', 'name']" in output
+        assert "migrations.AddIndex(model_name=" in output
+
+    def test_does_not_propose_existing_indexes(self):
+        """Test an index already on Meta.indexes is not proposed again."""
+        output = self._run("--max-filters", "0", "--top", "100")
+
+        assert "fields=['owner_user']" not in output
+        assert "fields=['name']" in output
+
+    def test_live_partial_indexes_cover_list_queries(self):
+        """Test ``is_invalid=False`` partial indexes count as existing for list queries."""
+        assert Command._covered_by_existing(Account, ("status",))
+        assert Command._covered_by_existing(Contact, ("created_at", "id"))
+        # account_deleted_idx only holds soft-deleted rows
+        assert not Command._covered_by_existing(Account, ("updated_at",))
+
+    def test_seed_data_is_rolled_back(self):
+        """Test the command leaves the database unchanged."""
+        self._run("--max-filters", "0")
+
+        assert Account.objects.count() == 0
+        assert Contact.objects.count() == 0
+        assert not get_user_model().objects.exists()
@@ -0,0 +1,43 @@
+"""Tests for the archive_records management command."""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from core.models import Account, ArchivedAccount
+
+
+def _run(*args):
+    stdout = StringIO()
+    call_command("archive_records", *args, stdout=stdout)
+    return stdout.getvalue()
+
+
+@pytest.mark.django_db
+class TestArchiveRecordsCommand:
+    """Tests for ``manage.py archive_records``."""
+
+    def test_archive_restore_and_purge(self, account):
+        """Test each operation reports what it moved."""
+        Account.objects.filter(pk=account.pk).update(
+            is_invalid=True, updated_at=timezone.now() - timedelta(days=10)
+        )
+
+        assert "Archived 0 account(s)" in _run("archive")
+        assert "Archived 1 account(s)" in _run("archive", "--retention-days", "7")
+        assert "Restored 1 account(s)" in _run("restore", "--accounts", str(account.pk))
+        assert Account.objects.filter(pk=account.pk).exists()
+
+        Account.objects.filter(pk=account.pk).update(
+            is_invalid=True, updated_at=timezone.now() - timedelta(days=10)
+        )
+        _run("archive", "--retention-days", "7")
+        assert "Purged 1 account(s)" in _run("purge", "--purge-days", "0")
+        assert not ArchivedAccount.objects.exists()
+
+    def test_restore_errors_are_reported(self):
+        """Test invalid ids fail with a command error."""
+        with pytest.raises(CommandError):
+            _run("restore", "--accounts", "not-a-uuid")
@@ -1,5 +1,7 @@
 """Tests for AccountManager custom manager."""
 import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
 
 from core.models import Account, AccountStatus, CompanySize
 
@@ -161,3 +163,38 @@ class TestAccountManager:
         filtered = Account.objects.filter_by_params(owner=test_user)
         assert filtered.count() == 1
         assert filtered.first().name == "User 1 Account"
+
+    def test_visible_to_scopes_non_staff_users_to_their_accounts(
+        self, test_user, test_user_2
+    ):
+        """Test visible_to() filters by owner id unless the user is staff."""
+        Account.objects.create(name="User 1 Account", owner_user=test_user)
+        Account.objects.create(name="User 2 Account", owner_user=test_user_2)
+        Account.objects.create(name="Unowned Account")
+
+        visible = Account.objects.visible_to(test_user)
+        assert [account.name for account in visible] == ["User 1 Account"]
+        assert "auth_user" not in str(visible.query)
+
+        test_user_2.is_staff = True
+        assert Account.objects.visible_to(test_user_2).count() == 3
+
+    def test_visible_to_anonymous_user_returns_nothing(self, test_user):
+        """Test anonymous users never match unowned rows."""
+        Account.objects.create(name="Unowned Account")
+        assert not Account.objects.visible_to(AnonymousUser()).exists()
+
+    def test_default_manager_excludes_soft_deleted_accounts(self, test_user):
+        """Test objects hides is_invalid rows and with_deleted() shows them."""
+        Account.objects.create(name="Live Account", owner_user=test_user)
+        Account.objects.create(name="Deleted Account", is_invalid=True)
+
+        assert [account.name for account in Account.objects.all()] == ["Live Account"]
+        assert Account.objects.with_deleted().count() == 2
+        assert Account.objects.by_owner(test_user).count() == 1
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite plan format")
+    def test_live_list_query_uses_partial_index(self, test_user):
+        """Test the default list ordering is served by the partial index."""
+        plan = Account.objects.order_by("-created_at", "-id").explain()
+        assert "account_created_live_idx" in plan
@@ -0,0 +1,126 @@
+"""Tests for ContactManager custom manager."""
+import pytest
+from django.db import connection
+from django.db.models import Count, OuterRef, Subquery
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact, ContactRole, ContactSeniority
+from core.services import ContactService
+
+
+def _sql(queries):
+    return [query["sql"] for query in queries]
+
+
+@pytest.mark.django_db
+class TestContactManager:
+    """Test ContactManager custom methods and their query plans."""
+
+    def test_default_manager_excludes_soft_deleted_contacts(self, account):
+        """Test objects hides is_invalid rows and with_deleted() shows them."""
+        Contact.objects.create(first_name="Live", account=account)
+        Contact.objects.create(first_name="Deleted", account=account, is_invalid=True)
+
+        assert [contact.first_name for contact in Contact.objects.all()] == ["Live"]
+        assert Contact.objects.with_deleted().count() == 2
+        assert Contact.objects.with_deleted().active().count() == 1
+
+    def test_by_owner_and_filter_by_params_chain(self, test_user, test_user_2, account):
+        """Test chainable filters combine into one query."""
+        Contact.objects.create(
+            first_name="Match",
+            role=ContactRole.DECISION_MAKER,
+            seniority=ContactSeniority.EXECUTIVE,
+            account=account,
+            owner_user=test_user,
+        )
+        Contact.objects.create(
+            first_name="Other Owner",
+            role=ContactRole.DECISION_MAKER,
+            account=account,
+            owner_user=test_user_2,
+        )
+        Contact.objects.create(
+            first_name="Other Role",
+            role=ContactRole.USER,
+            account=account,
+            owner_user=test_user,
+        )
+
+        chained = Contact.objects.by_owner(test_user).filter_by_params(
+            role=ContactRole.DECISION_MAKER, account=account
+        )
+        assert [contact.first_name for contact in chained] == ["Match"]
+        assert Contact.objects.filter_by_params().count() == 3
+
+    def test_for_account_primary_is_one_query_without_joins(self, account):
+        """Test for_account().primary() filters on columns of the contact table."""
+        other = Account.objects.create(name="Other")
+        Contact.objects.create(first_name="Primary", primary_contact=True, account=account)
+        Contact.objects.create(first_name="Secondary", account=account)
+        Contact.objects.create(first_name="Elsewhere", primary_contact=True, account=other)
+
+        with CaptureQueriesContext(connection) as queries:
+            names = [c.first_name for c in Contact.objects.for_account(account.pk).primary()]
+
+        assert names == ["Primary"]
+        assert len(queries) == 1
+        assert "JOIN" not in _sql(queries)[0]
+
+    def test_with_account_reads_accounts_in_the_same_query(self, account):
+        """Test with_account() avoids one account query per contact."""
+        for index in range(3):
+            Contact.objects.create(first_name=f"Contact {index}", account=account)
+
+        with CaptureQueriesContext(connection) as queries:
+            names = [contact.account.name for contact in Contact.objects.with_account()]
+
+        assert names == ["Test Corp"] * 3
+        assert len(queries) == 1
+
+    def test_for_account_accepts_outer_ref(self, account):
+        """Test for_account() works inside correlated subqueries."""
+        Contact.objects.create(first_name="Jane", account=account)
+        Contact.objects.create(first_name="John", account=account)
+        counts = (
+            Contact.objects.for_account(OuterRef("pk"))
+            .order_by()
+            .values("account")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            annotated = Account.objects.annotate(contact_count=Subquery(counts)).get()
+
+        assert annotated.contact_count == 2
+        assert len(queries) == 1
+
+    def test_service_lists_account_contacts_in_one_query(self, test_user, account):
+        """Test ContactService.list_account_contacts uses the manager plan."""
+        Contact.objects.create(first_name="Mine", account=account, owner_user=test_user)
+        Contact.objects.create(first_name="Deleted", account=account, is_invalid=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            contacts = list(
+                ContactService.list_account_contacts(account.pk, user=test_user)
+            )
+
+        assert [contact.first_name for contact in contacts] == ["Mine"]
+        assert len(queries) == 1
+        assert "JOIN" not in _sql(queries)[0]
+
+    def test_contact_list_endpoint_does_not_join_accounts(self, test_user, account):
+        """Test /contacts/ renders ``account`` as an id, so no account join is needed."""
+        Contact.objects.create(first_name="Mine", account=account, owner_user=test_user)
+        client = APIClient()
+        client.force_authenticate(user=test_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/contacts/", {"account": str(account.pk)})
+
+        assert [row["account"] for row in response.data["results"]] == [account.pk]
+        contact_queries = [sql for sql in _sql(queries) if '"core_contact"' in sql]
+        assert contact_queries
+        assert not [sql for sql in contact_queries if '"core_account"' in sql]
@@ -67,3 +67,35 @@ class TestFiltering:
         Account.objects.create(name="User2 Corp", owner_user=test_user_2)
         user1_accounts = Account.objects.filter(owner_user=test_user)
         assert user1_accounts.count() == 1
+
+
+class TestAccountDirtyFields:
+    """Test change tracking on Account."""
+
+    def test_loaded_account_has_no_dirty_fields(self, db, account):  # pylint: disable=unused-argument
+        """Test a freshly loaded or saved account reports no changes."""
+        assert account.get_dirty_fields() == []
+        assert Account.objects.get(pk=account.pk).get_dirty_fields() == []
+
+    def test_assignments_are_compared_with_loaded_values(self, db, account, test_user_2):  # pylint: disable=unused-argument
+        """Test only assignments that change a value are reported."""
+        loaded = Account.objects.get(pk=account.pk)
+        loaded.name = loaded.name
+        loaded.status = AccountStatus.ACTIVE
+        loaded.owner_user = test_user_2
+
+        assert loaded.get_dirty_fields() == ["status", "owner_user"]
+
+        loaded.save(update_fields=["status"])
+        assert loaded.get_dirty_fields() == ["owner_user"]
+
+    def test_deferred_fields_are_tracked_once_loaded(self, db, account):  # pylint: disable=unused-argument
+        """Test fields loaded on access are not reported as changed."""
+        loaded = Account.objects.only("id").get(pk=account.pk)
+        assert loaded.industry is None
+
+        assert loaded.get_dirty_fields() == []
+
+    def test_unsaved_account_is_all_dirty(self):
+        """Test an account never loaded from the database reports every field."""
+        assert "name" in Account(name="New").get_dirty_fields()
@@ -0,0 +1 @@
+"""Search index tests."""
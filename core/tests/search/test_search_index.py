@@ -0,0 +1,160 @@
+"""Tests for the full-text search index and its API filter."""
+import pytest
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact
+from core.search import search_index
+from core.services import AccountService, ContactService
+
+
+@pytest.mark.django_db
+class TestSearchIndex:
+    """Test index maintenance through the service layer."""
+
+    def test_created_account_is_searchable_by_prefix(self, test_user):
+        """Test accounts created via the service are indexed."""
+        account = AccountService.create_account({"name": "Acme Corporation"}, test_user)
+
+        assert search_index.search(Account, ["acm"], using="default") == [account.pk]
+
+    def test_all_terms_must_match(self, test_user):
+        """Test multi-term searches require every term."""
+        acme = AccountService.create_account(
+            {"name": "Acme", "industry": "Technology"}, test_user
+        )
+        AccountService.create_account({"name": "Acme", "industry": "Finance"}, test_user)
+
+        assert search_index.search(Account, ["acme", "tech"], using="default") == [
+            acme.pk
+        ]
+
+    def test_name_matches_rank_above_industry_matches(self, test_user):
+        """Test results are ordered by weighted relevance."""
+        by_industry = AccountService.create_account(
+            {"name": "Globex", "industry": "Solar"}, test_user
+        )
+        by_name = AccountService.create_account(
+            {"name": "Solar Systems", "industry": "Energy"}, test_user
+        )
+
+        assert search_index.search(Account, ["solar"], using="default") == [
+            by_name.pk,
+            by_industry.pk,
+        ]
+
+    def test_update_reindexes_changed_fields(self, test_user):
+        """Test updates replace the indexed document."""
+        account = AccountService.create_account({"name": "Old Name"}, test_user)
+        AccountService.update_account(account, {"name": "New Name"}, test_user)
+
+        assert search_index.search(Account, ["old"], using="default") == []
+        assert search_index.search(Account, ["new"], using="default") == [account.pk]
+
+    def test_soft_delete_removes_from_index(self, test_user):
+        """Test soft-deleted rows no longer match."""
+        account = AccountService.create_account({"name": "Initech"}, test_user)
+        AccountService.soft_delete_account(account, test_user)
+
+        assert search_index.search(Account, ["initech"], using="default") == []
+
+    def test_contact_email_is_searchable(self, test_user, account):
+        """Test contact e-mail tokens are indexed."""
+        contact = ContactService.create_contact(
+            {"first_name": "Jane", "email": "jane.doe@example.com", "account": account},
+            test_user,
+        )
+
+        assert search_index.search(Contact, ["jane.doe"], using="default") == [
+            contact.pk
+        ]
+
+    def test_operator_characters_are_ignored(self, test_user):
+        """Test FTS query syntax in user input cannot break the query."""
+        AccountService.create_account({"name": "Acme"}, test_user)
+
+        assert search_index.search(Account, ['"*) OR (', "NOT"], using="default") == []
+
+    def test_rebuild_indexes_rows_written_outside_services(self, test_user):
+        """Test rebuild picks up rows created directly through the ORM."""
+        account = Account.objects.create(name="Hooli", owner_user=test_user)
+        assert search_index.search(Account, ["hooli"], using="default") == []
+
+        search_index.rebuild(Account)
+
+        assert search_index.search(Account, ["hooli"], using="default") == [account.pk]
+
+
+@pytest.mark.django_db
+class TestFullTextSearchFilter:
+    """Test ?search= on the list endpoints."""
+
+    def test_search_results_are_ranked_by_relevance(self, test_user):
+        """Test the list endpoint keeps relevance order without ?ordering=."""
+        AccountService.create_account({"name": "Zeta", "industry": "Solar"}, test_user)
+        AccountService.create_account({"name": "Solar Systems"}, test_user)
+        client = APIClient()
+        client.force_authenticate(user=test_user)
+
+        response = client.get("/accounts/", {"search": "solar"})
+
+        names = [row["name"] for row in response.data["results"]]
+        assert names == ["Solar Systems", "Zeta"]
+
+    def test_explicit_ordering_overrides_relevance(self, test_user):
+        """Test ?ordering= wins over relevance ranking."""
+        AccountService.create_account({"name": "Zeta", "industry": "Solar"}, test_user)
+        AccountService.create_account({"name": "Solar Systems"}, test_user)
+        client = APIClient()
+        client.force_authenticate(user=test_user)
+
+        response = client.get("/accounts/", {"search": "solar", "ordering": "-name"})
+
+        names = [row["name"] for row in response.data["results"]]
+        assert names == ["Zeta", "Solar Systems"]
+
+    def test_search_is_scoped_before_ranking(self, settings, test_user, test_user_2):
+        """Test other owners' better matches do not crowd out the user's own."""
+        settings.SEARCH_MAX_RESULTS = 2
+        for index in range(3):
+            AccountService.create_account({"name": f"Solar {index}"}, test_user_2)
+        AccountService.create_account({"name": "Mine", "industry": "Solar"}, test_user)
+        client = APIClient()
+        client.force_authenticate(user=test_user)
+
+        response = client.get("/accounts/", {"search": "solar"})
+
+        assert response.data["count"] == 1
+        assert [row["name"] for row in response.data["results"]] == ["Mine"]
+
+    def test_search_combines_with_include(self, test_user):
+        """Test the searched queryset can be nested (the ?include= ETag subquery)."""
+        account = AccountService.create_account({"name": "Test Corp"}, test_user)
+        ContactService.create_contact({"first_name": "Jane", "account": account}, test_user)
+        AccountService.create_account({"name": "Test Corp Two"}, test_user)
+        AccountService.create_account({"name": "Other"}, test_user)
+        client = APIClient()
+        client.force_authenticate(user=test_user)
+        params = {"search": "test corp", "include": "contact_count"}
+
+        response = client.get("/accounts/", params)
+
+        assert response.status_code == 200
+        rows = {row["name"]: row["contact_count"] for row in response.data["results"]}
+        assert rows == {"Test Corp": 1, "Test Corp Two": 0}
+        repeat = client.get("/accounts/", params, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert repeat.status_code == 304
+
+    def test_contact_search(self, test_user, account):
+        """Test ?search= on /contacts/ uses the contact index."""
+        ContactService.create_contact(
+            {"first_name": "Jane", "last_name": "Doe", "account": account}, test_user
+        )
+        ContactService.create_contact(
+            {"first_name": "John", "last_name": "Smith", "account": account}, test_user
+        )
+        client = APIClient()
+        client.force_authenticate(user=test_user)
+
+        response = client.get("/contacts/", {"search": "doe"})
+
+        assert [row["full_name"] for row in response.data["results"]] == ["Jane Doe"]
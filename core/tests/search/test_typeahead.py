@@ -0,0 +1,207 @@
+"""Tests for the in-process typeahead prefix index and endpoint."""
+import threading
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from core.models import Account, Contact
+from core.search import get_typeahead_index
+from core.search.typeahead import PrefixIndex, TypeaheadIndex
+from core.services import AccountService, ContactService
+
+UserModel = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def fresh_typeahead_indexes():
+    """Start every test from an empty (unloaded) index."""
+    for model in (Account, Contact):
+        get_typeahead_index(model).clear()
+    yield
+    for model in (Account, Contact):
+        get_typeahead_index(model).clear()
+
+
+class TestPrefixIndex:
+    """Test the sorted-array prefix index."""
+
+    def test_matches_any_word_start(self):
+        """Test prefixes match the start of any word in the label."""
+        index = PrefixIndex()
+        index.add(1, "Acme Corporation")
+        index.add(2, "Corp Solutions")
+
+        assert index.search("corp", 10) == [2, 1]
+        assert index.search("acme c", 10) == [1]
+        assert index.search("orp", 10) == []
+
+    def test_remove_drops_every_key(self):
+        """Test remove deletes all word keys of a label."""
+        index = PrefixIndex()
+        index.add(1, "Acme Corporation")
+        index.remove(1, "Acme Corporation")
+
+        assert index.search("a", 10) == []
+        assert index.search("c", 10) == []
+        assert len(index) == 0
+
+    def test_limit_and_distinct_results(self):
+        """Test results are distinct and capped at the limit."""
+        index = PrefixIndex()
+        index.add(1, "Alpha Alpine")
+        index.add(2, "Alto")
+        index.add(3, "Always")
+
+        assert index.search("al", 10) == [1, 2, 3]
+        assert index.search("al", 2) == [1, 2]
+
+    def test_add_many_matches_add(self):
+        """Test bulk loading builds the same index as adding one by one."""
+        items = [(3, "Always"), (1, "Alpha Alpine"), (2, "Alto Corp")]
+        one_by_one = PrefixIndex()
+        for pk, label in items:
+            one_by_one.add(pk, label)
+        bulk = PrefixIndex()
+        bulk.add_many(items)
+
+        assert bulk._keys == one_by_one._keys
+        assert bulk.search("al", 10) == one_by_one.search("al", 10)
+        assert bulk.search("corp", 10) == [2]
+
+
+class TestTypeaheadRefresh:
+    """Test that concurrent stale searches trigger a single rebuild."""
+
+    def test_concurrent_first_searches_rebuild_once(self, monkeypatch):
+        """Test requests arriving during the first build wait for it instead of rebuilding."""
+        index = TypeaheadIndex("core.account", ("name",), lambda name: name)
+        calls = []
+
+        def rows(**filters):
+            calls.append(filters)
+            time.sleep(0.05)
+            return [(1, None, "Acme")]
+
+        monkeypatch.setattr(index, "_rows", rows)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(index.search("ac", 10)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert [[entry.label for entry in result] for result in results] == [["Acme"]] * 5
+
+    def test_expired_index_is_served_while_another_request_rebuilds(
+        self, settings, monkeypatch
+    ):
+        """Test a stale index keeps answering while the refresh lock is held."""
+        settings.TYPEAHEAD_REFRESH_SECONDS = 1
+        index = TypeaheadIndex("core.account", ("name",), lambda name: name)
+        monkeypatch.setattr(index, "_rows", lambda **filters: iter([(1, None, "Acme")]))
+        index.rebuild()
+        index._loaded_at -= 10
+
+        with index._refresh_lock:
+            assert [entry.label for entry in index.search("ac", 10)] == ["Acme"]
+            assert index._is_stale()
+
+        index.search("ac", 10)
+        assert not index._is_stale()
+
+
+@pytest.mark.django_db
+class TestTypeaheadIndex:
+    """Test index loading and incremental maintenance."""
+
+    def test_builds_from_database_on_first_search(self, test_user):
+        """Test the index loads live rows on first use."""
+        account = Account.objects.create(name="Acme", owner_user=test_user)
+        Account.objects.create(name="Acme Deleted", owner_user=test_user, is_invalid=True)
+
+        matches = get_typeahead_index(Account).search("ac", 10)
+
+        assert [entry.pk for entry in matches] == [account.pk]
+
+    def test_service_writes_update_index_incrementally(
+        self, test_user, django_capture_on_commit_callbacks
+    ):
+        """Test create, rename and soft delete are reflected without a rebuild."""
+        index = get_typeahead_index(Account)
+        assert index.search("x", 10) == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            account = AccountService.create_account({"name": "Initech"}, test_user)
+        assert [entry.label for entry in index.search("ini", 10)] == ["Initech"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AccountService.update_account(account, {"name": "Globex"}, test_user)
+        assert index.search("ini", 10) == []
+        assert [entry.label for entry in index.search("glo", 10)] == ["Globex"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AccountService.soft_delete_account(account, test_user)
+        assert index.search("glo", 10) == []
+
+    def test_contact_full_name_is_indexed(
+        self, test_user, account, django_capture_on_commit_callbacks
+    ):
+        """Test contacts are matched on first and last name."""
+        index = get_typeahead_index(Contact)
+        index.search("x", 10)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ContactService.create_contact(
+                {"first_name": "Jane", "last_name": "Doe", "account": account},
+                test_user,
+            )
+
+        assert [entry.label for entry in index.search("do", 10)] == ["Jane Doe"]
+
+
+@pytest.mark.django_db
+class TestTypeaheadEndpoint:
+    """Test GET /accounts/typeahead/ and /contacts/typeahead/."""
+
+    def test_non_staff_only_see_owned_rows(self, test_user, test_user_2):
+        """Test owner_user visibility is enforced."""
+        own = Account.objects.create(name="Acme Own", owner_user=test_user)
+        Account.objects.create(name="Acme Other", owner_user=test_user_2)
+        client = APIClient()
+        client.force_authenticate(user=test_user)
+
+        response = client.get("/accounts/typeahead/", {"q": "acme"})
+
+        assert response.status_code == 200
+        assert response.data == [{"id": str(own.pk), "name": "Acme Own"}]
+
+    def test_staff_see_all_rows_up_to_limit(self, test_user, test_user_2):
+        """Test staff see every owner's rows and limit caps results."""
+        staff = UserModel.objects.create_user(
+            username="staff", password="testpass123", is_staff=True
+        )
+        Account.objects.create(name="Acme One", owner_user=test_user)
+        Account.objects.create(name="Acme Two", owner_user=test_user_2)
+        client = APIClient()
+        client.force_authenticate(user=staff)
+
+        assert len(client.get("/accounts/typeahead/", {"q": "acme"}).data) == 2
+        assert len(client.get("/accounts/typeahead/", {"q": "acme", "limit": 1}).data) == 1
+
+    def test_contact_typeahead_returns_full_name(self, test_user, account):
+        """Test the contact endpoint returns ids and full names only."""
+        contact = Contact.objects.create(
+            first_name="Jane", last_name="Doe", account=account, owner_user=test_user
+        )
+        client = APIClient()
+        client.force_authenticate(user=test_user)
+
+        response = client.get("/contacts/typeahead/", {"q": "ja"})
+
+        assert response.data == [{"id": str(contact.pk), "full_name": "Jane Doe"}]
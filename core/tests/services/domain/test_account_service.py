@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from core.models import AccountStatus
+from core.models import Account, AccountStatus, StaleVersionError
 from core.services import AccountService
+from core.signals import records_changed
 
 
 @pytest.mark.django_db
@@ -90,8 +93,116 @@ class TestAccountService:
 
         assert deleted_account.is_invalid is True
 
+    def test_update_account_writes_only_changed_columns(self, test_user, account):
+        """Test update_account's UPDATE sets the changed, audit and version columns only."""
+        data = {"name": "Renamed", "status": account.status}
+
+        with CaptureQueriesContext(connection) as queries:
+            AccountService.update_account(account, data, test_user)
+
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        assigned = updates[0].split(" SET ", 1)[1].split(" WHERE ", 1)[0]
+        assert sorted(part.split(" = ")[0] for part in assigned.split(", ")) == [
+            '"name"',
+            '"updated_at"',
+            '"updated_by_id"',
+            '"version"',
+        ]
+        assert '"version" = ' in updates[0].split(" WHERE ", 1)[1]
+
+    def test_update_account_without_changes_skips_the_write(self, test_user, account):
+        """Test a no-op update issues no query, keeps updated_at and sends no signal."""
+        received = []
+        records_changed.connect(
+            lambda **kwargs: received.append(kwargs), weak=False, dispatch_uid="t"
+        )
+        updated_at = account.updated_at
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                AccountService.update_account(
+                    account, {"name": account.name}, test_user
+                )
+            AccountService.update_account(account, {"industry": "Retail"}, test_user)
+        finally:
+            records_changed.disconnect(dispatch_uid="t")
+
+        assert not [q for q in queries if q["sql"].startswith("UPDATE")]
+        assert Account.objects.get(pk=account.pk).updated_at > updated_at
+        assert [kwargs["fields"] for kwargs in received] == [["industry"]]
+
+    def test_update_account_exposes_changed_fields(self, test_user, account):
+        """Test callers can read which fields an update changed."""
+        updated = AccountService.update_account(
+            account, {"name": "Renamed", "status": account.status}, test_user
+        )
+        assert updated.changed_fields == ("name",)
+        assert updated.get_dirty_fields() == []
+
+        unchanged = AccountService.update_account(account, {"name": "Renamed"}, test_user)
+        assert unchanged.changed_fields == ()
+
     def test_soft_delete_account_sets_updated_by(self, test_user_2, account):
         """Test that soft_delete_account sets updated_by."""
         deleted_account = AccountService.soft_delete_account(account, test_user_2)
 
         assert deleted_account.updated_by == test_user_2
+
+    def test_bulk_create_accounts_inserts_in_batches(self, test_user):
+        """Test bulk_create_accounts issues one INSERT per batch."""
+        rows = [{"name": f"Bulk {index}"} for index in range(5)]
+
+        with CaptureQueriesContext(connection) as queries:
+            accounts = AccountService.bulk_create_accounts(
+                rows, test_user, batch_size=2
+            )
+
+        inserts = [
+            query for query in queries
+            if query["sql"].startswith('INSERT INTO "core_account"')
+        ]
+        assert len(inserts) == 3
+
+        assert len(accounts) == 5
+        assert {account.owner_user for account in accounts} == {test_user}
+        assert {account.created_by for account in accounts} == {test_user}
+
+    def test_bulk_update_accounts_scopes_the_update_by_owner(
+        self, test_user, test_user_2, account
+    ):
+        """Test bulk_update_accounts only touches rows visible to the user."""
+        other = Account.objects.create(name="Other", owner_user=test_user_2)
+
+        with CaptureQueriesContext(connection) as queries:
+            count = AccountService.bulk_update_accounts(
+                Account.objects.all(), {"industry": "Retail"}, test_user
+            )
+
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        assert count == 1
+        assert len(updates) == 1
+        assert '"owner_user_id"' in updates[0].split("WHERE", 1)[1]
+        account.refresh_from_db()
+        other.refresh_from_db()
+        assert (account.industry, account.updated_by) == ("Retail", test_user)
+        assert other.industry != "Retail"
+
+    def test_update_account_with_stale_version_writes_nothing(self, test_user, account):
+        """Test a concurrent write makes the loaded instance's update fail."""
+        stale = Account.objects.get(pk=account.pk)
+        AccountService.update_account(account, {"name": "First"}, test_user)
+
+        with pytest.raises(StaleVersionError):
+            AccountService.update_account(stale, {"industry": "Retail"}, test_user)
+
+        account.refresh_from_db()
+        assert (account.name, account.industry, account.version) == ("First", None, 2)
+
+    def test_bulk_update_accounts_bumps_versions(self, test_user, account):
+        """Test set-based updates invalidate versions held by other writers."""
+        AccountService.bulk_update_accounts(
+            Account.objects.all(), {"industry": "Retail"}, test_user
+        )
+
+        account.refresh_from_db()
+        assert account.version == 2
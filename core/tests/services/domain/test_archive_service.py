@@ -0,0 +1,146 @@
+"""Tests for ArchiveService archival, restore and purge."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.db import IntegrityError
+from django.utils import timezone
+
+from core.models import Account, ArchivedAccount, ArchivedContact, Contact
+from core.search import search_index
+from core.services import AccountService, ArchiveService, ContactService
+from core.services.domain.archive_service import _archive_batches
+
+
+def _age(model, pks, days):
+    """Backdate rows as if they were written ``days`` ago."""
+    model.objects.with_deleted().filter(pk__in=pks).update(
+        updated_at=timezone.now() - timedelta(days=days)
+    )
+
+
+@pytest.mark.django_db
+class TestArchiveService:
+    """Test ArchiveService keeps hot and archive tables consistent."""
+
+    def test_archives_expired_soft_deleted_rows_in_batches(self, test_user, account):
+        """Test expired rows move to the archive and recent ones stay."""
+        old = [
+            Contact.objects.create(first_name=f"Old {i}", account=account, is_invalid=True)
+            for i in range(3)
+        ]
+        recent = Contact.objects.create(first_name="Recent", account=account, is_invalid=True)
+        live = Contact.objects.create(first_name="Live", account=account)
+        _age(Contact, [contact.pk for contact in old] + [live.pk], days=100)
+
+        counts = ArchiveService.archive_deleted(batch_size=2, max_batches=1)
+        assert counts.contacts == 2
+        counts = ArchiveService.archive_deleted(batch_size=2)
+
+        assert counts.contacts == 1
+        assert set(ArchivedContact.objects.values_list("pk", flat=True)) == {
+            contact.pk for contact in old
+        }
+        assert set(Contact.objects.with_deleted().values_list("pk", flat=True)) == {
+            recent.pk,
+            live.pk,
+        }
+        assert ArchivedContact.objects.get(pk=old[0].pk).account_id == account.pk
+        assert ArchivedContact.objects.get(pk=old[0].pk).data["first_name"] == "Old 0"
+
+    def test_accounts_are_kept_while_contacts_reference_them(self, test_user, account):
+        """Test an account is archived only after all its contacts are gone."""
+        contact = Contact.objects.create(first_name="Jane", account=account, is_invalid=True)
+        recent = Contact.objects.create(first_name="John", account=account, is_invalid=True)
+        Account.objects.filter(pk=account.pk).update(is_invalid=True)
+        _age(Account, [account.pk], days=100)
+        _age(Contact, [contact.pk], days=100)
+
+        assert ArchiveService.archive_deleted() == (0, 1)
+        assert Account.objects.with_deleted().filter(pk=account.pk).exists()
+
+        _age(Contact, [recent.pk], days=100)
+        assert ArchiveService.archive_deleted() == (1, 1)
+        assert not Account.objects.with_deleted().exists()
+
+    def test_account_given_a_contact_after_selection_is_skipped(self, test_user):
+        """Test a PROTECT violation mid-batch skips that account instead of failing."""
+        free = Account.objects.create(name="Free", is_invalid=True)
+        taken = Account.objects.create(name="Taken", is_invalid=True)
+        Contact.objects.create(first_name="Late", account=taken)
+        # Selection without the contact guard, as if the contact arrived after it
+        selected = Account.objects.with_deleted().filter(is_invalid=True)
+
+        archived = _archive_batches(selected, ArchivedAccount, lambda row: {}, 10, None)
+
+        assert archived == 1
+        assert list(ArchivedAccount.objects.values_list("pk", flat=True)) == [free.pk]
+        assert Account.objects.with_deleted().filter(pk=taken.pk).exists()
+
+    def test_restore_contact_revives_soft_deleted_account(self, test_user, account):
+        """Test a contact is not restored under an account that is still hidden."""
+        contact = Contact.objects.create(first_name="Jane", account=account, is_invalid=True)
+        _age(Contact, [contact.pk], days=100)
+        ArchiveService.archive_deleted()
+        AccountService.soft_delete_account(account, test_user)
+
+        ArchiveService.restore_contacts([contact.pk])
+
+        revived = Account.objects.get(pk=account.pk)
+        assert revived.is_invalid is False
+        assert revived.version == account.version + 1
+        assert Contact.objects.get(pk=contact.pk).account_id == account.pk
+
+    def test_restore_contact_restores_its_account_first(self, test_user, account):
+        """Test restored rows come back live, with their original values."""
+        contact = ContactService.create_contact(
+            {"first_name": "Jane", "email": "jane@example.com", "account": account},
+            test_user,
+        )
+        created_at = contact.created_at
+        ContactService.soft_delete_contact(contact, test_user)
+        AccountService.soft_delete_account(account, test_user)
+        _age(Account, [account.pk], days=100)
+        _age(Contact, [contact.pk], days=100)
+        ArchiveService.archive_deleted()
+
+        restored = ArchiveService.restore_contacts([contact.pk])
+
+        assert [row.pk for row in restored] == [contact.pk]
+        assert not ArchivedContact.objects.exists()
+        assert not ArchivedAccount.objects.exists()
+        restored_contact = Contact.objects.get(pk=contact.pk)
+        assert restored_contact.email == "jane@example.com"
+        assert restored_contact.created_at == created_at
+        assert restored_contact.owner_user == test_user
+        assert restored_contact.version == contact.version + 1
+        assert Account.objects.get(pk=account.pk).account_number == "ACC-001"
+        assert search_index.search(Contact, ["jane"], using="default") == [contact.pk]
+
+    def test_restore_conflicting_account_number_rolls_back(self, account):
+        """Test a restore that would break a unique constraint writes nothing."""
+        Account.objects.filter(pk=account.pk).update(is_invalid=True)
+        _age(Account, [account.pk], days=100)
+        ArchiveService.archive_deleted()
+        Account.objects.create(name="Reuse", account_number="ACC-001")
+
+        with pytest.raises(IntegrityError):
+            ArchiveService.restore_accounts([account.pk])
+
+        assert ArchivedAccount.objects.filter(pk=account.pk).exists()
+
+    def test_purge_keeps_accounts_needed_by_archived_contacts(self, account):
+        """Test purging never strands an archived contact without its account."""
+        contact = Contact.objects.create(first_name="Jane", account=account, is_invalid=True)
+        Account.objects.filter(pk=account.pk).update(is_invalid=True)
+        _age(Account, [account.pk], days=100)
+        _age(Contact, [contact.pk], days=100)
+        ArchiveService.archive_deleted()
+        ArchivedAccount.objects.update(archived_at=timezone.now() - timedelta(days=800))
+
+        assert ArchiveService.purge_archive() == (0, 0)
+
+        ArchivedContact.objects.update(archived_at=timezone.now() - timedelta(days=800))
+        assert ArchiveService.purge_archive(batch_size=1) == (1, 1)
+        assert not ArchivedAccount.objects.exists()
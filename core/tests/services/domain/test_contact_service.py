@@ -36,6 +36,7 @@ class TestContactService:
 
         assert updated_contact.first_name == "Janet"
         assert updated_contact.updated_by == test_user_2
+        assert updated_contact.changed_fields == ("first_name",)
 
     def test_update_contact_prevents_modification_of_immutable_fields(
         self, test_user, account
@@ -84,3 +85,17 @@ class TestContactService:
         deleted_contact = ContactService.soft_delete_contact(contact, test_user_2)
 
         assert deleted_contact.updated_by == test_user_2
+
+    def test_bulk_create_contacts_sets_owner_and_created_by(self, test_user, account):
+        """Test that bulk_create_contacts creates every row with audit fields."""
+        rows = [
+            {"first_name": f"Contact {index}", "account_id": account.id}
+            for index in range(3)
+        ]
+
+        contacts = ContactService.bulk_create_contacts(rows, test_user, batch_size=2)
+
+        assert len(contacts) == 3
+        assert account.contacts.count() == 3
+        assert {contact.owner_user for contact in contacts} == {test_user}
+        assert {contact.created_by for contact in contacts} == {test_user}
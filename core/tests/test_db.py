@@ -0,0 +1,44 @@
+"""Tests for per-connection SQLite setup."""
+import pytest
+from django.db import connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+
+@pytest.fixture
+def file_connection(tmp_path):
+    """A separate connection to an on-disk SQLite database."""
+    settings_dict = {
+        **connections["default"].settings_dict,
+        "NAME": str(tmp_path / "db.sqlite3"),
+    }
+    wrapper = DatabaseWrapper(settings_dict, alias="pragma_test")
+    yield wrapper
+    wrapper.close()
+
+
+def _pragma(wrapper, name):
+    with wrapper.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+class TestSqlitePragmas:
+    """Tests for the connection_created hook applying SQLITE_PRAGMAS."""
+
+    def test_production_pragmas_are_applied_to_new_connections(
+        self, settings, file_connection
+    ):
+        """Test SQLITE_PRAGMAS runs on every new connection."""
+        settings.SQLITE_PRAGMAS = settings.SQLITE_PRODUCTION_PRAGMAS
+
+        assert _pragma(file_connection, "journal_mode") == "wal"
+        assert _pragma(file_connection, "synchronous") == 1  # NORMAL
+        assert _pragma(file_connection, "busy_timeout") == 5000
+        assert _pragma(file_connection, "cache_size") == -65536
+
+    def test_no_pragmas_by_default(self, settings, file_connection):
+        """Test the development profile leaves SQLite's defaults alone."""
+        settings.SQLITE_PRAGMAS = {}
+
+        assert _pragma(file_connection, "journal_mode") == "delete"
@@ -3,10 +3,11 @@
 import logging
 import time
 
-from django.test import TestCase, RequestFactory
+from django.contrib.auth import get_user_model
+from django.test import TestCase, RequestFactory, override_settings
 from django.http import HttpResponse
 
-from core.middleware import RequestTimingMiddleware
+from core.middleware import RequestTimingMiddleware, fingerprint_sql
 
 
 class RequestTimingMiddlewareTests(TestCase):
@@ -175,3 +176,70 @@ class RequestTimingMiddlewareTests(TestCase):
 
         response = middleware(request)
         self.assertEqual(response.status_code, 200)
+
+
+class RequestQueryStatsTests(TestCase):
+    """Test RequestTimingMiddleware with REQUEST_QUERY_STATS enabled."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = RequestFactory()
+
+    def get_response(self, request):
+        """Run the same query twice plus one distinct query."""
+        user_model = get_user_model()
+        user_model.objects.filter(username="a").exists()
+        user_model.objects.filter(username="b").exists()
+        user_model.objects.count()
+        return HttpResponse(status=200)
+
+    @override_settings(REQUEST_QUERY_STATS=True)
+    def test_headers_report_query_count_and_time(self):
+        """Test X-DB-* headers expose the request's query statistics."""
+        middleware = RequestTimingMiddleware(self.get_response)
+        request = self.factory.get("/api/accounts")
+
+        with self.assertLogs("core.middleware", level=logging.INFO):
+            response = middleware(request)
+
+        self.assertEqual(response["X-DB-Query-Count"], "3")
+        self.assertGreaterEqual(float(response["X-DB-Time-Ms"]), 0)
+        self.assertIn("X-DB-Slowest-Ms", response)
+        self.assertIn("X-DB-Slowest-Fingerprint", response)
+
+    @override_settings(REQUEST_QUERY_STATS=True)
+    def test_duplicate_queries_are_fingerprinted(self):
+        """Test repeated statements are reported as possible N+1."""
+        middleware = RequestTimingMiddleware(self.get_response)
+        request = self.factory.get("/api/accounts")
+
+        with self.assertLogs("core.middleware", level=logging.INFO) as cm:
+            response = middleware(request)
+
+        self.assertRegex(response["X-DB-Duplicate-Queries"], r"^[0-9a-f]{8}=2$")
+        self.assertIn("Queries: 3", cm.output[0])
+        self.assertIn("Duplicates: 2", cm.output[0])
+        self.assertIn("possible N+1", cm.output[1])
+
+    @override_settings(REQUEST_QUERY_STATS=False)
+    def test_disabled_adds_no_headers(self):
+        """Test nothing is recorded when the setting is off."""
+        middleware = RequestTimingMiddleware(self.get_response)
+        request = self.factory.get("/api/accounts")
+
+        with self.assertLogs("core.middleware", level=logging.INFO) as cm:
+            response = middleware(request)
+
+        self.assertNotIn("X-DB-Query-Count", response)
+        self.assertFalse(hasattr(request, "query_stats"))
+        self.assertNotIn("Queries:", cm.output[0])
+
+    def test_fingerprint_ignores_in_list_length_and_whitespace(self):
+        """Test fingerprints group statements that differ only in IN-list size."""
+        self.assertEqual(
+            fingerprint_sql("SELECT * FROM t WHERE id IN (%s, %s)"),
+            fingerprint_sql("SELECT *  FROM t\nWHERE id IN (%s, %s, %s)"),
+        )
+        self.assertNotEqual(
+            fingerprint_sql("SELECT * FROM t"), fingerprint_sql("SELECT * FROM u")
+        )
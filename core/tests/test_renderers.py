@@ -0,0 +1,101 @@
+"""Tests for the orjson and MessagePack renderers and parsers."""
+
+import io
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.api.serializers import AccountSerializer
+from core.models import Account
+from core.parsers import MessagePackParser, ORJSONParser
+from core.renderers import MessagePackRenderer, ORJSONRenderer
+
+pytest.importorskip("orjson")
+msgpack = pytest.importorskip("msgpack")
+
+PAYLOAD = {
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "annual_revenue": Decimal("1234.50"),
+    "created_at": datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    "name": "Acme\u2028Ltd",
+    "tags": ["a", None, True, 1.5],
+}
+
+
+class TestORJSON:
+    """Tests for ORJSONRenderer / ORJSONParser."""
+
+    def test_output_matches_json_renderer(self):
+        """Test UUID, Decimal, datetime and U+2028 encode like JSONRenderer."""
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_indent_falls_back_to_json_renderer(self):
+        """Test pretty-printing requests are still honoured."""
+        media_type = "application/json; indent=4"
+        assert ORJSONRenderer().render(PAYLOAD, media_type) == JSONRenderer().render(
+            PAYLOAD, media_type
+        )
+
+    def test_parser_matches_json_parser(self):
+        """Test parsing yields the same data as JSONParser."""
+        body = JSONRenderer().render(PAYLOAD)
+        assert ORJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(
+            io.BytesIO(body)
+        )
+
+
+class TestMessagePack:
+    """Tests for MessagePackRenderer / MessagePackParser."""
+
+    def test_round_trip(self):
+        """Test values survive a render/parse round trip."""
+        data = MessagePackParser().parse(io.BytesIO(MessagePackRenderer().render(PAYLOAD)))
+
+        assert data["id"] == str(PAYLOAD["id"])
+        assert data["annual_revenue"] == "1234.50"
+        assert data["created_at"] == PAYLOAD["created_at"]
+        assert data["tags"] == PAYLOAD["tags"]
+
+
+@pytest.mark.django_db
+class TestContentNegotiation:
+    """Tests for selecting the format through Accept / Content-Type."""
+
+    def setup_method(self):
+        """Set up an authenticated staff client."""
+        self.client = APIClient()
+        user = get_user_model().objects.create_user(username="renderer", is_staff=True)
+        self.client.force_authenticate(user=user)
+
+    def test_msgpack_response_matches_json(self):
+        """Test Accept: application/msgpack returns the same data."""
+        account = Account.objects.create(name="Acme", annual_revenue=Decimal("10"))
+        path = f"/accounts/{account.id}/"
+
+        response = self.client.get(path, HTTP_ACCEPT="application/msgpack")
+
+        assert response["Content-Type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content) == self.client.get(path).json()
+
+    def test_msgpack_request_body(self):
+        """Test Content-Type: application/msgpack bodies are parsed."""
+        body = msgpack.packb({"name": "Packed", "annual_revenue": "5.00"})
+
+        response = self.client.post(
+            "/accounts/", body, content_type="application/msgpack"
+        )
+
+        assert response.status_code == 201
+        assert Account.objects.get(name="Packed").annual_revenue == Decimal("5.00")
+
+    def test_json_page_is_byte_identical(self):
+        """Test list pages render the same bytes as the stdlib renderer."""
+        Account.objects.create(name="Acme", annual_revenue=Decimal("10"))
+        data = AccountSerializer(Account.objects.all(), many=True).data
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
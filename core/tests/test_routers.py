@@ -0,0 +1,71 @@
+"""Tests for the primary/replica database router."""
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from core.models import Account
+from core.routers import PrimaryReplicaRouter, reset_primary_until, set_primary_until, use_primary
+
+
+@pytest.fixture
+def router(settings):
+    """A router with one replica configured and no stickiness in effect."""
+    settings.DATABASE_REPLICAS = ["replica"]
+    settings.REPLICA_STICKY_SECONDS = 5
+    token = set_primary_until(0.0)
+    yield PrimaryReplicaRouter()
+    reset_primary_until(token)
+
+
+class TestPrimaryReplicaRouter:
+    """Tests for PrimaryReplicaRouter."""
+
+    def test_no_replicas_leaves_routing_to_django(self, router, settings):
+        """Test reads are not routed when DATABASE_REPLICAS is empty."""
+        settings.DATABASE_REPLICAS = []
+
+        assert router.db_for_read(Account) is None
+
+    def test_core_reads_go_to_replica(self, router):
+        """Test reads of CRM models use a replica."""
+        assert router.db_for_read(Account) == "replica"
+
+    def test_other_apps_read_from_primary(self, router):
+        """Test auth and session reads are never sent to a replica."""
+        assert router.db_for_read(get_user_model()) is None
+
+    def test_writes_go_to_primary(self, router):
+        """Test writes always use the primary."""
+        assert router.db_for_write(Account) == "default"
+
+    def test_reads_stick_to_primary_after_write(self, router, monkeypatch):
+        """Test reads use the primary for REPLICA_STICKY_SECONDS after a write."""
+        now = time.time()
+        monkeypatch.setattr("core.routers.time.time", lambda: now)
+        router.db_for_write(Account)
+
+        monkeypatch.setattr("core.routers.time.time", lambda: now + 4)
+        assert router.db_for_read(Account) == "default"
+
+        monkeypatch.setattr("core.routers.time.time", lambda: now + 6)
+        assert router.db_for_read(Account) == "replica"
+
+    def test_writes_to_other_apps_do_not_stick(self, router):
+        """Test e.g. session or last_login writes keep CRM reads on the replica."""
+        router.db_for_write(get_user_model())
+
+        assert router.db_for_read(Account) == "replica"
+
+    def test_use_primary_forces_primary_reads(self, router):
+        """Test reads inside use_primary() use the primary."""
+        with use_primary():
+            assert router.db_for_read(Account) == "default"
+        assert router.db_for_read(Account) == "replica"
+
+    @pytest.mark.django_db
+    def test_reads_in_transaction_use_primary(self, router):
+        """Test reads inside an atomic block on the primary use the primary."""
+        with transaction.atomic():
+            assert router.db_for_read(Account) == "default"
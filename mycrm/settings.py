@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -45,6 +47,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.ReadYourWritesMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -81,6 +84,46 @@ DATABASES = {
     }
 }
 
+# SQLite pragmas for the production profile, applied to each new connection
+# by core.receivers.configure_sqlite_connection. WAL lets readers run
+# alongside the single writer; synchronous=NORMAL only fsyncs at
+# checkpoints, which is durable across application crashes in WAL mode.
+SQLITE_PRODUCTION_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # ms to wait for the write lock before failing
+    "cache_size": -65536,  # negative means KiB: 64 MiB page cache per connection
+    "mmap_size": 268435456,  # read up to 256 MiB through the OS page cache
+    "temp_store": "MEMORY",
+}
+
+# MYCRM_DB_PROFILE=production turns on the tuned pragmas, persistent
+# connections and BEGIN IMMEDIATE transactions (so a writer waits for the
+# lock up front instead of failing when a read transaction upgrades)
+DB_PROFILE = os.environ.get("MYCRM_DB_PROFILE", "development")
+SQLITE_PRAGMAS = {}
+if DB_PROFILE == "production":
+    SQLITE_PRAGMAS = SQLITE_PRODUCTION_PRAGMAS
+    DATABASES["default"].update(
+        CONN_MAX_AGE=600,
+        CONN_HEALTH_CHECKS=True,
+        OPTIONS={"transaction_mode": "IMMEDIATE"},
+    )
+
+# Read replica. Locally a second SQLite file stands in for it; refresh it from
+# the primary with: sqlite3 db.sqlite3 ".backup db.replica.sqlite3"
+DATABASES["replica"] = {
+    **DATABASES["default"],
+    "NAME": os.environ.get("MYCRM_REPLICA_DB", BASE_DIR / "db.replica.sqlite3"),
+}
+
+# MYCRM_READ_REPLICA=1 sends reads of core models to DATABASE_REPLICAS
+# (see core.routers). A client that wrote reads from the primary for the
+# next REPLICA_STICKY_SECONDS so it sees its own changes despite replica lag.
+DATABASE_ROUTERS = ["core.routers.PrimaryReplicaRouter"]
+DATABASE_REPLICAS = ["replica"] if os.environ.get("MYCRM_READ_REPLICA") == "1" else []
+REPLICA_STICKY_SECONDS = 5
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -117,7 +160,70 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "rest_framework.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
+
+# Faster encoders replace the stdlib-json classes when installed, and
+# MessagePack is offered to clients that send/accept application/msgpack
+if find_spec("orjson"):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"][0] = "core.renderers.ORJSONRenderer"
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"][0] = "core.parsers.ORJSONParser"
+if find_spec("msgpack"):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].insert(
+        1, "core.renderers.MessagePackRenderer"
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].insert(
+        1, "core.parsers.MessagePackParser"
+    )
+
+# Upper bound on ranked pks returned by search_index.search(); the list
+# endpoints join the index into their queryset instead and are not capped
+SEARCH_MAX_RESULTS = 1000
+
+# Typeahead indexes live in each worker process; rebuild them from the
+# database at most this often so other workers' writes become visible
+TYPEAHEAD_REFRESH_SECONDS = 300
+
+# Bulk endpoints: maximum rows per request and rows per INSERT statement
+BULK_CREATE_MAX_ROWS = 5000
+BULK_CREATE_BATCH_SIZE = 500
+
+# Bulk updates: maximum rows selected per request (by ids or by filter) and
+# rows per UPDATE statement (the ids are bound as parameters, so keep the
+# batch below SQLite's limit)
+BULK_UPDATE_MAX_IDS = 5000
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Streaming imports: rows validated and inserted per chunk, and the maximum
+# number of row errors returned in the response
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_ERRORS = 1000
+
+# Archival (manage.py archive_records): soft-deleted rows older than the
+# retention window move to the archive tables in batches, and archived rows
+# are purged after the purge window
+ARCHIVE_RETENTION_DAYS = 90
+ARCHIVE_PURGE_DAYS = 730
+ARCHIVE_BATCH_SIZE = 500
+
+# Rows fetched per round trip by the streaming export endpoints
+EXPORT_CHUNK_SIZE = 2000
+
+# List response cache, off unless MYCRM_LIST_CACHE_TIMEOUT is set. The alias
+# names an entry in CACHES, which must be shared by every worker (e.g. Redis):
+# the default local-memory cache would keep serving pages another worker has
+# invalidated, so the core.W001 check warns about it. 0 disables the cache.
+LIST_CACHE_ALIAS = "default"
+LIST_CACHE_TIMEOUT = int(os.environ.get("MYCRM_LIST_CACHE_TIMEOUT", "0"))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "MyCRM API",
     "DESCRIPTION": "API for MyCRM",
@@ -126,6 +232,11 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
+# Record per-request query count, DB time, slowest statement and duplicate
+# queries in RequestTimingMiddleware (log line + X-DB-* headers). Off in
+# production: the middleware then installs no execute wrapper at all.
+REQUEST_QUERY_STATS = DEBUG
+
 # Logging configuration to show INFO logs for core.middleware
 LOGGING = {
     "version": 1,